@@ -0,0 +1,177 @@
+# coding=utf-8
+"""
+API 依赖层
+
+FastAPI 的同步接口运行在线程池中，原先每个请求都会：
+- 通过 load_config() 重新解析 config.yaml、读取 ai_config.json
+- 经 LocalStorageBackend._get_connection 拿到一个跨线程共享的连接，并检查表结构
+
+这里提供按请求注入（Depends）的依赖：
+- FileCache：按文件修改时间缓存解析结果，文件变化后下次请求自动重新加载
+- ReadConnectionPool：每个线程为每个日期数据库保留一个读连接
+- 表结构检查只在启动时对已有数据库执行一次，之后新出现的数据库在首次打开时检查一次
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from trendradar.storage.migrations import ensure_schema
+from trendradar.storage.sqlite_profile import connect_sqlite, resolve_sqlite_profile
+
+
+class FileCache:
+    """按修改时间缓存的文件解析结果（线程安全）"""
+
+    def __init__(self, path: str, parse: Callable[[str], Any]):
+        """
+        初始化文件缓存
+
+        Args:
+            path: 文件路径
+            parse: 解析函数，接收文件路径，返回解析结果
+        """
+        self.path = path
+        self.parse = parse
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._value: Any = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self) -> Any:
+        """
+        获取解析结果，文件修改时间或大小变化时重新解析
+
+        Returns:
+            解析结果；文件不存在时抛出 FileNotFoundError
+
+        Raises:
+            FileNotFoundError: 文件不存在
+        """
+        stamp = self._file_stamp()
+        if stamp is None:
+            with self._lock:
+                self._stamp, self._value = None, None
+            raise FileNotFoundError(f"配置文件 {self.path} 不存在")
+
+        with self._lock:
+            if stamp != self._stamp:
+                self._value = self.parse(self.path)
+                self._stamp = stamp
+            return self._value
+
+    def invalidate(self) -> None:
+        """丢弃缓存（本进程写入文件后调用，避免同一秒内修改时间不变）"""
+        with self._lock:
+            self._stamp, self._value = None, None
+
+
+class ReadConnectionPool:
+    """
+    每日数据库的按线程读连接池
+
+    sqlite3 连接默认不能跨线程使用，每个工作线程为每个数据库文件保留一个连接；
+    文件被删除或替换（inode 变化）后重新打开。
+    """
+
+    def __init__(self, data_dir: str, sqlite_profile: Optional[Dict] = None):
+        """
+        初始化连接池
+
+        Args:
+            data_dir: 数据目录（output/{type}/{date}.db）
+            sqlite_profile: SQLite 连接配置
+        """
+        self.data_dir = Path(data_dir)
+        self.sqlite_profile = resolve_sqlite_profile(sqlite_profile)
+        self._local = threading.local()
+        self._checked: Set[str] = set()
+        self._checked_lock = threading.Lock()
+
+    def db_path(self, date: str, db_type: str) -> Path:
+        return self.data_dir / db_type / f"{date}.db"
+
+    def ensure_all_schemas(self) -> int:
+        """
+        对数据目录中已有的数据库执行一次结构检查（服务启动时调用）
+
+        Returns:
+            检查的数据库数量
+        """
+        count = 0
+        for db_type in ("news", "rss"):
+            type_dir = self.data_dir / db_type
+            if not type_dir.is_dir():
+                continue
+            for db_file in sorted(type_dir.glob("*.db")):
+                try:
+                    self._ensure_schema_once(db_file, db_type)
+                    count += 1
+                except sqlite3.Error as e:
+                    print(f"[API] 数据库结构检查失败 ({db_file}): {e}")
+        return count
+
+    def _ensure_schema_once(self, db_path: Path, db_type: str) -> None:
+        """每个数据库文件在进程内只检查一次结构"""
+        key = str(db_path)
+        with self._checked_lock:
+            if key in self._checked:
+                return
+            conn = connect_sqlite(db_path, self.sqlite_profile)
+            try:
+                ensure_schema(conn, db_type)
+            finally:
+                conn.close()
+            self._checked.add(key)
+
+    def get(self, date: str, db_type: str = "rss") -> Optional[sqlite3.Connection]:
+        """
+        获取当前线程的读连接
+
+        Args:
+            date: 日期（YYYY-MM-DD）
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            数据库连接；当天数据库不存在时返回 None（读接口不创建空库）
+        """
+        db_path = self.db_path(date, db_type)
+        try:
+            inode = db_path.stat().st_ino
+        except FileNotFoundError:
+            self._drop(str(db_path))
+            return None
+
+        connections = self._connections()
+        entry = connections.get(str(db_path))
+        if entry is not None and entry[1] == inode:
+            return entry[0]
+
+        self._drop(str(db_path))
+        self._ensure_schema_once(db_path, db_type)
+        conn = connect_sqlite(db_path, self.sqlite_profile)
+        connections[str(db_path)] = (conn, inode)
+        return conn
+
+    def _connections(self) -> Dict[str, Tuple[sqlite3.Connection, int]]:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        return connections
+
+    def _drop(self, key: str) -> None:
+        """关闭当前线程中指定文件的连接"""
+        entry = self._connections().pop(key, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except sqlite3.Error:
+                pass
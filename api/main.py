@@ -10,6 +10,7 @@ TrendRadar REST API Server
 - 内容过滤配置 API
 - AI 配置管理 API
 - 立即抓取 API
+- 跨日期趋势 API（最近 N 天主题、平台走势、标题生命周期）
 """
 
 import os
@@ -18,12 +19,13 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Body, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Body, BackgroundTasks, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 # TrendRadar 模块导入
 from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.multiday import MAX_QUERY_DAYS, MultiDayQuery
 from trendradar.utils.time import format_date_folder
 from trendradar.core.loader import load_config
 from trendradar.sources.manager import SourceManager
@@ -37,6 +39,17 @@ from trendradar.trendradar import TrendRadar
 import sys
 sys.path.append(os.path.dirname(__file__))
 from errors import get_error_tracker
+from deps import FileCache, ReadConnectionPool
+from queries import (
+    THEME_ARTICLES_SQL,
+    THEME_DELETE_SQL,
+    THEME_DETAIL_SQL,
+    THEME_LOOKUP_SQL,
+    THEME_MARK_READ_SQL,
+    THEME_SET_STATUS_SQL,
+    THEME_UNLINK_ITEMS_SQL,
+    build_theme_list_query,
+)
 
 # --- Pydantic 模型定义 ---
 
@@ -115,9 +128,13 @@ app.add_middleware(
 # --- 全局实例 ---
 
 _storage_backend: Optional[LocalStorageBackend] = None
+_multiday_query: Optional[MultiDayQuery] = None
 _source_manager: Optional[SourceManager] = None
 _content_filter: Optional[ContentFilter] = None
 _trendradar_instance: Optional[TrendRadar] = None
+_config_cache: Optional[FileCache] = None
+_ai_config_cache: Optional[FileCache] = None
+_read_pool: Optional[ReadConnectionPool] = None
 
 # 抓取状态跟踪
 _last_fetch_status = {
@@ -127,17 +144,65 @@ _last_fetch_status = {
 }
 
 
+def get_config() -> Dict[str, Any]:
+    """获取解析后的 config.yaml（按文件修改时间缓存，文件变化后自动重新加载）"""
+    global _config_cache
+    if _config_cache is None:
+        config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+        _config_cache = FileCache(config_path, load_config)
+    return _config_cache.get()
+
+
+def get_ai_config_cache() -> FileCache:
+    """获取 ai_config.json 的文件缓存"""
+    global _ai_config_cache
+    if _ai_config_cache is None:
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        config_path = os.path.join(project_root, "config", "ai_config.json")
+
+        def parse(path: str) -> Dict[str, Any]:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        _ai_config_cache = FileCache(config_path, parse)
+    return _ai_config_cache
+
+
 def get_storage() -> LocalStorageBackend:
     """获取本地存储后端的单例实例"""
     global _storage_backend
     if _storage_backend is None:
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         output_dir = os.path.join(project_root, "output")
-        _storage_backend = LocalStorageBackend(data_dir=output_dir)
+        # 与爬虫使用相同的 SQLite 连接配置（WAL），读取时不会被抓取写入阻塞
+        try:
+            sqlite_profile = get_config().get("STORAGE", {}).get("SQLITE")
+        except Exception as e:
+            print(f"读取 SQLite 连接配置失败，使用默认配置: {e}")
+            sqlite_profile = None
+        _storage_backend = LocalStorageBackend(data_dir=output_dir, sqlite_profile=sqlite_profile)
         print(f"LocalStorageBackend initialized with data_dir: {output_dir}")
     return _storage_backend
 
 
+def get_read_pool() -> ReadConnectionPool:
+    """获取每日数据库的按线程读连接池（与存储后端使用相同的数据目录和连接配置）"""
+    global _read_pool
+    if _read_pool is None:
+        storage = get_storage()
+        _read_pool = ReadConnectionPool(data_dir=str(storage.data_dir), sqlite_profile=storage.sqlite_profile)
+    return _read_pool
+
+
+def get_multiday_query() -> MultiDayQuery:
+    """获取跨日期查询门面（与存储后端使用相同的数据目录和时区）"""
+    global _multiday_query
+    if _multiday_query is None:
+        storage = get_storage()
+        _multiday_query = MultiDayQuery(data_dir=str(storage.data_dir), timezone=storage.timezone)
+    return _multiday_query
+
+
 def get_source_manager() -> SourceManager:
     """获取数据源管理器的单例实例"""
     global _source_manager
@@ -168,6 +233,13 @@ def get_trendradar() -> TrendRadar:
     return _trendradar_instance
 
 
+@app.on_event("startup")
+def check_database_schemas():
+    """启动时对已有的每日数据库执行一次结构检查，请求处理中不再重复检查"""
+    checked = get_read_pool().ensure_all_schemas()
+    print(f"[API] 已检查 {checked} 个数据库的表结构")
+
+
 # ========================================
 # 状态检查 API
 # ========================================
@@ -197,7 +269,13 @@ def health_check():
 # ========================================
 
 @app.get("/api/themes", tags=["Themes"], response_model=Dict[str, Any])
-def get_themes(date: Optional[str] = None, status: Optional[str] = None, group_id: Optional[str] = None):
+def get_themes(
+    date: Optional[str] = None,
+    status: Optional[str] = None,
+    group_id: Optional[str] = None,
+    config: Dict[str, Any] = Depends(get_config),
+    pool: ReadConnectionPool = Depends(get_read_pool),
+):
     """
     获取指定日期的所有分析主题列表
 
@@ -205,84 +283,22 @@ def get_themes(date: Optional[str] = None, status: Optional[str] = None, group_i
     - **status**: 过滤状态 (unread, read, archived)，默认返回所有
     - **group_id**: 过滤分组ID，默认返回所有分组
     """
-    storage = get_storage()
-    config = load_config()
-    target_date = format_date_folder(date, storage.timezone)
+    target_date = format_date_folder(date, get_storage().timezone)
     new_theme_age_days = config.get("frontend", {}).get("new_theme_age_days", 1)
 
     try:
-        conn = storage._get_connection(target_date, db_type="rss")
+        conn = pool.get(target_date, db_type="rss")
+        if conn is None:
+            return {
+                "themes": [],
+                "new_theme_age_days": new_theme_age_days,
+                "date": target_date,
+                "group_id": group_id
+            }
         cursor = conn.cursor()
 
-        # 检查表结构，确保有 status 字段
-        cursor.execute("PRAGMA table_info(analysis_themes)")
-        columns = {row["name"] for row in cursor.fetchall()}
-
-        # 如果没有 status 字段，添加它
-        if "status" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN status TEXT DEFAULT 'unread'")
-            conn.commit()
-            columns.add("status")
-
-        if "read_at" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN read_at TIMESTAMP")
-            conn.commit()
-            columns.add("read_at")
-
-        # 添加重复标记字段
-        if "is_duplicate" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN is_duplicate INTEGER DEFAULT 0")
-            conn.commit()
-            columns.add("is_duplicate")
-
-        if "duplicate_similarity" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN duplicate_similarity REAL")
-            conn.commit()
-            columns.add("duplicate_similarity")
-
-        # 添加分组字段
-        if "group_id" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN group_id TEXT")
-            conn.commit()
-            columns.add("group_id")
-
-        if "group_name" not in columns:
-            cursor.execute("ALTER TABLE analysis_themes ADD COLUMN group_name TEXT")
-            conn.commit()
-            columns.add("group_name")
-
-        select_cols = ["id", "title", "summary", "category", "importance", "impact", "created_at", "status"]
-        if "tags" in columns:
-            select_cols.append("tags")
-        if "read_at" in columns:
-            select_cols.append("read_at")
-        if "is_duplicate" in columns:
-            select_cols.append("is_duplicate")
-        if "duplicate_similarity" in columns:
-            select_cols.append("duplicate_similarity")
-        if "group_id" in columns:
-            select_cols.append("group_id")
-        if "group_name" in columns:
-            select_cols.append("group_name")
-
         # 构建查询
-        query = f"SELECT {', '.join(select_cols)} FROM analysis_themes"
-        params = []
-
-        conditions = []
-        if status:
-            conditions.append("status = ?")
-            params.append(status)
-
-        if group_id:
-            conditions.append("group_id = ?")
-            params.append(group_id)
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        query += " ORDER BY importance DESC, created_at DESC"
-
+        query, params = build_theme_list_query(status, group_id)
         cursor.execute(query, params)
         themes = cursor.fetchall()
 
@@ -304,22 +320,27 @@ def get_themes(date: Optional[str] = None, status: Optional[str] = None, group_i
 
 
 @app.get("/api/themes/{theme_id}", tags=["Themes"], response_model=Dict[str, Any])
-def get_theme_details(theme_id: int, date: Optional[str] = None):
+def get_theme_details(
+    theme_id: int,
+    date: Optional[str] = None,
+    pool: ReadConnectionPool = Depends(get_read_pool),
+):
     """
     获取单个分析主题的详细信息，包括其关联的所有文章
     
     - **theme_id**: 要查询的主题ID
     - **date**: 主题所在的日期 (YYYY-MM-DD)，默认为今天
     """
-    storage = get_storage()
-    target_date = format_date_folder(date, storage.timezone)
+    target_date = format_date_folder(date, get_storage().timezone)
 
     try:
-        conn = storage._get_connection(target_date, db_type="rss")
+        conn = pool.get(target_date, db_type="rss")
+        if conn is None:
+            raise HTTPException(status_code=404, detail="Theme not found")
         cursor = conn.cursor()
 
         # 获取主题详情
-        cursor.execute("SELECT * FROM analysis_themes WHERE id = ?", (theme_id,))
+        cursor.execute(THEME_DETAIL_SQL, (theme_id,))
         theme = cursor.fetchone()
         if not theme:
             raise HTTPException(status_code=404, detail="Theme not found")
@@ -327,16 +348,7 @@ def get_theme_details(theme_id: int, date: Optional[str] = None):
         theme_details = dict(theme)
 
         # 获取关联的文章，包含来源信息
-        cursor.execute("""
-            SELECT 
-                ri.id, ri.title, ri.url, ri.published_at, ri.feed_id, 
-                ri.summary, ri.author,
-                rf.name as source_name
-            FROM rss_items ri
-            LEFT JOIN rss_feeds rf ON ri.feed_id = rf.id
-            WHERE ri.theme_id = ?
-            ORDER BY ri.published_at DESC
-        """, (theme_id,))
+        cursor.execute(THEME_ARTICLES_SQL, (theme_id,))
         
         articles = cursor.fetchall()
         theme_details["articles"] = [dict(row) for row in articles]
@@ -370,7 +382,7 @@ def update_theme_status(theme_id: int, update: ThemeStatusUpdate, date: Optional
         cursor = conn.cursor()
 
         # 检查主题是否存在，并获取主题详情
-        cursor.execute("SELECT id, title, summary, category, tags, status FROM analysis_themes WHERE id = ?", (theme_id,))
+        cursor.execute(THEME_LOOKUP_SQL, (theme_id,))
         theme_row = cursor.fetchone()
         if not theme_row:
             raise HTTPException(status_code=404, detail="Theme not found")
@@ -382,15 +394,9 @@ def update_theme_status(theme_id: int, update: ThemeStatusUpdate, date: Optional
         # 更新状态
         now = datetime.now().isoformat()
         if update.status == "read":
-            cursor.execute(
-                "UPDATE analysis_themes SET status = ?, read_at = ? WHERE id = ?",
-                (update.status, now, theme_id)
-            )
+            cursor.execute(THEME_MARK_READ_SQL, (update.status, now, theme_id))
         else:
-            cursor.execute(
-                "UPDATE analysis_themes SET status = ? WHERE id = ?",
-                (update.status, theme_id)
-            )
+            cursor.execute(THEME_SET_STATUS_SQL, (update.status, theme_id))
 
         # 如果状态变为 archived，记录到已处理历史（用于去重）
         if update.status == "archived" and old_status != "archived":
@@ -437,7 +443,7 @@ def delete_theme(theme_id: int, date: Optional[str] = None):
         cursor = conn.cursor()
 
         # 检查主题是否存在，并获取主题详情
-        cursor.execute("SELECT id, title, summary, category, tags FROM analysis_themes WHERE id = ?", (theme_id,))
+        cursor.execute(THEME_LOOKUP_SQL, (theme_id,))
         theme_row = cursor.fetchone()
         if not theme_row:
             raise HTTPException(status_code=404, detail="Theme not found")
@@ -463,10 +469,10 @@ def delete_theme(theme_id: int, date: Optional[str] = None):
             traceback.print_exc()
 
         # 删除主题
-        cursor.execute("DELETE FROM analysis_themes WHERE id = ?", (theme_id,))
+        cursor.execute(THEME_DELETE_SQL, (theme_id,))
 
         # 同时更新关联的 rss_items，将其 theme_id 设为 NULL
-        cursor.execute("UPDATE rss_items SET theme_id = NULL WHERE theme_id = ?", (theme_id,))
+        cursor.execute(THEME_UNLINK_ITEMS_SQL, (theme_id,))
 
         conn.commit()
 
@@ -479,6 +485,81 @@ def delete_theme(theme_id: int, date: Optional[str] = None):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# ========================================
+# 跨日期趋势 API (Trends)
+# ========================================
+
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
+def validate_end_date(end_date: Optional[str]) -> Optional[str]:
+    """检查结束日期是否为有效日期（格式已由 DATE_PATTERN 校验，这里排除 2025-02-30 等不存在的日期）"""
+    if end_date is not None:
+        try:
+            datetime.strptime(end_date, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid end_date: {end_date}")
+    return end_date
+
+
+@app.get("/api/trends/themes", tags=["Trends"], response_model=Dict[str, Any])
+def get_recent_themes(
+    days: int = Query(7, ge=1, le=MAX_QUERY_DAYS),
+    end_date: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    status: Optional[str] = None,
+    group_id: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    获取最近 N 天的分析主题（每条带 date 字段，用于详情/状态接口的 date 参数）
+
+    - **days**: 天数，默认 7，最多 90
+    - **end_date**: 结束日期 (YYYY-MM-DD)，默认为今天
+    - **status** / **group_id**: 同 /api/themes
+    - **limit**: 最多返回条数
+    """
+    end_date = validate_end_date(end_date)
+    query = get_multiday_query()
+    themes = query.get_themes(days, end_date, status=status, group_id=group_id, limit=limit)
+    return {"themes": themes, "days": days, "end_date": format_date_folder(end_date, query.timezone)}
+
+
+@app.get("/api/trends/platforms", tags=["Trends"], response_model=Dict[str, Any])
+def get_platform_trends(
+    days: int = Query(7, ge=1, le=MAX_QUERY_DAYS),
+    end_date: Optional[str] = Query(None, pattern=DATE_PATTERN),
+):
+    """
+    获取各平台最近 N 天每天的条目数量
+
+    - **days**: 天数，默认 7，最多 90
+    - **end_date**: 结束日期 (YYYY-MM-DD)，默认为今天
+    """
+    end_date = validate_end_date(end_date)
+    query = get_multiday_query()
+    return {"platforms": query.get_platform_volume(days, end_date), "days": days}
+
+
+@app.get("/api/trends/titles", tags=["Trends"], response_model=Dict[str, Any])
+def get_title_trend(
+    title: str,
+    platform_id: Optional[str] = None,
+    days: int = Query(30, ge=1, le=MAX_QUERY_DAYS),
+    end_date: Optional[str] = Query(None, pattern=DATE_PATTERN),
+):
+    """
+    获取标题在最近 N 天中每天的出现情况
+
+    - **title**: 完整标题
+    - **platform_id**: 只查询该平台
+    - **days**: 天数，默认 30，最多 90
+    - **end_date**: 结束日期 (YYYY-MM-DD)，默认为今天
+    """
+    end_date = validate_end_date(end_date)
+    query = get_multiday_query()
+    return {"title": title, "history": query.get_title_history(title, platform_id, days, end_date)}
+
+
 # ========================================
 # 数据源管理 API (Sources)
 # ========================================
@@ -609,18 +690,14 @@ def remove_filter_keyword(keyword: str):
 # ========================================
 
 @app.get("/api/ai/config", tags=["AI"], response_model=AIConfigModel)
-def get_ai_config():
+def get_ai_config(cache: FileCache = Depends(get_ai_config_cache)):
     """获取 AI 配置"""
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    config_path = os.path.join(project_root, "config", "ai_config.json")
-    
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return AIConfigModel(**data)
-        except Exception as e:
-            print(f"Error reading AI config: {e}")
+    try:
+        return AIConfigModel(**cache.get())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error reading AI config: {e}")
     
     # 默认配置
     return AIConfigModel(
@@ -642,6 +719,7 @@ def update_ai_config(config: AIConfigModel):
         os.makedirs(os.path.dirname(config_path), exist_ok=True)
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(config.dict(), f, ensure_ascii=False, indent=2)
+        get_ai_config_cache().invalidate()
         return {"success": True, "message": "AI config updated"}
     except Exception as e:
         print(f"Error saving AI config: {e}")
@@ -885,8 +963,7 @@ class DeduplicationConfigModel(BaseModel):
 def get_deduplication_config():
     """获取去重配置"""
     try:
-        from trendradar.core.loader import load_config
-        config = load_config()
+        config = get_config()
 
         dedup_config = config.get("DEDUPLICATION", {})
 
@@ -942,6 +1019,8 @@ def update_deduplication_config(config: DeduplicationConfigModel):
         # 保存到文件
         with open(config_file, "w", encoding="utf-8") as f:
             yaml.dump(existing_config, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        if _config_cache is not None:
+            _config_cache.invalidate()
 
         return {"success": True, "message": "Deduplication config updated"}
     except Exception as e:
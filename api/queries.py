@@ -0,0 +1,73 @@
+# coding=utf-8
+"""
+API 使用的 SQL 语句
+
+主题相关接口直接查询每日 RSS 数据库，语句集中在这里，
+接口（main.py）与查询计划回归测试（test_query_plans.py）共用同一份 SQL。
+"""
+
+from typing import Any, List, Optional, Tuple
+
+
+# 主题列表返回的字段（由存储层的结构迁移保证存在，见 trendradar/storage/migrations.py）
+THEME_LIST_COLUMNS = (
+    "id", "title", "summary", "category", "importance", "impact", "created_at",
+    "status", "tags", "read_at", "is_duplicate", "duplicate_similarity",
+    "group_id", "group_name",
+)
+
+THEME_DETAIL_SQL = "SELECT * FROM analysis_themes WHERE id = ?"
+
+THEME_ARTICLES_SQL = """
+    SELECT
+        ri.id, ri.title, ri.url, ri.published_at, ri.feed_id,
+        ri.summary, ri.author,
+        rf.name as source_name
+    FROM rss_items ri
+    LEFT JOIN rss_feeds rf ON ri.feed_id = rf.id
+    WHERE ri.theme_id = ?
+    ORDER BY ri.published_at DESC
+"""
+
+THEME_LOOKUP_SQL = "SELECT id, title, summary, category, tags, status FROM analysis_themes WHERE id = ?"
+
+THEME_MARK_READ_SQL = "UPDATE analysis_themes SET status = ?, read_at = ? WHERE id = ?"
+
+THEME_SET_STATUS_SQL = "UPDATE analysis_themes SET status = ? WHERE id = ?"
+
+THEME_DELETE_SQL = "DELETE FROM analysis_themes WHERE id = ?"
+
+THEME_UNLINK_ITEMS_SQL = "UPDATE rss_items SET theme_id = NULL WHERE theme_id = ?"
+
+
+def build_theme_list_query(
+    status: Optional[str] = None,
+    group_id: Optional[str] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    构建主题列表查询
+
+    Args:
+        status: 过滤状态 (unread, read, archived)
+        group_id: 过滤分组 ID
+
+    Returns:
+        (SQL, 参数列表)
+    """
+    query = f"SELECT {', '.join(THEME_LIST_COLUMNS)} FROM analysis_themes"
+    params: List[Any] = []
+
+    conditions = []
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+
+    if group_id:
+        conditions.append("group_id = ?")
+        params.append(group_id)
+
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    query += " ORDER BY importance DESC, created_at DESC"
+    return query, params
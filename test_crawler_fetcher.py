@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+热榜抓取测试
+
+用假会话模拟失败后重试的平台，检查：
+- 并发模式下重试请求同样经过按主机限速器，同一主机相邻请求不小于最小间隔
+
+用法: python test_crawler_fetcher.py
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from trendradar.crawler.fetcher import DataFetcher
+
+
+class FlakySession:
+    """每个平台前两次请求失败、第三次成功的假会话，记录每次请求的发出时间"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.attempts = {}
+        self.sent_at = []
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            self.sent_at.append(time.monotonic())
+            count = self.attempts[url] = self.attempts.get(url, 0) + 1
+        response = mock.Mock()
+        response.raise_for_status.return_value = None
+        response.text = json.dumps({"status": "success" if count > 2 else "error", "items": []})
+        return response
+
+    def close(self):
+        pass
+
+
+def test_retries_go_through_host_limiter():
+    """并发模式下重试请求也按主机最小间隔发出"""
+    fetcher = DataFetcher(api_url="https://api.example.com/s")
+    fetcher.session = FlakySession()
+    interval_ms = 200
+
+    # 重试退避和限速抖动都取 0：没有限速时重试会紧接着失败的请求发出
+    with mock.patch("random.uniform", return_value=0):
+        results, _, failed = fetcher.crawl_websites(
+            ["a", "b", "c"], request_interval=interval_ms, max_workers=3
+        )
+
+    assert failed == [] and set(results) == {"a", "b", "c"}, (results, failed)
+    sent = sorted(fetcher.session.sent_at)
+    assert len(sent) == 9, len(sent)
+    # 全部请求同一主机：相邻请求间隔不小于最小间隔
+    gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+    assert min(gaps) >= interval_ms / 1000 - 0.005, gaps
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_retries_go_through_host_limiter,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+频率词匹配器测试
+
+构造含大量正则词的词组配置，检查：
+- FrequencyMatcher 的匹配结果与逐词检查（原 matches_word_groups 实现）一致，
+  包括重叠匹配、锚点、反向引用等正则词
+- 正则词较多、不同标题命中不同正则词时，匹配耗时不随标题重新编译表达式而放大
+
+用法: python test_frequency_matcher.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from trendradar.core.frequency import _parse_word
+from trendradar.core.matcher import FrequencyMatcher
+
+
+def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
+    """逐词检查（原实现）"""
+    if isinstance(word_config, str):
+        return word_config.lower() in title_lower
+    if word_config.get("is_regex") and word_config.get("pattern"):
+        return bool(word_config["pattern"].search(title_lower))
+    return word_config["word"].lower() in title_lower
+
+
+def reference_groups(title: str, word_groups: List[Dict], filter_words: List) -> List[int]:
+    """逐词检查得到的匹配词组索引"""
+    if not title.strip():
+        return []
+    title_lower = title.lower()
+    if any(_word_matches(item, title_lower) for item in filter_words):
+        return []
+    matched = []
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(_word_matches(w, title_lower) for w in group["required"]):
+            continue
+        if group["normal"] and not any(_word_matches(w, title_lower) for w in group["normal"]):
+            continue
+        matched.append(index)
+    return matched
+
+
+def regex_config(term_count: int) -> List[Dict]:
+    """每个词组一个正则词，第 i 个正则词只匹配带编号 i 的标题"""
+    return [
+        {"required": [], "normal": [_parse_word(f"/型号{i}(?!\\d)|m{i}x\\b/")]}
+        for i in range(term_count)
+    ]
+
+
+def regex_titles(count: int, term_count: int) -> List[str]:
+    """每 4 条标题中有 1 条命中两个不同的正则词，其余不命中任何正则词"""
+    rng = random.Random(7)
+    return [
+        f"新品发布：型号{rng.randrange(term_count)} 与 M{rng.randrange(term_count)}X 同时亮相"
+        if i % 4 == 0 else f"第 {i} 条新闻：某地发布天气预警，提醒市民注意出行安全"
+        for i in range(count)
+    ]
+
+
+def test_matches_reference():
+    """匹配结果与逐词检查一致（含重叠匹配、锚点、反向引用）"""
+    words = [
+        "/ab/", "/abc/", "/^苹果/", "/发布$/", "/(\\w)\\1/", "/b.d/", "/芯片|处理器/",
+        "苹果", "+新品", "华为", "/(?<=新)品/", "/x?/",
+    ]
+    rng = random.Random(3)
+    word_groups = []
+    for _ in range(30):
+        picked = rng.sample(words, 3)
+        word_groups.append({
+            "required": [_parse_word(w[1:]) for w in picked if w.startswith("+")],
+            "normal": [_parse_word(w) for w in picked if not w.startswith("+")],
+        })
+    filter_words = [_parse_word("/^广告/")]
+    matcher = FrequencyMatcher(word_groups, filter_words)
+
+    alphabet = ["a", "b", "c", "d", "aa", "苹果", "新品", "发布", "芯片", "华为", "广告", " "]
+    for _ in range(2000):
+        title = "".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 8)))
+        assert matcher.match_groups(title) == reference_groups(title, word_groups, filter_words), title
+
+    titles = regex_titles(300, 200)
+    word_groups = regex_config(200)
+    matcher = FrequencyMatcher(word_groups, [])
+    for title in titles:
+        assert matcher.match_groups(title) == reference_groups(title, word_groups, []), title
+
+
+def test_many_regex_terms_are_not_recompiled_per_title():
+    """正则词较多时，匹配耗时与逐词检查同量级"""
+    for term_count in (20, 300):
+        word_groups = regex_config(term_count)
+        titles = regex_titles(3000, term_count)
+        matcher = FrequencyMatcher(word_groups, [])
+
+        start = time.perf_counter()
+        results = [matcher.match_groups(title) for title in titles]
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [reference_groups(title, word_groups, []) for title in titles]
+        reference = time.perf_counter() - start
+
+        assert results == expected
+        print(f"  {term_count} 个正则词: 匹配器 {elapsed:.3f}s, 逐词检查 {reference:.3f}s")
+        assert elapsed < max(reference * 2, 0.2), (term_count, elapsed, reference)
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_matches_reference,
+        test_many_regex_terms_are_not_recompiled_per_title,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+推送分批测试
+
+构造一份多关键词组、多来源、带 RSS 的报告数据，检查：
+- 排版一次、按不同字节上限分批的结果与固定的期望输出一致，且不超过上限
+  （test_fixtures/notification_split_batches.json，由引入排版结构前的分批实现生成）
+- AppContext 在同一次运行内按格式类型复用排版结果，多个账号 / 渠道只重新分批
+
+用法: python test_notification_split.py
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from trendradar.context import AppContext
+from trendradar.notification import splitter
+from trendradar.notification.splitter import build_message_layout, split_content_into_batches
+
+
+FORMATS = ("feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack")
+
+EXPECTED_BATCHES = Path(__file__).parent / "test_fixtures" / "notification_split_batches.json"
+
+
+def _title(group: int, index: int) -> dict:
+    return {
+        "title": f"关键词{group} 的第 {index} 条新闻标题" + "很长" * (index % 7),
+        "source_name": f"平台{index % 3}",
+        "time_display": f"[08:{index:02d} ~ 10:{index:02d}]" if index % 2 else "",
+        "count": index % 4 + 1,
+        "ranks": [index % 20 + 1],
+        "rank_threshold": 5,
+        "url": f"https://example.com/{group}/{index}" if index % 3 else "",
+        "mobile_url": "",
+        "is_new": index % 5 == 0,
+    }
+
+
+def build_report_data() -> dict:
+    return {
+        "stats": [
+            {"word": f"关键词{g}", "count": 4 + g, "titles": [_title(g, i) for i in range(4 + g)]}
+            for g in range(8)
+        ],
+        "new_titles": [
+            {"source_id": f"p{s}", "source_name": f"平台{s}", "titles": [_title(100 + s, i) for i in range(3)]}
+            for s in range(3)
+        ],
+        "failed_ids": ["weibo"],
+        "total_new_count": 9,
+    }
+
+
+RSS_ITEMS = [
+    {"word": "RSS 关键词", "count": 3, "titles": [_title(200, i) for i in range(3)]},
+]
+
+
+def fixed_time() -> datetime:
+    return datetime(2025, 12, 29, 10, 30)
+
+
+def test_layout_packs_like_previous_splitter():
+    """分批结果与原分批实现的输出逐字节一致"""
+    report_data = build_report_data()
+    cases = json.loads(EXPECTED_BATCHES.read_text(encoding="utf-8"))
+    for case in cases:
+        format_type, max_bytes = case["format_type"], case["max_bytes"]
+        layout = build_message_layout(
+            report_data, format_type, get_time_func=fixed_time,
+            rss_items=RSS_ITEMS, rss_new_items=RSS_ITEMS,
+        )
+        assert layout.pack(max_bytes) == case["batches"], (format_type, max_bytes)
+        assert split_content_into_batches(
+            report_data, format_type, max_bytes=max_bytes, get_time_func=fixed_time,
+            rss_items=RSS_ITEMS, rss_new_items=RSS_ITEMS,
+        ) == case["batches"], (format_type, max_bytes)
+
+
+def test_layout_batches_fit_limit():
+    """同一份排版按不同字节上限分批，每批都不超限"""
+    report_data = build_report_data()
+    for format_type in FORMATS:
+        layout = build_message_layout(
+            report_data, format_type, get_time_func=fixed_time,
+            rss_items=RSS_ITEMS, rss_new_items=RSS_ITEMS,
+        )
+        for max_bytes in (600, 1000, 3800, 29000):
+            batches = layout.pack(max_bytes)
+            assert all(len(b.encode("utf-8")) < max_bytes for b in batches), (format_type, max_bytes)
+        assert len(layout.pack(600)) > len(layout.pack(29000)) >= 1
+
+
+def test_context_reuses_layout_across_accounts():
+    """同一次运行内同一格式类型只排版一次"""
+    ctx = AppContext({"TIMEZONE": "Asia/Shanghai"})
+    report_data = build_report_data()
+
+    with mock.patch.object(
+        splitter, "format_title_for_platform", wraps=splitter.format_title_for_platform
+    ) as format_title, mock.patch(
+        "trendradar.context.build_message_layout", wraps=splitter.build_message_layout
+    ) as build:
+        first = ctx.split_content(report_data, "wework", max_bytes=3900, rss_items=RSS_ITEMS)
+        formatted = format_title.call_count
+        # 同一渠道的第二个账号、不同批次大小的渠道
+        assert ctx.split_content(report_data, "wework", max_bytes=3900, rss_items=RSS_ITEMS) == first
+        smaller = ctx.split_content(report_data, "wework", max_bytes=1200, rss_items=RSS_ITEMS)
+        assert len(smaller) > len(first)
+        assert build.call_count == 1
+        assert format_title.call_count == formatted
+
+        # 不同格式类型、不同报告数据分别排版
+        ctx.split_content(report_data, "telegram", max_bytes=3900, rss_items=RSS_ITEMS)
+        ctx.split_content(build_report_data(), "wework", max_bytes=3900, rss_items=RSS_ITEMS)
+        assert build.call_count == 3
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_layout_packs_like_previous_splitter,
+        test_layout_batches_fit_limit,
+        test_context_reuses_layout_across_accounts,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
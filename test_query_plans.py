@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+存储查询计划回归测试
+
+构造一份接近真实规模的全天数据库（新闻 + RSS），调用本地 / 远程存储后端的
+读写接口，用 set_trace_callback 记录连接上实际执行的语句；api/main.py 的主题接口
+使用 api/queries.py 中的同一份 SQL。对记录到的每条语句执行 EXPLAIN QUERY PLAN：
+- 出现 USE TEMP B-TREE（临时排序/去重/分组）视为失败
+- 出现对表的 SCAN 视为失败，除非该接口本身就是整表读取（在 scans 中显式声明）
+
+新增存储接口时，请同步更新下面的接口清单；修改已有接口的 SQL 无需改动测试。
+另外校验跨日期查询（MultiDayQuery）分批附加后的结果与逐天查询一致。
+
+用法: python test_query_plans.py
+"""
+
+import random
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.queries import (
+    THEME_ARTICLES_SQL,
+    THEME_DELETE_SQL,
+    THEME_DETAIL_SQL,
+    THEME_LOOKUP_SQL,
+    THEME_MARK_READ_SQL,
+    THEME_SET_STATUS_SQL,
+    THEME_UNLINK_ITEMS_SQL,
+    build_theme_list_query,
+)
+from test_remote_sync import MemoryS3
+from trendradar.storage.base import NewsData, NewsItem, RSSData, RSSItem
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.migrations import ensure_schema
+from trendradar.storage.multiday import DEFAULT_ATTACH_LIMIT, MultiDayQuery
+from trendradar.storage.remote import RemoteStorageBackend
+from trendradar.storage.sqlite_profile import connect_sqlite
+
+
+# 全天规模：每 15 分钟抓取一次
+CRAWLS_PER_DAY = 96
+PLATFORMS = 30
+ITEMS_PER_PLATFORM = 50
+FEEDS = 60
+ITEMS_PER_FEED = 20
+THEMES = 300
+
+
+def _crawl_times():
+    return [f"{m // 60:02d}-{m % 60:02d}" for m in range(0, CRAWLS_PER_DAY * 15, 15)]
+
+
+def build_news_db(db_path):
+    """生成全天新闻数据库"""
+    rng = random.Random(42)
+    conn = connect_sqlite(db_path)
+    ensure_schema(conn, "news")
+
+    conn.executemany(
+        "INSERT INTO platforms (id, name) VALUES (?, ?)",
+        [(f"p{i}", f"平台{i}") for i in range(PLATFORMS)],
+    )
+
+    news_rows = []
+    rank_rows = []
+    status_rows = []
+    next_id = 1
+    # 每个平台维护一个"在榜"列表，每次抓取替换其中一部分
+    boards = {f"p{i}": [] for i in range(PLATFORMS)}
+    item_state = {}
+
+    for record_id, crawl_time in enumerate(_crawl_times(), start=1):
+        for platform_id, board in boards.items():
+            keep = board[: ITEMS_PER_PLATFORM - rng.randint(3, 10)] if board else []
+            while len(keep) < ITEMS_PER_PLATFORM:
+                item_state[next_id] = [f"{platform_id} 标题 {next_id}", platform_id,
+                                       f"https://example.com/{platform_id}/{next_id}",
+                                       crawl_time, crawl_time, 0]
+                keep.append(next_id)
+                next_id += 1
+            rng.shuffle(keep)
+            boards[platform_id] = keep
+            for rank, news_id in enumerate(keep, start=1):
+                state = item_state[news_id]
+                state[4] = crawl_time
+                state[5] += 1
+                rank_rows.append((news_id, rank, crawl_time))
+            status = "failed" if rng.random() < 0.02 else "success"
+            status_rows.append((record_id, platform_id, status))
+
+    for news_id, (title, platform_id, url, first, last, count) in item_state.items():
+        news_rows.append((news_id, title, platform_id, 1, url, "", first, last, count))
+
+    conn.executemany("""
+        INSERT INTO news_items
+        (id, title, platform_id, rank, url, mobile_url, first_crawl_time, last_crawl_time, crawl_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, news_rows)
+    conn.executemany(
+        "INSERT INTO rank_history (news_item_id, rank, crawl_time) VALUES (?, ?, ?)", rank_rows
+    )
+    conn.executemany(
+        "INSERT INTO crawl_records (id, crawl_time, total_items) VALUES (?, ?, ?)",
+        [(i, t, PLATFORMS * ITEMS_PER_PLATFORM) for i, t in enumerate(_crawl_times(), start=1)],
+    )
+    conn.executemany(
+        "INSERT INTO crawl_source_status (crawl_record_id, platform_id, status) VALUES (?, ?, ?)",
+        status_rows,
+    )
+    conn.execute("INSERT INTO push_records (date, pushed) VALUES ('2025-01-01', 1)")
+    conn.commit()
+    return conn
+
+
+def build_rss_db(db_path):
+    """生成全天 RSS 数据库"""
+    rng = random.Random(7)
+    conn = connect_sqlite(db_path)
+    ensure_schema(conn, "rss")
+
+    conn.executemany(
+        "INSERT INTO rss_feeds (id, name) VALUES (?, ?)",
+        [(f"f{i}", f"源{i}") for i in range(FEEDS)],
+    )
+    conn.executemany("""
+        INSERT INTO analysis_themes (id, title, summary, category, importance, impact, status, group_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, [(i, f"主题{i}", "摘要", "科技", rng.randint(1, 10), rng.randint(1, 10),
+           rng.choice(["unread", "read", "archived"]), f"g{i % 10}")
+          for i in range(1, THEMES + 1)])
+
+    crawl_times = _crawl_times()
+    item_rows = []
+    content_rows = []
+    item_id = 1
+    for feed_index in range(FEEDS):
+        feed_id = f"f{feed_index}"
+        for crawl_index in range(0, CRAWLS_PER_DAY, 4):
+            for _ in range(ITEMS_PER_FEED // 4):
+                first = crawl_times[crawl_index]
+                last = crawl_times[min(crawl_index + rng.randint(0, 8), CRAWLS_PER_DAY - 1)]
+                theme_id = rng.randint(1, THEMES) if rng.random() < 0.5 else None
+                item_rows.append((item_id, f"{feed_id} 文章 {item_id}", feed_id,
+                                  f"https://example.com/{feed_id}/{item_id}",
+                                  f"2025-01-01T{rng.randint(0, 23):02d}:00:00", theme_id, first, last))
+                content_rows.append((item_id, "正文" * 40))
+                item_id += 1
+
+    conn.executemany("""
+        INSERT INTO rss_items
+        (id, title, feed_id, url, published_at, theme_id, first_crawl_time, last_crawl_time)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, item_rows)
+    conn.executemany(
+        "INSERT INTO article_contents (rss_item_id, content) VALUES (?, ?)", content_rows
+    )
+    conn.executemany(
+        "INSERT INTO rss_crawl_records (id, crawl_time, total_items) VALUES (?, ?, ?)",
+        [(i, t, 0) for i, t in enumerate(crawl_times, start=1)],
+    )
+    conn.executemany(
+        "INSERT INTO rss_crawl_status (crawl_record_id, feed_id, status) VALUES (?, ?, ?)",
+        [(i, f"f{f}", "failed" if rng.random() < 0.02 else "success")
+         for i in range(1, CRAWLS_PER_DAY + 1) for f in range(FEEDS)],
+    )
+    conn.commit()
+    return conn
+
+
+DATE = "2025-01-01"
+
+# 只检查读写数据的语句（事务控制、PRAGMA 等不检查）
+_CHECKED_STATEMENT = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+# 去重时把字面量替换为占位符，同一语句只检查一次
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def sample_news_data(conn) -> NewsData:
+    """下一次抓取：部分平台的已有条目（排名变化）加上新条目"""
+    crawl_time = "23-59"
+    items = {}
+    for platform in range(0, PLATFORMS, 3):
+        platform_id = f"p{platform}"
+        rows = conn.execute(
+            "SELECT title, url FROM news_items WHERE platform_id = ? ORDER BY id DESC LIMIT 40",
+            (platform_id,),
+        ).fetchall()
+        titles = [(title, url) for title, url in rows]
+        titles += [(f"{platform_id} 新标题 {i}", f"https://example.com/{platform_id}/new{i}") for i in range(10)]
+        items[platform_id] = [
+            NewsItem(title=title, source_id=platform_id, rank=rank, url=url, crawl_time=crawl_time)
+            for rank, (title, url) in enumerate(titles, start=1)
+        ]
+    return NewsData(
+        date=DATE,
+        crawl_time=crawl_time,
+        items=items,
+        id_to_name={platform_id: f"平台{platform_id[1:]}" for platform_id in items},
+        failed_ids=["p1"],
+    )
+
+
+def sample_rss_data(conn) -> RSSData:
+    """下一次 RSS 抓取：部分源的已有条目加上新条目，部分源未变化"""
+    crawl_time = "23-59"
+    items = {}
+    for feed in range(0, FEEDS, 3):
+        feed_id = f"f{feed}"
+        rows = conn.execute(
+            "SELECT title, url FROM rss_items WHERE feed_id = ? ORDER BY id DESC LIMIT 10", (feed_id,)
+        ).fetchall()
+        entries = [(title, url) for title, url in rows]
+        entries += [(f"{feed_id} 新文章 {i}", f"https://example.com/{feed_id}/new{i}") for i in range(5)]
+        items[feed_id] = [
+            RSSItem(title=title, feed_id=feed_id, url=url, published_at="2025-01-01T23:00:00",
+                    crawl_time=crawl_time, first_time=crawl_time, last_time=crawl_time)
+            for title, url in entries
+        ]
+    return RSSData(
+        date=DATE,
+        crawl_time=crawl_time,
+        items=items,
+        id_to_name={f"f{i}": f"源{i}" for i in range(FEEDS)},
+        failed_ids=["f1"],
+        unchanged_ids=["f2", "f4"],
+    )
+
+
+def news_calls(current: NewsData):
+    """
+    新闻库的存储接口清单
+
+    每项为 (名称, 方法名, 参数, scans)，scans 为该调用允许整表扫描的表（或别名）；
+    写入类调用放在最后，不影响前面读取的数据
+    """
+    return [
+        # 全天数据按平台读取全部条目，排名历史按条目聚合（覆盖索引整表读取）；
+        # crawl_records 每天最多百余行，只读取索引末端
+        ("当天全部数据", "get_today_all_data", (DATE,), {"n", "rank_history", "crawl_records"}),
+        ("最新批次数据", "get_latest_crawl_data", (DATE,), {"crawl_records"}),
+        ("检测新标题", "detect_new_titles", (current,), {"news_items"}),
+        ("是否当天首次抓取", "is_first_crawl_today", (DATE,), {"crawl_records"}),
+        ("抓取时间列表", "get_crawl_times", (DATE,), {"crawl_records"}),
+        ("是否已推送", "has_pushed_today", (DATE,), set()),
+        ("记录推送", "record_push", ("daily", DATE), set()),
+        # 远程后端写入前后统计总条目数（COUNT(*) 读取覆盖索引）
+        ("写入新闻", "save_news_data", (current,), {"news_items"}),
+    ]
+
+
+def rss_calls(current: RSSData):
+    """RSS 库的存储接口清单（格式同 news_calls）"""
+    return [
+        ("当天全部条目", "get_rss_data", (DATE,), {"i", "rss_crawl_records"}),
+        ("最新批次条目", "get_latest_rss_data", (DATE,), {"rss_crawl_records"}),
+        ("检测新条目", "detect_new_rss_items", (current,), {"rss_items"}),
+        ("当天主题", "get_ai_themes", (DATE,), {"analysis_themes"}),
+        ("写入 RSS", "save_rss_data", (current,), set()),
+    ]
+
+
+def api_calls():
+    """api/main.py 主题接口执行的语句（来自 api/queries.py），在连接上直接执行"""
+    return [
+        ("主题列表", "execute", build_theme_list_query(), {"analysis_themes"}),
+        ("主题列表（按状态）", "execute", build_theme_list_query("unread"), set()),
+        ("主题列表（按分组）", "execute", build_theme_list_query(None, "g1"), set()),
+        ("主题列表（按状态和分组）", "execute", build_theme_list_query("unread", "g1"), set()),
+        ("主题详情", "execute", (THEME_DETAIL_SQL, (1,)), set()),
+        ("主题关联文章", "execute", (THEME_ARTICLES_SQL, (1,)), set()),
+        ("查找主题", "execute", (THEME_LOOKUP_SQL, (1,)), set()),
+        ("标记已读", "execute", (THEME_MARK_READ_SQL, ("read", "2025-01-01T23:59:00", 1)), set()),
+        ("更新主题状态", "execute", (THEME_SET_STATUS_SQL, ("archived", 1)), set()),
+        ("删除主题", "execute", (THEME_DELETE_SQL, (1,)), set()),
+        ("解除主题关联", "execute", (THEME_UNLINK_ITEMS_SQL, (1,)), set()),
+    ]
+
+
+def check_plan(conn, sql, scans):
+    """
+    检查单条语句的执行计划
+
+    Returns:
+        (执行计划, 问题列表)
+    """
+    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+    problems = []
+    for detail in plan:
+        if "USE TEMP B-TREE" in detail:
+            problems.append(detail)
+        elif detail.startswith("SCAN ") and not any(
+            skip in detail for skip in ("VIRTUAL TABLE", "CONSTANT ROW")
+        ):
+            table = detail.split()[1]
+            if table not in scans:
+                problems.append(detail)
+    return plan, problems
+
+
+def run_traced(conn, target, calls):
+    """
+    执行接口调用，记录连接上实际执行的语句并逐条检查执行计划
+
+    Args:
+        conn: 被跟踪的数据库连接
+        target: 被调用方法的对象（存储后端或连接本身）
+        calls: [(名称, 方法名, 参数, scans), ...]
+
+    Returns:
+        问题列表（为空表示通过）
+    """
+    failures = []
+    for name, method, args, scans in calls:
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            start = time.perf_counter()
+            getattr(target, method)(*args)
+            elapsed = (time.perf_counter() - start) * 1000
+        finally:
+            conn.set_trace_callback(None)
+        if conn.in_transaction:
+            conn.rollback()
+
+        seen = set()
+        checked = []
+        for sql in statements:
+            if not _CHECKED_STATEMENT.match(sql):
+                continue
+            key = _LITERAL.sub("?", " ".join(sql.split()))
+            if key in seen:
+                continue
+            seen.add(key)
+            plan, problems = check_plan(conn, sql, scans)
+            checked.append(plan)
+            if problems:
+                failures.append(f"{name}: {'; '.join(problems)}\n    {key[:200]}")
+
+        assert checked, f"{name}: 没有记录到任何语句"
+        mark = "❌" if any(f.startswith(f"{name}:") for f in failures) else "✅"
+        print(f"  {mark} {name:<16} {elapsed:8.2f} ms   {len(checked)} 条语句")
+        for plan in checked:
+            print(f"        {' | '.join(plan)}")
+    return failures
+
+
+def _local_backend(data_dir):
+    return LocalStorageBackend(data_dir=str(data_dir), enable_txt=False, enable_html=False)
+
+
+def _remote_backend(temp_dir):
+    backend = RemoteStorageBackend(
+        bucket_name="test",
+        access_key_id="test",
+        secret_access_key="test",
+        endpoint_url="http://127.0.0.1:9000",
+        temp_dir=str(temp_dir),
+    )
+    backend.s3_client = MemoryS3()
+    return backend
+
+
+def _run_suite(title, db_type, build, sample, backend_calls, extra_calls=None):
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.db"
+        conn = build(source)
+        current = sample(conn)
+        conn.close()
+
+        for backend_name, make_backend in (("local", _local_backend), ("remote", _remote_backend)):
+            print(f"\n=== {title}（{backend_name}） ===")
+            data_dir = Path(tmp) / backend_name
+            (data_dir / db_type).mkdir(parents=True)
+            shutil.copyfile(source, data_dir / db_type / f"{DATE}.db")
+
+            backend = make_backend(data_dir)
+            try:
+                backend_conn = backend._get_connection(DATE, db_type)
+                # 远程后端没有实现的接口（如 get_crawl_times）跳过
+                calls = [c for c in backend_calls(current) if hasattr(backend, c[1])]
+                failures += [f"[{backend_name}] {f}" for f in run_traced(backend_conn, backend, calls)]
+            finally:
+                backend.cleanup()
+
+        if extra_calls:
+            print(f"\n=== {title}（API） ===")
+            conn = connect_sqlite(source)
+            try:
+                failures += [f"[api] {f}" for f in run_traced(conn, conn, extra_calls())]
+            finally:
+                conn.close()
+    return failures
+
+
+def test_news_query_plans():
+    """新闻库查询不应出现未声明的整表扫描或临时排序"""
+    failures = _run_suite("新闻库查询计划", "news", build_news_db, sample_news_data, news_calls)
+    assert not failures, "\n".join(failures)
+
+
+def test_rss_query_plans():
+    """RSS 库查询不应出现未声明的整表扫描或临时排序"""
+    failures = _run_suite("RSS 库查询计划", "rss", build_rss_db, sample_rss_data, rss_calls, api_calls)
+    assert not failures, "\n".join(failures)
+
+
+def test_multiday_queries():
+    """跨日期查询：超过单连接附加上限时分批，结果与逐天查询一致"""
+    days = DEFAULT_ATTACH_LIMIT + 2
+    end = datetime(2025, 12, 28)
+    dates = [(end - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+
+    print(f"\n=== 跨日期查询（{days} 天） ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        for db_type, build in (("news", build_news_db), ("rss", build_rss_db)):
+            (Path(tmp) / db_type).mkdir()
+            source = Path(tmp) / db_type / f"{dates[0]}.db"
+            build(source).close()
+            for date in dates[1:]:
+                shutil.copyfile(source, Path(tmp) / db_type / f"{date}.db")
+
+        conn = sqlite3.connect(Path(tmp) / "news" / f"{dates[0]}.db")
+        per_day_volume = dict(conn.execute("SELECT platform_id, COUNT(*) FROM news_items GROUP BY platform_id"))
+        title, platform_id = conn.execute("SELECT title, platform_id FROM news_items LIMIT 1").fetchone()
+        conn.close()
+
+        query = MultiDayQuery(tmp)
+        assert query.get_dates("news", days + 5, dates[0]) == dates
+
+        start = time.perf_counter()
+        volume = query.get_platform_volume(days, dates[0])
+        print(f"  平台走势      {(time.perf_counter() - start) * 1000:8.2f} ms   {len(volume)} 行")
+        assert len(volume) == days * len(per_day_volume)
+        assert all(row["items"] == per_day_volume[row["platform_id"]] for row in volume)
+        assert [row["date"] for row in volume[:days]] == sorted(dates)
+
+        start = time.perf_counter()
+        history = query.get_title_history(title, platform_id, days, dates[0])
+        print(f"  标题生命周期  {(time.perf_counter() - start) * 1000:8.2f} ms   {len(history)} 行")
+        assert [row["date"] for row in history] == sorted(dates)
+        assert all(row["best_rank"] is not None for row in history)
+
+        start = time.perf_counter()
+        themes = query.get_themes(days, dates[0], status="unread", limit=50)
+        print(f"  最近主题      {(time.perf_counter() - start) * 1000:8.2f} ms   {len(themes)} 行")
+        assert len(themes) == 50
+        assert all(theme["status"] == "unread" for theme in themes)
+        keys = [(theme["importance"], theme["created_at"]) for theme in themes]
+        assert keys == sorted(keys, reverse=True)
+
+
+if __name__ == '__main__':
+    all_failures = []
+    for suite in (test_news_query_plans, test_rss_query_plans, test_multiday_queries):
+        try:
+            suite()
+        except AssertionError as e:
+            all_failures.append(str(e))
+
+    if all_failures:
+        print("\n❌ 查询计划回归：")
+        for failure in all_failures:
+            print(failure)
+        sys.exit(1)
+    print("\n✅ 所有查询均使用索引")
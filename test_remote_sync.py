@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+远程存储同步测试
+
+用内存中的 S3 兼容替身（实现 RemoteStorageBackend 用到的 put/get/head/list/delete/分片上传接口）
+模拟一天内多次独立运行的抓取（每次运行新建后端、用完即清理），分别以 full 和 delta
+两种同步方式写入，检查：
+- delta 模式下非快照批次的上传字节数只与本次写入的行数有关，远小于整库大小
+- 从 delta 模式的快照 + 变更集恢复出的数据库与 full 模式逐行一致
+- pull_recent_days 拉取到本地的数据库同样一致
+- 大文件分片上传时单个分片不超过 MULTIPART_CHUNK_SIZE；多天历史并发拉取、只下载缺失的日期
+- 本地缓存只在远程变化时下载，自己上传后不重复下载，超过上限按 LRU 淘汰
+
+如需对真实服务（如本地 MinIO）验证，把 make_backend 中替换 s3_client 的一行去掉即可。
+
+用法: python test_remote_sync.py
+"""
+
+import hashlib
+import io
+import random
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from botocore.exceptions import ClientError
+
+from trendradar.storage import remote
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.remote import RemoteStorageBackend
+from trendradar.storage.remote_cache import RemoteFileCache
+
+
+DATE = "2025-12-28"
+CRAWLS = 12
+PLATFORMS = 10
+ITEMS_PER_PLATFORM = 50
+COMPACT_EVERY = 5
+
+# 写入时间戳取运行时的当前时间，两种模式之间不可比
+_VOLATILE_COLUMNS = {"created_at", "updated_at", "changed_at", "push_time"}
+
+
+class _Body:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self):
+        return self._stream.read()
+
+    def iter_chunks(self, chunk_size=1024):
+        while True:
+            chunk = self._stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class _Paginator:
+    def __init__(self, store):
+        self._store = store
+
+    def paginate(self, Bucket, Prefix="", Delimiter=None):
+        self._store.list_calls += 1
+        keys = sorted(k for k in self._store.objects if k.startswith(Prefix))
+        if Delimiter:
+            keys = [k for k in keys if Delimiter not in k[len(Prefix):]]
+        yield {"Contents": [{"Key": k, "Size": len(self._store.objects[k][0])} for k in keys]}
+
+
+class MemoryS3:
+    """内存中的 S3 兼容替身，记录每次上传的字节数"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploaded = []
+        self.downloads = []
+        self.parts = {}
+        self.max_part_size = 0
+        self.list_calls = 0
+
+    @staticmethod
+    def _missing(operation):
+        return ClientError({"Error": {"Code": "NoSuchKey"}}, operation)
+
+    def put_object(self, Bucket, Key, Body, ContentLength, ContentType=None, Metadata=None):
+        assert isinstance(Body, bytes) and len(Body) == ContentLength
+        self.objects[Key] = (Body, dict(Metadata or {}))
+        self.uploaded.append((Key, len(Body)))
+        return {"ETag": self._etag(Body)}
+
+    @staticmethod
+    def _etag(body):
+        return '"%s"' % hashlib.md5(body).hexdigest()
+
+    def _headers(self, Key):
+        body, metadata = self.objects[Key]
+        return {"ETag": self._etag(body), "ContentLength": len(body), "Metadata": dict(metadata)}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise self._missing("GetObject")
+        self.downloads.append(Key)
+        return {"Body": _Body(self.objects[Key][0]), **self._headers(Key)}
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise self._missing("HeadObject")
+        return self._headers(Key)
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return _Paginator(self)
+
+    def create_multipart_upload(self, Bucket, Key, ContentType=None, Metadata=None):
+        upload_id = f"upload-{len(self.parts)}"
+        self.parts[upload_id] = (Key, dict(Metadata or {}), {})
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, ContentLength):
+        assert isinstance(Body, bytes) and len(Body) == ContentLength
+        self.parts[UploadId][2][PartNumber] = Body
+        self.uploaded.append((Key, len(Body)))
+        self.max_part_size = max(self.max_part_size, len(Body))
+        return {"ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        key, metadata, parts = self.parts.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        body = b"".join(parts[n] for n in numbers)
+        self.objects[key] = (body, metadata)
+        return {"ETag": self._etag(body)}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.parts.pop(UploadId, None)
+        return {}
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+
+def make_backend(store, sync_mode, temp_dir, cache_dir=None):
+    backend = RemoteStorageBackend(
+        bucket_name="test",
+        access_key_id="test",
+        secret_access_key="test",
+        endpoint_url="http://127.0.0.1:9000",
+        temp_dir=temp_dir,
+        sync_mode=sync_mode,
+        compact_every=COMPACT_EVERY,
+        cache_dir=cache_dir,
+    )
+    backend.s3_client = store
+    return backend
+
+
+def crawl_batches():
+    """模拟一天的多次抓取：每次各平台约 20% 的条目换新，其余排名变化"""
+    rng = random.Random(7)
+    boards = {f"p{i}": list(range(ITEMS_PER_PLATFORM)) for i in range(PLATFORMS)}
+    next_item = ITEMS_PER_PLATFORM
+
+    for crawl in range(CRAWLS):
+        crawl_time = f"{8 + crawl // 4:02d}-{crawl % 4 * 15:02d}"
+        items = {}
+        for source_id, board in boards.items():
+            if crawl:
+                for pos in rng.sample(range(len(board)), ITEMS_PER_PLATFORM // 5):
+                    board[pos] = next_item
+                    next_item += 1
+                rng.shuffle(board)
+            items[source_id] = [
+                NewsItem(
+                    title=f"{source_id} 标题 {n}",
+                    source_id=source_id,
+                    rank=rank,
+                    url=f"https://example.com/{source_id}/{n}",
+                    crawl_time=crawl_time,
+                )
+                for rank, n in enumerate(board, 1)
+            ]
+        yield NewsData(
+            date=DATE,
+            crawl_time=crawl_time,
+            items=items,
+            id_to_name={source_id: f"平台{source_id}" for source_id in boards},
+            failed_ids=["broken"] if crawl % 3 == 0 else [],
+        )
+
+
+def dump_database(conn):
+    """按表导出所有行（去掉写入时间戳）"""
+    dump = {}
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    )]
+    for table in tables:
+        columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')
+                   if row[1] not in _VOLATILE_COLUMNS]
+        column_sql = ", ".join(f'"{c}"' for c in columns)
+        dump[table] = [tuple(row) for row in conn.execute(
+            f'SELECT rowid, {column_sql} FROM "{table}" ORDER BY rowid'
+        )]
+    return dump
+
+
+def run_crawls(sync_mode, tmp, cache_dir=None):
+    """
+    每次抓取新建一个后端（对应一次独立运行）
+
+    Returns:
+        (存储替身, 每次抓取的上传字节数, 上传了完整快照的抓取序号)
+    """
+    store = MemoryS3()
+    per_crawl = []
+    snapshot_crawls = set()
+    for i, data in enumerate(crawl_batches()):
+        backend = make_backend(store, sync_mode, str(Path(tmp) / f"{sync_mode}-{i}"), cache_dir)
+        before = len(store.uploaded)
+        assert backend.save_news_data(data)
+        assert backend.record_push("daily", DATE)
+        uploads = store.uploaded[before:]
+        per_crawl.append(sum(size for _, size in uploads))
+        if any(key.endswith(".db") for key, _ in uploads):
+            snapshot_crawls.add(i)
+        backend.cleanup()
+    return store, per_crawl, snapshot_crawls
+
+
+def restore(store, sync_mode, tmp, cache_dir=None):
+    backend = make_backend(store, sync_mode, str(Path(tmp) / f"reader-{sync_mode}-{len(store.downloads)}"), cache_dir)
+    dump = dump_database(backend._get_connection(DATE))
+    backend.cleanup()
+    return dump
+
+
+def test_delta_sync_matches_full_sync():
+    """delta 模式恢复出的数据库应与 full 模式一致，且单次上传量远小于整库"""
+    with tempfile.TemporaryDirectory() as tmp:
+        full_store, full_bytes, _ = run_crawls("full", tmp)
+        delta_store, delta_bytes, snapshot_crawls = run_crawls("delta", tmp)
+
+        for i, (full, delta) in enumerate(zip(full_bytes, delta_bytes)):
+            print(f"  抓取 {i + 1:2d}: full {full:>9,} bytes  delta {delta:>9,} bytes")
+
+        expected = restore(full_store, "full", tmp)
+        assert restore(delta_store, "delta", tmp) == expected
+
+        # 快照批次只有当天首次写入、以及之后每累计 COMPACT_EVERY 个变更集的那一次
+        assert len(snapshot_crawls) <= 1 + CRAWLS * 2 // COMPACT_EVERY
+        for i in range(CRAWLS):
+            if i in snapshot_crawls:
+                continue
+            assert delta_bytes[i] * 5 < full_bytes[i], f"第 {i + 1} 次抓取的变更集过大"
+
+        # 合并快照后旧变更集应被删除
+        changesets = [k for k in delta_store.objects if ".changes/" in k]
+        assert len(changesets) <= COMPACT_EVERY
+
+        # pull_recent_days 拉取的数据库同样需要回放变更集
+        backend = make_backend(delta_store, "delta", str(Path(tmp) / "pull"))
+        backend._get_configured_time = lambda: datetime(2025, 12, 28, 12)
+        assert backend.pull_recent_days(1, str(Path(tmp) / "pulled")) == 1
+        pulled = Path(tmp) / "pulled" / "news" / f"{DATE}.db"
+        conn = sqlite3.connect(pulled)
+        try:
+            assert dump_database(conn) == expected
+        finally:
+            conn.close()
+        backend.cleanup()
+
+
+def test_multipart_upload_and_concurrent_pull():
+    """大文件分片上传的内存占用不超过一个分片；多天数据并发拉取且只下载本地缺失的日期"""
+    threshold, chunk_size = remote.MULTIPART_THRESHOLD, remote.MULTIPART_CHUNK_SIZE
+    remote.MULTIPART_THRESHOLD, remote.MULTIPART_CHUNK_SIZE = 64 * 1024, 64 * 1024
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store, _, _ = run_crawls("full", tmp)
+            assert store.max_part_size == 64 * 1024
+            expected = restore(store, "full", tmp)
+
+            # 复制出 30 天的历史（其中两天缺失）
+            body, metadata = store.objects[f"news/{DATE}.db"]
+            start = datetime(2025, 12, 28)
+            days = [(start - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30)]
+            for day in days[3:5]:
+                store.objects.pop(f"news/{day}.db", None)
+            for day in days[1:3] + days[5:]:
+                store.objects[f"news/{day}.db"] = (body, metadata)
+
+            local_dir = Path(tmp) / "pulled"
+            (local_dir / "news").mkdir(parents=True)
+            (local_dir / "news" / f"{days[1]}.db").write_bytes(b"")
+
+            backend = make_backend(store, "full", str(Path(tmp) / "pull"))
+            backend._get_configured_time = lambda: datetime(2025, 12, 28, 12)
+            store.list_calls = 0
+            assert backend.pull_recent_days(30, str(local_dir), max_workers=4) == 27
+            # news 与 rss 各一次 LIST，不逐天探测
+            assert store.list_calls == 2
+            conn = sqlite3.connect(local_dir / "news" / f"{days[29]}.db")
+            try:
+                assert dump_database(conn) == expected
+            finally:
+                conn.close()
+            assert not list(local_dir.rglob("*.part"))
+            backend.cleanup()
+    finally:
+        remote.MULTIPART_THRESHOLD, remote.MULTIPART_CHUNK_SIZE = threshold, chunk_size
+
+
+def test_local_cache_transfers_only_changed_days():
+    """本地缓存：自己上传后的下次运行不再下载；远程被其他写入者更新后重新下载；按 LRU 淘汰"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for sync_mode in ("full", "delta"):
+            cache_dir = str(Path(tmp) / f"cache-{sync_mode}")
+            store, _, _ = run_crawls(sync_mode, tmp, cache_dir)
+            base_key = f"news/{DATE}.db"
+            # 只有当天第一次运行时远程还没有数据库，之后全部命中缓存
+            assert store.downloads.count(base_key) == 0, store.downloads
+            assert not [k for k in store.downloads if ".changes/" in k]
+
+            expected = restore(store, sync_mode, tmp)
+            assert restore(store, sync_mode, tmp, cache_dir) == expected
+            assert store.downloads.count(base_key) == 1
+
+            # 其他写入者（没有共享缓存）更新了远程：快照变化时重新下载，
+            # 只新增了变更集时（delta）缓存副本仍可用，只回放新的变更集
+            snapshot = store.objects[base_key][0]
+            data = next(crawl_batches())
+            other = make_backend(store, sync_mode, str(Path(tmp) / f"other-{sync_mode}"))
+            other.compact_every = 0
+            assert other.save_news_data(NewsData(
+                date=DATE, crawl_time="23-59", items=data.items, id_to_name=data.id_to_name,
+            ))
+            other.cleanup()
+            changed = store.objects[base_key][0] != snapshot
+            assert changed == (sync_mode == "full")
+
+            before = store.downloads.count(base_key)
+            assert restore(store, sync_mode, tmp, cache_dir) == restore(store, sync_mode, tmp)
+            assert store.downloads.count(base_key) == before + 1 + int(changed)
+
+    # LRU：超过上限时淘汰最久未使用的副本
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "day.db"
+        source.write_bytes(b"x" * 1000)
+        cache = RemoteFileCache(str(Path(tmp) / "cache"), max_bytes=2500)
+        for day in ("01", "02", "03"):
+            cache.put(f"news/2025-12-{day}.db", source, {"etag": f'"{day}"'})
+            if day == "02":
+                assert cache.get("news/2025-12-01.db", {"etag": '"01"'})
+        assert cache.get("news/2025-12-02.db", {"etag": '"02"'}) is None
+        assert cache.get("news/2025-12-01.db", {"etag": '"01"'})
+        assert cache.get("news/2025-12-01.db", {"etag": '"changed"'}) is None
+        assert RemoteFileCache(str(Path(tmp) / "cache"), max_bytes=2500).get(
+            "news/2025-12-03.db", {"etag": '"03"'}
+        )
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_delta_sync_matches_full_sync,
+        test_multipart_upload_and_concurrent_pull,
+        test_local_cache_transfers_only_changed_days,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+HTML 报告渲染测试
+
+构造一份多关键词组、多来源、带 RSS 和 AI 主题的报告数据，检查：
+- 流式片段（iter_html_chunks）拼接结果与 render_html_content 一致，写入的文件与之一致
+- 汇总报告的 index.html 副本与报告文件内容一致（优先硬链接）
+- 片段缓存跨进程复用：只改动一个关键词组时只重新渲染该组，结果与不使用缓存时逐字节一致
+- 渲染代码变化（指纹不同）时不复用旧片段，指纹覆盖渲染函数依赖的 helpers.py
+- AppContext 按文件修改时间缓存频率词配置（匹配器随之复用）
+
+用法: python test_report_render.py
+"""
+
+import copy
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from trendradar.context import AppContext
+from trendradar.core.matcher import get_frequency_matcher
+from trendradar.report import generate_html_report, iter_html_chunks, render_html_content
+from trendradar.report import fragment_cache as fragment_cache_module
+from trendradar.report.fragment_cache import FragmentCache
+
+
+GROUPS = 12
+TITLES_PER_GROUP = 15
+
+
+def _title(group: int, index: int) -> dict:
+    return {
+        "title": f"关键词{group} 的第 {index} 条 <新闻> & 标题",
+        "source_name": f"平台{index % 5}",
+        "time_display": f"[08:{index:02d} ~ 10:{index:02d}]" if index % 2 else "",
+        "count": index % 4 + 1,
+        "ranks": [index % 20 + 1, index % 7 + 1] if index % 3 else [],
+        "rank_threshold": 5,
+        "url": f"https://example.com/{group}/{index}" if index % 4 else "",
+        "mobile_url": "",
+        "is_new": index % 5 == 0,
+    }
+
+
+def build_report_data() -> dict:
+    stats = [
+        {
+            "word": f"关键词{group}",
+            "count": TITLES_PER_GROUP,
+            "percentage": 0,
+            "titles": [_title(group, i) for i in range(TITLES_PER_GROUP)],
+        }
+        for group in range(GROUPS)
+    ]
+    new_titles = [
+        {"source_id": f"p{s}", "source_name": f"平台{s}", "titles": [_title(100 + s, i) for i in range(3)]}
+        for s in range(3)
+    ]
+    return {
+        "stats": stats,
+        "new_titles": new_titles,
+        "failed_ids": ["weibo"],
+        "total_new_count": 9,
+        "ai_themes": [{"title": "主题 </script>", "summary": "摘要", "tags": ["a"], "importance": 8, "impact": 6}],
+    }
+
+
+RSS_ITEMS = [
+    {"word": "RSS 关键词", "count": 2, "titles": [
+        {"title": "RSS 标题", "source_name": "Feed", "time_display": "12-29 08:20", "url": "https://r/1", "is_new": True},
+        {"title": "RSS 主题", "source_name": "Feed", "time_display": "", "url": "https://r/2", "theme_id": 3},
+    ]},
+]
+
+
+def fixed_time() -> datetime:
+    return datetime(2025, 12, 29, 10, 30)
+
+
+def render(report_data: dict, cache=None) -> str:
+    return render_html_content(
+        report_data, 500, True, "daily",
+        get_time_func=fixed_time, rss_items=RSS_ITEMS, rss_new_items=RSS_ITEMS,
+        fragment_cache=cache,
+    )
+
+
+def test_streamed_report_and_index_links():
+    """流式写入的报告与一次性渲染一致，index.html 副本内容一致"""
+    report_data = build_report_data()
+    expected = render(report_data)
+    chunks = list(iter_html_chunks(
+        report_data, 500, True, "daily",
+        get_time_func=fixed_time, rss_items=RSS_ITEMS, rss_new_items=RSS_ITEMS,
+    ))
+    assert len(chunks) > GROUPS
+    assert "".join(chunks) == expected
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            stats = [
+                {**stat, "titles": [{**t, "mobileUrl": ""} for t in stat["titles"]]}
+                for stat in report_data["stats"]
+            ]
+            render_func = lambda data, *args: iter_html_chunks(data, *args, get_time_func=fixed_time)
+            for total_titles in (100, 200):
+                path = generate_html_report(
+                    stats, total_titles, output_dir="output", date_folder="2025-12-29",
+                    render_html_func=render_func, is_daily_summary=True,
+                )
+                content = Path(path).read_text(encoding="utf-8")
+                assert f"{total_titles} 条" in content
+                for index_path in (Path("index.html"), Path("output") / "index.html"):
+                    assert index_path.read_text(encoding="utf-8") == content
+            assert not list(Path(path).parent.glob("*.tmp"))
+        finally:
+            os.chdir(cwd)
+
+
+def test_fragment_cache_rerenders_only_changed_groups():
+    """片段缓存跨运行复用，只重新渲染输入变化的分组"""
+    report_data = build_report_data()
+    groups = GROUPS + len(report_data["new_titles"]) + 2 * len(RSS_ITEMS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "fragments.json"
+
+        first = FragmentCache(cache_path)
+        assert render(report_data, first) == render(report_data)
+        assert (first.hits, first.misses) == (len(RSS_ITEMS), groups - len(RSS_ITEMS))
+        first.save()
+
+        # 下一次运行：只有一个关键词组的排名变化
+        changed = copy.deepcopy(report_data)
+        changed["stats"][3]["titles"][0]["ranks"] = [1]
+        second = FragmentCache(cache_path)
+        html = render(changed, second)
+        assert html == render(changed)
+        assert second.misses == 1, second.misses
+        assert second.hits == groups - 1
+        second.save()
+
+        # 渲染代码变化后不复用
+        fragment_cache_module.renderer_fingerprint.cache_clear()
+        original = fragment_cache_module.FRAGMENT_CACHE_FORMAT
+        fragment_cache_module.FRAGMENT_CACHE_FORMAT = original + 1
+        try:
+            third = FragmentCache(cache_path)
+            assert render(changed, third) == html
+            assert third.hits == len(RSS_ITEMS)
+        finally:
+            fragment_cache_module.FRAGMENT_CACHE_FORMAT = original
+            fragment_cache_module.renderer_fingerprint.cache_clear()
+
+
+def test_renderer_fingerprint_covers_helpers():
+    """片段渲染函数调用的 helpers.py 变化时指纹随之变化"""
+    original = fragment_cache_module.renderer_fingerprint()
+    read_bytes = Path.read_bytes
+
+    def patched(path):
+        data = read_bytes(path)
+        return data + b"\n# changed\n" if path.name == "helpers.py" else data
+
+    fragment_cache_module.renderer_fingerprint.cache_clear()
+    try:
+        with mock.patch.object(Path, "read_bytes", patched):
+            assert fragment_cache_module.renderer_fingerprint() != original
+    finally:
+        fragment_cache_module.renderer_fingerprint.cache_clear()
+    assert fragment_cache_module.renderer_fingerprint() == original
+
+
+def test_context_memoizes_frequency_config():
+    """频率词配置按修改时间缓存，修改后报告数据使用新配置"""
+    with tempfile.TemporaryDirectory() as tmp:
+        frequency_file = Path(tmp) / "frequency_words.txt"
+        frequency_file.write_text("苹果\n\n芯片\n+发布\n", encoding="utf-8")
+        previous = os.environ.get("FREQUENCY_WORDS_PATH")
+        os.environ["FREQUENCY_WORDS_PATH"] = str(frequency_file)
+        try:
+            ctx = AppContext({"RANK_THRESHOLD": 5})
+            config = ctx.load_frequency_words()
+            assert ctx.load_frequency_words() is config
+            assert get_frequency_matcher(*config) is get_frequency_matcher(*ctx.load_frequency_words())
+
+            stats = build_report_data()["stats"]
+            new_titles = {"p": {"苹果 新品": {"ranks": [2]}, "无关标题": {"ranks": [3]}}}
+            id_to_name = {"p": "平台"}
+            report_data = ctx.prepare_report(stats, [], new_titles, id_to_name, "daily")
+            assert report_data["total_new_count"] == 1
+            assert report_data["new_titles"][0]["titles"][0]["title"] == "苹果 新品"
+
+            # 修改配置文件后重新解析，报告数据使用新配置
+            frequency_file.write_text("无关\n", encoding="utf-8")
+            os.utime(frequency_file, ns=(0, os.stat(frequency_file).st_mtime_ns + 1_000_000))
+            assert ctx.load_frequency_words() is not config
+            refreshed = ctx.prepare_report(stats, [], new_titles, id_to_name, "daily")
+            assert refreshed["new_titles"][0]["titles"][0]["title"] == "无关标题"
+        finally:
+            if previous is None:
+                os.environ.pop("FREQUENCY_WORDS_PATH", None)
+            else:
+                os.environ["FREQUENCY_WORDS_PATH"] = previous
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_streamed_report_and_index_links,
+        test_fragment_cache_rerenders_only_changed_groups,
+        test_renderer_fingerprint_covers_helpers,
+        test_context_memoizes_frequency_config,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
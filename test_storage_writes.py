@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+存储批量写入测试
+
+批量写入中混入一条无法写入数据库的条目，检查：
+- 新闻数据：其余条目照常保存（新增、更新、排名历史），出错的条目被跳过，保存仍然成功
+- RSS 数据（本地 / 远程后端）：其余源和条目照常保存，只为成功写入的新条目调用注入的全文抓取函数
+
+用法: python test_storage_writes.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent))
+
+from test_remote_sync import MemoryS3
+from trendradar.storage.base import NewsData, NewsItem, RSSData, RSSItem
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.remote import RemoteStorageBackend
+
+
+DATE = "2025-01-01"
+
+
+def news_data(crawl_time: str, bad_rank=None) -> NewsData:
+    """两个平台各 3 条新闻；bad_rank 不为空时第一个平台的第 2 条排名无法写入"""
+    items = {}
+    for platform_id in ("p1", "p2"):
+        items[platform_id] = [
+            NewsItem(title=f"{platform_id} 标题 {i}", source_id=platform_id, rank=i,
+                     url=f"https://example.com/{platform_id}/{i}", crawl_time=crawl_time)
+            for i in range(1, 4)
+        ]
+    if bad_rank is not None:
+        items["p1"][1].rank = bad_rank
+    return NewsData(
+        date=DATE,
+        crawl_time=crawl_time,
+        items=items,
+        id_to_name={"p1": "平台1", "p2": "平台2"},
+        failed_ids=[],
+    )
+
+
+def test_bad_news_item_is_skipped():
+    """一条新闻写入失败时只跳过该条，其余条目照常保存"""
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = LocalStorageBackend(data_dir=tmp, enable_txt=False, enable_html=False)
+        try:
+            assert backend.save_news_data(news_data("08-00"))
+            # 第二次抓取：p1 的第 2 条排名是无法绑定的值，其余 5 条为更新
+            assert backend.save_news_data(news_data("09-00", bad_rank=[2]))
+            # 第三次抓取：新条目与出错条目同批
+            third = news_data("10-00", bad_rank=[2])
+            third.items["p2"].append(NewsItem(title="p2 新标题", source_id="p2", rank=4,
+                                              url="https://example.com/p2/new", crawl_time="10-00"))
+            assert backend.save_news_data(third)
+        finally:
+            backend.cleanup()
+
+        conn = sqlite3.connect(Path(tmp) / "news" / f"{DATE}.db")
+        try:
+            rows = dict(conn.execute("SELECT title, crawl_count FROM news_items").fetchall())
+            assert rows == {
+                "p1 标题 1": 3, "p1 标题 2": 1, "p1 标题 3": 3,
+                "p2 标题 1": 3, "p2 标题 2": 3, "p2 标题 3": 3,
+                "p2 新标题": 1,
+            }, rows
+            history = conn.execute("SELECT COUNT(*) FROM rank_history").fetchone()[0]
+            assert history == 6 + 5 + 6, history
+            totals = conn.execute("SELECT total_items FROM crawl_records ORDER BY crawl_time").fetchall()
+            assert [row[0] for row in totals] == [6, 5, 6], totals
+        finally:
+            conn.close()
+
+
+def rss_data(crawl_time: str, bad_title=None) -> RSSData:
+    """两个源各 3 条；bad_title 不为空时第一个源的第 2 条标题无法写入"""
+    items = {}
+    for feed_id in ("f1", "f2"):
+        items[feed_id] = [
+            RSSItem(title=f"{feed_id} 文章 {i}", feed_id=feed_id,
+                    url=f"https://example.com/{feed_id}/{i}", crawl_time=crawl_time)
+            for i in range(1, 4)
+        ]
+    if bad_title is not None:
+        items["f1"][1].title = bad_title
+    return RSSData(
+        date=DATE,
+        crawl_time=crawl_time,
+        items=items,
+        id_to_name={"f1": "源1", "f2": "源2"},
+        failed_ids=[],
+    )
+
+
+def _remote_backend(temp_dir: str) -> RemoteStorageBackend:
+    backend = RemoteStorageBackend(
+        bucket_name="test",
+        access_key_id="test",
+        secret_access_key="test",
+        endpoint_url="http://127.0.0.1:9000",
+        temp_dir=temp_dir,
+    )
+    backend.s3_client = MemoryS3()
+    return backend
+
+
+def test_bad_rss_item_is_skipped():
+    """一条 RSS 写入失败时只跳过该条，其余源和条目照常保存并抓取全文"""
+    for build in (
+        lambda tmp: LocalStorageBackend(data_dir=tmp, enable_txt=False, enable_html=False),
+        _remote_backend,
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = build(tmp)
+            fetched = []
+
+            def fetch_contents(targets):
+                fetched.extend(url for _, url in targets)
+                return {item_id: f"正文 {url}" for item_id, url in targets}
+
+            try:
+                assert backend.save_rss_data(rss_data("08-00", bad_title=["坏标题"]), fetch_contents=fetch_contents)
+                assert sorted(fetched) == sorted(
+                    f"https://example.com/{feed_id}/{i}" for feed_id in ("f1", "f2") for i in range(1, 4)
+                    if (feed_id, i) != ("f1", 2)
+                ), fetched
+
+                fetched.clear()
+                assert backend.save_rss_data(rss_data("09-00"), fetch_contents=fetch_contents)
+                assert fetched == ["https://example.com/f1/2"], fetched
+
+                conn = backend._get_connection(DATE, db_type="rss")
+                rows = dict(conn.execute("SELECT title, crawl_count FROM rss_items").fetchall())
+                assert rows == {
+                    "f1 文章 1": 2, "f1 文章 2": 1, "f1 文章 3": 2,
+                    "f2 文章 1": 2, "f2 文章 2": 2, "f2 文章 3": 2,
+                }, (type(backend).__name__, rows)
+                contents = conn.execute("SELECT COUNT(*) FROM article_contents").fetchone()[0]
+                assert contents == 6, contents
+            finally:
+                backend.cleanup()
+
+
+if __name__ == '__main__':
+    failures = 0
+    tests = (
+        test_bad_news_item_is_skipped,
+        test_bad_rss_item_is_skipped,
+    )
+    for test in tests:
+        try:
+            test()
+            print(f"\n✓ {test.__doc__}")
+        except AssertionError as e:
+            print(f"\n✗ {test.__doc__}: {e}")
+            failures += 1
+    sys.exit(1 if failures else 0)
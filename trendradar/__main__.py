@@ -9,17 +9,17 @@ TrendRadar 主程序
 import os
 import webbrowser
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 
 import requests
 
 from trendradar.context import AppContext
 from trendradar import __version__
-from trendradar.core import load_config
+from trendradar.core import load_config, TitleTable
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
 from trendradar.core.ai_analyzer import run_ai_analysis
 from trendradar.ai.processor import AIProcessor
-from trendradar.crawler import DataFetcher
+from trendradar.crawler import DataFetcher, ArticleScraper
 from trendradar.storage import convert_crawl_results_to_news_data
 from trendradar.utils.time import is_within_days
 
@@ -122,7 +122,11 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            pool_size=max(self.ctx.config.get("POOL_SIZE", 10), self.ctx.config.get("MAX_WORKERS", 5)),
+            transport_retries=self.ctx.config.get("TRANSPORT_RETRIES", 2),
+        )
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -239,33 +243,35 @@ class NewsAnalyzer:
     def _load_analysis_data(
         self,
         quiet: bool = False,
-    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+    ) -> Optional[Tuple[TitleTable, Dict, Optional[Dict], Dict, List, List, List]]:
+        """
+        统一的数据加载和预处理，使用当前监控平台列表过滤历史数据
+
+        当天数据以列式视图 TitleTable 返回，统计信息直接取自视图，
+        因此返回的 title_info 为 None。
+        """
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = self.ctx.platform_ids
             if not quiet:
                 print(f"当前监控平台: {current_platform_ids}")
 
-            all_results, id_to_name, title_info = self.ctx.read_today_titles(
-                current_platform_ids, quiet=quiet
-            )
+            title_table = self.ctx.read_today_title_table(current_platform_ids, quiet=quiet)
 
-            if not all_results:
+            if not title_table:
                 print("没有找到当天的数据")
                 return None
 
-            total_titles = sum(len(titles) for titles in all_results.values())
             if not quiet:
-                print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
+                print(f"读取到 {len(title_table)} 个标题（已按当前监控平台过滤）")
 
             new_titles = self.ctx.detect_new_titles(current_platform_ids, quiet=quiet)
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
             return (
-                all_results,
-                id_to_name,
-                title_info,
+                title_table,
+                title_table.id_to_name,
+                None,
                 new_titles,
                 word_groups,
                 filter_words,
@@ -304,9 +310,9 @@ class NewsAnalyzer:
 
     def _run_analysis_pipeline(
         self,
-        data_source: Dict,
+        data_source: Union[Dict, TitleTable],
         mode: str,
-        title_info: Dict,
+        title_info: Optional[Dict],
         new_titles: Dict,
         word_groups: List[Dict],
         filter_words: List[str],
@@ -607,7 +613,7 @@ class NewsAnalyzer:
         Path("output").mkdir(parents=True, exist_ok=True)
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            ids, self.request_interval, max_workers=self.ctx.config.get("MAX_WORKERS", 5)
         )
 
         # 转换为 NewsData 格式并保存到存储后端
@@ -707,14 +713,30 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 4),
+                cache_path=self._get_rss_cache_path() if rss_config.get("CONDITIONAL_GET", True) else None,
             )
 
             # 抓取数据
             rss_data = fetcher.fetch_all()
 
-            # 保存到存储后端，并传入 session 以便进行二次抓取
-            if self.storage_manager.save_rss_data(rss_data, fetcher.session):
+            # 保存到存储后端，写入后再由全文抓取器并发抓取新条目全文
+            scrape_config = rss_config.get("SCRAPE", {})
+            scraper = None
+            if scrape_config.get("ENABLED", True):
+                scraper = ArticleScraper(
+                    session=fetcher.session,
+                    max_workers=scrape_config.get("MAX_WORKERS", 4),
+                    timeout=scrape_config.get("TIMEOUT", 15),
+                    time_budget=scrape_config.get("TIME_BUDGET", 60),
+                    host_interval=scrape_config.get("HOST_INTERVAL", 1000) / 1000,
+                    max_per_host=scrape_config.get("MAX_PER_HOST", 2),
+                )
+            if self.storage_manager.save_rss_data(
+                rss_data, fetch_contents=scraper.scrape_all if scraper else None
+            ):
                 print(f"[RSS] 数据已保存到存储后端")
+                fetcher.commit_validators()
 
                 # 处理 RSS 数据（按模式过滤）并返回用于合并推送
                 return self._process_rss_data_by_mode(rss_data)
@@ -730,6 +752,11 @@ class NewsAnalyzer:
             print(f"[RSS] 抓取失败: {e}")
             return None, None
 
+    def _get_rss_cache_path(self) -> str:
+        """获取 RSS 条件请求缓存文件路径（与 RSS 数据库同目录）"""
+        data_dir = self.ctx.config.get("STORAGE", {}).get("LOCAL", {}).get("DATA_DIR", "output")
+        return str(Path(data_dir) / "rss" / "feed_cache.json")
+
     def _process_rss_data_by_mode(self, rss_data) -> Tuple[Optional[List[Dict]], Optional[List[Dict]]]:
         """
         按报告模式处理 RSS 数据，返回与热榜相同格式的统计结构
@@ -1022,7 +1049,7 @@ class NewsAnalyzer:
                 ) = analysis_data
 
                 print(
-                    f"current模式：使用过滤后的历史数据，包含平台：{list(all_results.keys())}"
+                    f"current模式：使用过滤后的历史数据，包含平台：{all_results.platform_ids}"
                 )
 
                 stats, html_file = self._run_analysis_pipeline(
@@ -5,9 +5,11 @@
 提供配置上下文类，封装所有依赖配置的操作，消除全局状态和包装函数。
 """
 
+import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from trendradar.utils.time import (
     get_configured_time,
@@ -21,26 +23,36 @@ from trendradar.core import (
     matches_word_groups,
     save_titles_to_file,
     read_all_today_titles,
+    read_today_title_table,
     detect_latest_new_titles,
     is_first_crawl_today,
     count_word_frequency,
+    TitleTable,
 )
 from trendradar.report import (
     clean_title,
     prepare_report_data,
     generate_html_report,
     render_html_content,
+    iter_html_chunks,
 )
 from trendradar.notification import (
     render_feishu_content,
     render_dingtalk_content,
-    split_content_into_batches,
+    build_message_layout,
+    resolve_max_bytes,
+    MessageLayout,
     NotificationDispatcher,
     PushRecordManager,
 )
+from trendradar.report.fragment_cache import FragmentCache
 from trendradar.storage import get_storage_manager
 
 
+# 同一次运行中缓存的推送排版份数（各格式类型 × 报告数据）
+_LAYOUT_CACHE_SIZE = 16
+
+
 class AppContext:
     """
     应用上下文类
@@ -72,6 +84,11 @@ class AppContext:
         """
         self.config = config
         self._storage_manager = None
+        self._fragment_cache: Optional[FragmentCache] = None
+        # 频率词配置：文件路径 -> ((mtime_ns, size), 解析结果)
+        self._frequency_cache: Dict[str, Tuple[Tuple[int, int], Tuple[List[Dict], List[str], List[str]]]] = {}
+        # 本次运行中已排版的推送内容：输入 -> (输入对象, 排版结果)
+        self._layout_cache: "OrderedDict[Tuple, Tuple[Tuple, MessageLayout]]" = OrderedDict()
 
     # === 配置访问 ===
 
@@ -164,12 +181,17 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "sync_mode": remote_config.get("SYNC_MODE", "full"),
+                    "compact_every": remote_config.get("COMPACT_EVERY", 24),
+                    "cache_dir": remote_config.get("CACHE_DIR", ""),
+                    "cache_max_mb": remote_config.get("CACHE_MAX_MB", 512),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
+                sqlite_profile=storage_config.get("SQLITE"),
             )
         return self._storage_manager
 
@@ -192,6 +214,12 @@ class AppContext:
         """读取当天所有标题"""
         return read_all_today_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
 
+    def read_today_title_table(
+        self, platform_ids: Optional[List[str]] = None, quiet: bool = False
+    ) -> TitleTable:
+        """读取当天所有标题（列式视图，可直接用于统计）"""
+        return read_today_title_table(self.get_storage_manager(), platform_ids, quiet=quiet)
+
     def detect_new_titles(
         self, platform_ids: Optional[List[str]] = None, quiet: bool = False
     ) -> Dict:
@@ -207,8 +235,31 @@ class AppContext:
     def load_frequency_words(
         self, frequency_file: Optional[str] = None
     ) -> Tuple[List[Dict], List[str], List[str]]:
-        """加载频率词配置"""
-        return load_frequency_words(frequency_file)
+        """
+        加载频率词配置（按文件修改时间缓存）
+
+        文件未变化时返回同一份解析结果，编译后的匹配器（以配置对象为键缓存）也随之复用；
+        调用方不应原地修改返回的列表。
+        """
+        if frequency_file is None:
+            frequency_file = os.environ.get(
+                "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
+            )
+
+        try:
+            stat = os.stat(frequency_file)
+        except FileNotFoundError:
+            self._frequency_cache.pop(frequency_file, None)
+            return load_frequency_words(frequency_file)
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._frequency_cache.get(frequency_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        result = load_frequency_words(frequency_file)
+        self._frequency_cache[frequency_file] = (stamp, result)
+        return result
 
     def matches_word_groups(
         self,
@@ -224,7 +275,7 @@ class AppContext:
 
     def count_frequency(
         self,
-        results: Dict,
+        results: Union[Dict, TitleTable],
         word_groups: List[Dict],
         filter_words: List[str],
         id_to_name: Dict,
@@ -262,6 +313,7 @@ class AppContext:
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         mode: str = "daily",
+        ai_themes: Optional[List[Dict]] = None,
     ) -> Dict:
         """准备报告数据"""
         return prepare_report_data(
@@ -273,8 +325,15 @@ class AppContext:
             rank_threshold=self.rank_threshold,
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
+            ai_themes=ai_themes,
         )
 
+    def get_fragment_cache(self) -> FragmentCache:
+        """获取报告分组片段缓存（持久化到 output/.cache，跨运行复用未变化分组的 HTML）"""
+        if self._fragment_cache is None:
+            self._fragment_cache = FragmentCache(Path("output") / ".cache" / "report_fragments.json")
+        return self._fragment_cache
+
     def generate_html(
         self,
         stats: List[Dict],
@@ -303,11 +362,9 @@ class AppContext:
             output_dir="output",
             date_folder=self.format_date(),
             time_filename=self.format_time(),
-            render_html_func=lambda *args, **kwargs: self.render_html(*args, rss_items=rss_items, rss_new_items=rss_new_items, **kwargs),
-            matches_word_groups_func=self.matches_word_groups,
-            load_frequency_words_func=self.load_frequency_words,
+            render_html_func=lambda *args, **kwargs: self.render_html_chunks(*args, rss_items=rss_items, rss_new_items=rss_new_items, **kwargs),
             enable_index_copy=True,
-            ai_themes=ai_themes,
+            report_data=self.prepare_report(stats, failed_ids, new_titles, id_to_name, mode, ai_themes),
         )
 
     def render_html(
@@ -332,6 +389,32 @@ class AppContext:
             rss_items=rss_items,
             rss_new_items=rss_new_items,
             display_mode=self.display_mode,
+            fragment_cache=self.get_fragment_cache(),
+        )
+
+    def render_html_chunks(
+        self,
+        report_data: Dict,
+        total_titles: int,
+        is_daily_summary: bool = False,
+        mode: str = "daily",
+        update_info: Optional[Dict] = None,
+        rss_items: Optional[List[Dict]] = None,
+        rss_new_items: Optional[List[Dict]] = None,
+    ) -> Iterator[str]:
+        """按片段渲染HTML内容（用于直接写入文件）"""
+        return iter_html_chunks(
+            report_data=report_data,
+            total_titles=total_titles,
+            is_daily_summary=is_daily_summary,
+            mode=mode,
+            update_info=update_info,
+            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            get_time_func=self.get_time,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            display_mode=self.display_mode,
+            fragment_cache=self.get_fragment_cache(),
         )
 
     # === 通知内容渲染 ===
@@ -379,6 +462,9 @@ class AppContext:
     ) -> List[str]:
         """分批处理消息内容（支持热榜+RSS合并）
 
+        排版结果按格式类型在同一次运行内复用，
+        多个渠道、多个账号推送同一份报告时只按各自的字节上限重新分批。
+
         Args:
             report_data: 报告数据
             format_type: 格式类型
@@ -391,17 +477,48 @@ class AppContext:
         Returns:
             分批后的消息内容列表
         """
-        return split_content_into_batches(
-            report_data=report_data,
-            format_type=format_type,
+        if max_bytes is None:
+            max_bytes = resolve_max_bytes(
+                format_type,
+                {
+                    "dingtalk": self.config.get("DINGTALK_BATCH_SIZE", 20000),
+                    "feishu": self.config.get("FEISHU_BATCH_SIZE", 29000),
+                    "default": self.config.get("MESSAGE_BATCH_SIZE", 4000),
+                },
+            )
+        layout = self.get_message_layout(
+            report_data, format_type, update_info, mode, rss_items, rss_new_items
+        )
+        return layout.pack(max_bytes)
+
+    def get_message_layout(
+        self,
+        report_data: Dict,
+        format_type: str,
+        update_info: Optional[Dict] = None,
+        mode: str = "daily",
+        rss_items: Optional[list] = None,
+        rss_new_items: Optional[list] = None,
+    ) -> MessageLayout:
+        """
+        获取推送内容的排版结果（同一次运行内复用）
+
+        以输入对象本身和格式类型为键缓存，同一格式类型的多个账号只排版一次，
+        各账号、各渠道只按自己的字节上限调用 pack 分批。
+        批次尾部的更新时间取首次排版时的时间。
+        """
+        sources = (report_data, update_info, rss_items, rss_new_items)
+        key = (*(id(source) for source in sources), format_type, mode)
+        cached = self._layout_cache.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            self._layout_cache.move_to_end(key)
+            return cached[1]
+
+        layout = build_message_layout(
+            report_data,
+            format_type,
             update_info=update_info,
-            max_bytes=max_bytes,
             mode=mode,
-            batch_sizes={
-                "dingtalk": self.config.get("DINGTALK_BATCH_SIZE", 20000),
-                "feishu": self.config.get("FEISHU_BATCH_SIZE", 29000),
-                "default": self.config.get("MESSAGE_BATCH_SIZE", 4000),
-            },
             feishu_separator=self.config.get("FEISHU_MESSAGE_SEPARATOR", "---"),
             reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
             get_time_func=self.get_time,
@@ -411,6 +528,12 @@ class AppContext:
             display_mode=self.display_mode,
         )
 
+        # 保存输入对象的强引用，避免对象被回收后 id 被复用
+        self._layout_cache[key] = (sources, layout)
+        while len(self._layout_cache) > _LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        return layout
+
     # === 通知发送 ===
 
     def create_notification_dispatcher(self) -> NotificationDispatcher:
@@ -432,6 +555,9 @@ class AppContext:
 
     def cleanup(self):
         """清理资源"""
+        if self._fragment_cache:
+            self._fragment_cache.save()
+            self._fragment_cache = None
         if self._storage_manager:
             self._storage_manager.cleanup_old_data()
             self._storage_manager.cleanup()
@@ -15,10 +15,12 @@ from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
     read_all_today_titles,
+    read_today_title_table,
     detect_latest_new_titles_from_storage,
     detect_latest_new_titles,
     is_first_crawl_today,
 )
+from trendradar.core.titles import TitleTable
 from trendradar.core.analyzer import (
     calculate_news_weight,
     format_time_display,
@@ -39,10 +41,12 @@ __all__ = [
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
     "read_all_today_titles",
+    "read_today_title_table",
     "detect_latest_new_titles_from_storage",
     "detect_latest_new_titles",
     "is_first_crawl_today",
     # 统计分析
+    "TitleTable",
     "calculate_news_weight",
     "format_time_display",
     "count_word_frequency",
@@ -122,17 +122,6 @@ def _save_analysis_results(storage: LocalStorageBackend, results: Dict[int, AIAn
 
         print(f"[AI Analyzer] 开始保存 {len(results)} 个分析结果...")
 
-        cursor.execute("PRAGMA table_info(analysis_themes)")
-        theme_columns = {row["name"] for row in cursor.fetchall()}
-        has_tags_column = "tags" in theme_columns
-        if not has_tags_column:
-            try:
-                cursor.execute("ALTER TABLE analysis_themes ADD COLUMN tags TEXT")
-                conn.commit()
-                has_tags_column = True
-            except Exception as e:
-                print(f"[AI Analyzer] 添加 tags 字段失败，将跳过标签保存: {e}")
-        
         # 1. 构建标签到文章的映射
         tag_to_articles: Dict[str, List[int]] = defaultdict(list)
         for article_id, result in results.items():
@@ -233,33 +222,19 @@ def _save_analysis_results(storage: LocalStorageBackend, results: Dict[int, AIAn
             impact = representative_analysis.impact
             
             # 保存聚合后的主题
-            if has_tags_column:
-                cursor.execute("""
-                    INSERT INTO analysis_themes 
-                    (title, summary, key_points, category, importance, impact, tags)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    common_title,
-                    aggregated_summary,
-                    json.dumps(unique_key_points, ensure_ascii=False),
-                    category,
-                    importance,
-                    impact,
-                    json.dumps(aggregated_tags, ensure_ascii=False),
-                ))
-            else:
-                cursor.execute("""
-                    INSERT INTO analysis_themes 
-                    (title, summary, key_points, category, importance, impact)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    common_title,
-                    aggregated_summary,
-                    json.dumps(unique_key_points, ensure_ascii=False),
-                    category,
-                    importance,
-                    impact
-                ))
+            cursor.execute("""
+                INSERT INTO analysis_themes 
+                (title, summary, key_points, category, importance, impact, tags)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                common_title,
+                aggregated_summary,
+                json.dumps(unique_key_points, ensure_ascii=False),
+                category,
+                importance,
+                impact,
+                json.dumps(aggregated_tags, ensure_ascii=False),
+            ))
             
             # 获取新创建的 theme ID
             theme_id = cursor.lastrowid
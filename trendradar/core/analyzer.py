@@ -8,9 +8,10 @@
 - count_word_frequency: 统计词频
 """
 
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable, Union
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.matcher import get_frequency_matcher
+from trendradar.core.titles import TitleTable
 
 
 def calculate_news_weight(
@@ -87,8 +88,15 @@ def format_time_display(
         return f"[{first_display} ~ {last_display}]"
 
 
+def _count_titles(results: Union[Dict, TitleTable]) -> int:
+    """统计输入数据中的标题总数"""
+    if isinstance(results, TitleTable):
+        return len(results)
+    return sum(len(titles) for titles in results.values())
+
+
 def count_word_frequency(
-    results: Dict,
+    results: Union[Dict, TitleTable],
     word_groups: List[Dict],
     filter_words: List[str],
     id_to_name: Dict,
@@ -108,7 +116,8 @@ def count_word_frequency(
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
 
     Args:
-        results: 抓取结果 {source_id: {title: title_data}}
+        results: 抓取结果 {source_id: {title: title_data}}，
+            或当天数据的列式视图 TitleTable（此时统计信息直接取自视图，无需 title_info）
         word_groups: 词组配置列表
         filter_words: 过滤词列表
         id_to_name: ID 到名称的映射
@@ -151,19 +160,40 @@ def count_word_frequency(
 
     is_first_today = is_first_crawl_func()
 
+    # 直接传入列式视图时，标题统计信息也从视图中读取
+    table = results if isinstance(results, TitleTable) else None
+
+    if title_info is None:
+        title_info = {}
+    if new_titles is None:
+        new_titles = {}
+
     # 确定处理的数据源和新增标记逻辑
+    # table_rows 不为 None 时处理列式视图中的这些行，否则处理 results_to_process 字典
+    table_rows: Optional[List[int]] = None
+    results_to_process: Dict = {}
     if mode == "incremental":
         if is_first_today:
             # 增量模式 + 当天第一次：处理所有新闻，都标记为新增
-            results_to_process = results
+            if table is not None:
+                table_rows = table.rows()
+            else:
+                results_to_process = results
             all_news_are_new = True
         else:
             # 增量模式 + 当天非第一次：只处理新增的新闻
-            results_to_process = new_titles if new_titles else {}
+            results_to_process = new_titles
             all_news_are_new = True
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
-        if title_info:
+        if table is not None:
+            latest_time = table.latest_time()
+            table_rows = table.rows(latest_time) if latest_time else table.rows()
+            if latest_time and not quiet:
+                print(
+                    f"当前榜单模式：最新时间 {latest_time}，筛选出 {len(table_rows)} 条当前榜单新闻"
+                )
+        elif title_info:
             latest_time = None
             for source_titles in title_info.values():
                 for title_data in source_titles.values():
@@ -174,7 +204,6 @@ def count_word_frequency(
 
             # 只处理 last_time 等于最新时间的新闻
             if latest_time:
-                results_to_process = {}
                 for source_id, source_titles in results.items():
                     if source_id in title_info:
                         filtered_titles = {}
@@ -197,9 +226,12 @@ def count_word_frequency(
         all_news_are_new = False
     else:
         # 当日汇总模式：处理所有新闻
-        results_to_process = results
+        if table is not None:
+            table_rows = table.rows()
+        else:
+            results_to_process = results
         all_news_are_new = False
-        total_input_news = sum(len(titles) for titles in results.values())
+        total_input_news = _count_titles(results)
         filter_status = (
             "全部显示"
             if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
@@ -209,160 +241,116 @@ def count_word_frequency(
 
     word_stats = {}
     total_titles = 0
-    processed_titles = {}
     matched_new_count = 0
 
-    if title_info is None:
-        title_info = {}
-    if new_titles is None:
-        new_titles = {}
-
     for group in word_groups:
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
-    for source_id, titles_data in results_to_process.items():
-        total_titles += len(titles_data)
+    matcher = get_frequency_matcher(word_groups, filter_words, global_filters)
 
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
-
-        for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
-                continue
-
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
+    # 统一遍历：(source_id, title, title_data, 视图行号)
+    if table_rows is not None:
+        source_ids, titles = table.source_ids, table.titles
+        rows_iter = ((source_ids[row], titles[row], None, row) for row in table_rows)
+    else:
+        rows_iter = (
+            (source_id, title, title_data, None)
+            for source_id, titles_data in results_to_process.items()
+            for title, title_data in titles_data.items()
+        )
 
-            if not matches_frequency_words:
-                continue
-
-            # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
-                matched_new_count += 1
-
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+    for source_id, title, title_data, row in rows_iter:
+        total_titles += 1
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+        # 一次匹配得到全部命中的词组（已处理全局过滤和过滤词）
+        matched_groups = matcher.match_groups(title)
+        if not matched_groups:
+            continue
 
-                break
+        # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
+        if (mode == "incremental" and all_news_are_new) or (
+            mode == "current" and is_first_today
+        ):
+            matched_new_count += 1
+
+        if title_data is None:
+            title_data = {}
+        source_ranks = title_data.get("ranks", [])
+        source_url = title_data.get("url", "")
+        source_mobile_url = title_data.get("mobileUrl", "")
+
+        # 归入第一个匹配的词组
+        group_key = word_groups[matched_groups[0]]["group_key"]
+        word_stats[group_key]["count"] += 1
+        if source_id not in word_stats[group_key]["titles"]:
+            word_stats[group_key]["titles"][source_id] = []
+
+        first_time = ""
+        last_time = ""
+        count_info = 1
+        ranks = source_ranks if source_ranks else []
+        url = source_url
+        mobile_url = source_mobile_url
+
+        # 从历史统计信息中获取完整数据（列式视图或 title_info 字典）
+        if row is None and table is not None:
+            row = table.find(source_id, title)
+        if row is not None:
+            first_time = table.first_times[row]
+            last_time = table.last_times[row]
+            count_info = table.counts[row]
+            if table.ranks[row]:
+                ranks = table.ranks[row]
+            url = table.urls[row]
+            mobile_url = table.mobile_urls[row]
+        elif source_id in title_info and title in title_info[source_id]:
+            info = title_info[source_id][title]
+            first_time = info.get("first_time", "")
+            last_time = info.get("last_time", "")
+            count_info = info.get("count", 1)
+            if "ranks" in info and info["ranks"]:
+                ranks = info["ranks"]
+            url = info.get("url", source_url)
+            mobile_url = info.get("mobileUrl", source_mobile_url)
+
+        if not ranks:
+            ranks = [99]
+
+        time_display = format_time_display(first_time, last_time, convert_time_func)
+
+        source_name = id_to_name.get(source_id, source_id)
+
+        # 判断是否为新增
+        is_new = False
+        if all_news_are_new:
+            # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+            is_new = True
+        elif new_titles and source_id in new_titles:
+            # 检查是否在新增列表中
+            new_titles_for_source = new_titles[source_id]
+            is_new = title in new_titles_for_source
+
+        word_stats[group_key]["titles"][source_id].append(
+            {
+                "title": title,
+                "source_name": source_name,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": time_display,
+                "count": count_info,
+                "ranks": ranks,
+                "rank_threshold": rank_threshold,
+                "url": url,
+                "mobileUrl": mobile_url,
+                "is_new": is_new,
+            }
+        )
 
     # 最后统一打印汇总信息
     if mode == "incremental":
         if is_first_today:
-            total_input_news = sum(len(titles) for titles in results.values())
+            total_input_news = _count_titles(results)
             filter_status = (
                 "全部显示"
                 if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
@@ -391,7 +379,10 @@ def count_word_frequency(
                 if not quiet:
                     print("增量模式：未检测到新增新闻")
     elif mode == "current":
-        total_input_news = sum(len(titles) for titles in results_to_process.values())
+        if table_rows is not None:
+            total_input_news = len(table_rows)
+        else:
+            total_input_news = sum(len(titles) for titles in results_to_process.values())
         if is_first_today:
             filter_status = (
                 "全部显示"
@@ -565,6 +556,8 @@ def count_rss_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": []}
 
+    matcher = get_frequency_matcher(word_groups, filter_words, global_filters)
+
     total_items = len(rss_items)
     processed_urls = set()  # 用于去重
 
@@ -587,67 +580,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 一次匹配得到全部命中的词组，条目只归入第一个匹配的词组
+        matched_groups = matcher.match_groups(title)
+        if not matched_groups:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[matched_groups[0]]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
@@ -5,6 +5,7 @@
 提供数据读取、保存和检测功能：
 - save_titles_to_file: 保存标题到 TXT 文件
 - read_all_today_titles: 从存储后端读取当天所有标题
+- read_today_title_table: 从存储后端读取当天所有标题（列式视图）
 - detect_latest_new_titles: 检测最新批次的新增标题
 
 Author: TrendRadar Team
@@ -13,6 +14,8 @@ Author: TrendRadar Team
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
 
+from trendradar.core.titles import TitleTable
+
 
 def save_titles_to_file(
     results: Dict,
@@ -179,6 +182,42 @@ def read_all_today_titles(
     return all_results, final_id_to_name, title_info
 
 
+def read_today_title_table(
+    storage_manager,
+    current_platform_ids: Optional[List[str]] = None,
+    quiet: bool = False,
+) -> TitleTable:
+    """
+    读取当天所有标题，返回列式视图
+
+    与 read_all_today_titles 相同的数据，但不展开成 all_results / title_info
+    两份嵌套字典，可直接传给 count_word_frequency。
+
+    Args:
+        storage_manager: 存储管理器实例
+        current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
+        quiet: 是否静默模式（不打印日志）
+
+    Returns:
+        TitleTable: 当天标题（读取失败或无数据时为空表）
+    """
+    table = TitleTable()
+    try:
+        news_data = storage_manager.get_today_all_data()
+        if news_data and news_data.items:
+            table = TitleTable.from_news_data(news_data, current_platform_ids)
+    except Exception as e:
+        print(f"[存储] 从存储后端读取数据失败: {e}")
+
+    if not quiet:
+        if table:
+            print(f"[存储] 已从存储后端读取 {len(table)} 条标题")
+        else:
+            print("[存储] 当天暂无数据")
+
+    return table
+
+
 def detect_latest_new_titles_from_storage(
     storage_manager,
     current_platform_ids: Optional[List[str]] = None,
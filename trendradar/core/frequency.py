@@ -10,12 +10,16 @@
 - 最大显示数量（@前缀）
 - 正则表达式（/pattern/ 语法）
 - 显示名称（=> 备注 语法）
+
+加载时会把配置编译为匹配器，匹配逻辑见 trendradar.core.matcher
 """
 
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional
+
+from trendradar.core.matcher import get_frequency_matcher
 
 
 def _parse_word(word: str) -> Dict:
@@ -65,29 +69,6 @@ def _parse_word(word: str) -> Dict:
     return {"word": word, "is_regex": False, "pattern": None, "display_name": display_name}
 
 
-def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
-    """
-    检查词是否在标题中匹配
-
-    Args:
-        word_config: 词配置（字符串或字典）
-        title_lower: 小写的标题
-
-    Returns:
-        是否匹配
-    """
-    if isinstance(word_config, str):
-        # 向后兼容：纯字符串
-        return word_config.lower() in title_lower
-
-    if word_config.get("is_regex") and word_config.get("pattern"):
-        # 正则匹配
-        return bool(word_config["pattern"].search(title_lower))
-    else:
-        # 子字符串匹配
-        return word_config["word"].lower() in title_lower
-
-
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str], List[str]]:
@@ -213,6 +194,9 @@ def load_frequency_words(
                 }
             )
 
+    # 预编译匹配器，后续以同一份配置调用 matches_word_groups 时直接复用
+    get_frequency_matcher(processed_groups, filter_words, global_filters)
+
     return processed_groups, filter_words, global_filters
 
 
@@ -225,6 +209,8 @@ def matches_word_groups(
     """
     检查标题是否匹配词组规则
 
+    使用编译后的匹配器（见 trendradar.core.matcher），同一份配置只编译一次
+
     Args:
         title: 标题文本
         word_groups: 词组列表
@@ -234,49 +220,4 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
-
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    # 过滤词检查（兼容新旧格式）
-    for filter_item in filter_words:
-        if _word_matches(filter_item, title_lower):
-            return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                _word_matches(req_item, title_lower) for req_item in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                _word_matches(normal_item, title_lower) for normal_item in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return get_frequency_matcher(word_groups, filter_words, global_filters).matches(title)
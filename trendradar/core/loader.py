@@ -56,6 +56,9 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "MAX_WORKERS": _get_env_int("CRAWLER_MAX_WORKERS") or crawler_config.get("max_workers", 5),
+        "POOL_SIZE": crawler_config.get("pool_size", 10),
+        "TRANSPORT_RETRIES": crawler_config.get("transport_retries", 2),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enabled", True),
@@ -145,6 +148,9 @@ def _load_rss_config(config_data: Dict) -> Dict:
     # 新鲜度过滤配置
     freshness_filter = rss.get("freshness_filter", {})
 
+    # 全文抓取配置
+    scrape_config = advanced_rss.get("scrape", {})
+
     # 验证并设置 max_age_days 默认值
     raw_max_age = freshness_filter.get("max_age_days", 3)
     try:
@@ -160,6 +166,8 @@ def _load_rss_config(config_data: Dict) -> Dict:
     return {
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 4),
+        "CONDITIONAL_GET": advanced_rss.get("conditional_get", True),
         "TIMEOUT": advanced_rss.get("timeout", 15),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
@@ -171,6 +179,14 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "NOTIFICATION": {
             "ENABLED": advanced_rss.get("notification_enabled", False),
         },
+        "SCRAPE": {
+            "ENABLED": scrape_config.get("enabled", True),
+            "MAX_WORKERS": scrape_config.get("max_workers", 4),
+            "TIMEOUT": scrape_config.get("timeout", 15),
+            "TIME_BUDGET": scrape_config.get("time_budget", 60),
+            "HOST_INTERVAL": scrape_config.get("host_interval", 1000),
+            "MAX_PER_HOST": scrape_config.get("max_per_host", 2),
+        },
     }
 
 
@@ -181,6 +197,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    sqlite = storage.get("sqlite", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
@@ -204,11 +221,25 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            # full: 每次上传整个数据库；delta: 只上传变更集，累计 compact_every 个后合并为快照
+            "SYNC_MODE": _get_env_str("REMOTE_SYNC_MODE") or remote.get("sync_mode", "full"),
+            "COMPACT_EVERY": _get_env_int("REMOTE_COMPACT_EVERY") or remote.get("compact_every", 24),
+            # 远程数据库本地缓存（目录为空时使用 {data_dir}/.remote_cache，上限为 0 时不缓存）
+            "CACHE_DIR": _get_env_str("REMOTE_CACHE_DIR") or remote.get("cache_dir", ""),
+            "CACHE_MAX_MB": _get_env_int("REMOTE_CACHE_MAX_MB", remote.get("cache_max_mb", 512)),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
         },
+        "SQLITE": {
+            "JOURNAL_MODE": _get_env_str("SQLITE_JOURNAL_MODE") or sqlite.get("journal_mode", "WAL"),
+            "SYNCHRONOUS": _get_env_str("SQLITE_SYNCHRONOUS") or sqlite.get("synchronous", "NORMAL"),
+            "MMAP_SIZE": sqlite.get("mmap_size", 268435456),
+            "CACHE_SIZE": sqlite.get("cache_size", -16000),
+            "TEMP_STORE": sqlite.get("temp_store", "MEMORY"),
+            "BUSY_TIMEOUT": sqlite.get("busy_timeout", 5000),
+        },
     }
 
 
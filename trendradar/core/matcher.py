@@ -0,0 +1,383 @@
+# coding=utf-8
+"""
+频率词匹配引擎
+
+将 load_frequency_words 返回的词组配置编译为匹配器：
+- 普通词（含全局过滤词）放入一个 Aho-Corasick 自动机，一次扫描标题即可找出全部命中词
+- 正则词合并为一个交替表达式（只编译一次）作为预筛：大多数标题不命中任何正则词，一次搜索即可跳过；
+  命中时再逐个搜索正则词，结果与逐词检查一致
+- 通过"词 -> 词组"倒排索引，只评估至少命中一个词的词组
+
+匹配成本与标题长度（以及命中的词数）相关，而与词表大小基本无关。
+匹配语义与逐词检查完全一致：普通词为忽略大小写的子串匹配，
+正则词在小写标题上以 IGNORECASE 搜索。
+"""
+
+import re
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Union
+
+
+# 依赖分组编号的正则（反向引用、条件分组）不能安全地合并进交替表达式
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# 不含正则元字符的表达式只是若干字面量的"或"，可以直接放进自动机
+_REGEX_META_CHARS = set("\\.^$*+?{}[]()")
+
+# 正则词的编译标志（_parse_word 统一使用 IGNORECASE），预筛表达式使用相同标志
+_GATE_FLAGS = re.compile("", re.IGNORECASE).flags
+
+
+class AhoCorasick:
+    """Aho-Corasick 多模式子串匹配自动机"""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        构建自动机
+
+        Args:
+            words: 模式串列表（应为非空字符串，索引即模式 ID）
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for word_id, word in enumerate(words):
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (word_id,)
+
+        # 广度优先构建失败指针，并合并后缀状态的输出
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[int]:
+        """
+        找出在文本中出现的全部模式
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            出现过的模式 ID 集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class FrequencyMatcher:
+    """编译后的频率词匹配器"""
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        """
+        编译词组配置
+
+        Args:
+            word_groups: 词组列表（load_frequency_words 的第一个返回值）
+            filter_words: 过滤词列表（字符串或 _parse_word 返回的字典）
+            global_filters: 全局过滤词列表
+        """
+        self._plain_ids: Dict[str, int] = {}
+        self._regex_ids: Dict[Tuple[str, int], int] = {}
+        self._plain_words: List[str] = []
+        self._plain_terms: List[int] = []
+        self._regex_terms: List[Tuple[int, Pattern]] = []
+        self._always_hit: Set[int] = set()
+        self._term_count = 0
+
+        self.has_groups = bool(word_groups)
+        self._global_ids: FrozenSet[int] = frozenset(
+            self._add_plain(word) for word in (global_filters or [])
+        )
+        self._filter_ids: FrozenSet[int] = frozenset(
+            self._add_term(item) for item in filter_words
+        )
+
+        self._groups: List[Tuple[FrozenSet[int], FrozenSet[int]]] = []
+        self._term_groups: Dict[int, List[int]] = {}
+        # 没有任何词的词组（如"全部新闻"虚拟词组）匹配所有标题
+        self._unconditional_groups: List[int] = []
+        for group_index, group in enumerate(word_groups):
+            required = frozenset(self._add_term(item) for item in group.get("required", []))
+            normal = frozenset(self._add_term(item) for item in group.get("normal", []))
+            self._groups.append((required, normal))
+            if not required and not normal:
+                self._unconditional_groups.append(group_index)
+            for term_id in required | normal:
+                self._term_groups.setdefault(term_id, []).append(group_index)
+
+        self._automaton = AhoCorasick(self._plain_words) if self._plain_words else None
+        self._build_regex()
+
+    # === 编译 ===
+
+    def _add_plain(self, word: str) -> int:
+        """登记普通词，返回词 ID（相同的小写词共享一个 ID）"""
+        word = word.lower()
+        term_id = self._plain_ids.get(word)
+        if term_id is None:
+            term_id = self._term_count
+            self._term_count += 1
+            self._plain_ids[word] = term_id
+            if word:
+                self._plain_words.append(word)
+                self._plain_terms.append(term_id)
+            else:
+                # 空字符串是任何标题的子串
+                self._always_hit.add(term_id)
+        return term_id
+
+    def _add_term(self, word_config: Union[str, Dict]) -> int:
+        """登记普通词或正则词，返回词 ID"""
+        if isinstance(word_config, str):
+            return self._add_plain(word_config)
+
+        pattern = word_config.get("pattern") if word_config.get("is_regex") else None
+        if pattern is None:
+            return self._add_plain(word_config["word"])
+
+        key = (pattern.pattern, pattern.flags)
+        term_id = self._regex_ids.get(key)
+        if term_id is None:
+            term_id = self._term_count
+            self._term_count += 1
+            self._regex_ids[key] = term_id
+
+            literals = self._literal_alternatives(pattern.pattern)
+            if literals is None:
+                self._regex_terms.append((term_id, pattern))
+            else:
+                # 如 /华为|鸿蒙|HarmonyOS/：每个分支作为普通词放入自动机，命中任一即命中该词
+                for literal in literals:
+                    if literal:
+                        self._plain_words.append(literal.lower())
+                        self._plain_terms.append(term_id)
+                    else:
+                        self._always_hit.add(term_id)
+        return term_id
+
+    @staticmethod
+    def _literal_alternatives(source: str) -> Optional[List[str]]:
+        """
+        若正则只是字面量的"或"，返回各分支；否则返回 None
+
+        只接受 ASCII 或无大小写区分的字符（如中文），保证小写子串匹配
+        与 IGNORECASE 正则匹配的结果一致（仅 ſ、K 等个别 Unicode 折叠字符例外）。
+        """
+        for char in source:
+            if char in _REGEX_META_CHARS:
+                return None
+            if not char.isascii() and char.lower() != char.upper():
+                return None
+        return source.split("|")
+
+    def _build_regex(self) -> None:
+        """
+        把正则词编译为一个预筛交替表达式
+
+        交替表达式在某处匹配当且仅当至少一个分支能匹配，因此可以判断标题是否命中任一正则词，
+        但同一位置只报告第一个分支、且不报告重叠的匹配，命中的具体正则词仍需逐个搜索。
+        预筛表达式不含捕获分组，re 可以按各分支的首字符快速跳过不可能匹配的位置。
+        """
+        self._regex_gate: Optional[Pattern] = None
+        self._gated: List[Tuple[int, Pattern]] = []
+        self._standalone: List[Tuple[int, Pattern]] = []
+
+        for term_id, pattern in self._regex_terms:
+            # 依赖分组编号或带其他标志的正则不能放进同一个表达式
+            if _GROUP_REFERENCE_RE.search(pattern.pattern) or pattern.flags != _GATE_FLAGS:
+                self._standalone.append((term_id, pattern))
+            else:
+                self._gated.append((term_id, pattern))
+        if not self._gated:
+            return
+
+        try:
+            self._regex_gate = re.compile(
+                "|".join(f"(?:{pattern.pattern})" for _, pattern in self._gated), _GATE_FLAGS
+            )
+        except re.error:
+            # 无法合并（如包含同名分组或行内全局标志），退回逐个匹配
+            self._standalone.extend(self._gated)
+            self._gated = []
+
+    # === 匹配 ===
+
+    def find_terms(self, title_lower: str) -> Set[int]:
+        """
+        找出标题命中的全部词 ID
+
+        Args:
+            title_lower: 小写的标题
+
+        Returns:
+            命中的词 ID 集合
+        """
+        hits = set(self._always_hit)
+
+        if self._automaton is not None:
+            plain_terms = self._plain_terms
+            hits.update(plain_terms[i] for i in self._automaton.find_all(title_lower))
+
+        if self._regex_gate is not None and self._regex_gate.search(title_lower):
+            for term_id, pattern in self._gated:
+                if pattern.search(title_lower):
+                    hits.add(term_id)
+
+        for term_id, pattern in self._standalone:
+            if pattern.search(title_lower):
+                hits.add(term_id)
+
+        return hits
+
+    @staticmethod
+    def _normalize_title(title) -> Optional[str]:
+        """标题类型防御并转小写，空标题返回 None"""
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+        return title.lower()
+
+    def _is_filtered(self, hits: Set[int]) -> bool:
+        """是否命中全局过滤词或过滤词"""
+        if self._global_ids and not self._global_ids.isdisjoint(hits):
+            return True
+        return bool(self._filter_ids) and not self._filter_ids.isdisjoint(hits)
+
+    def _matched_groups(self, hits: Set[int]) -> List[int]:
+        """根据命中词计算匹配的词组索引（升序）"""
+        candidates = set(self._unconditional_groups)
+        term_groups = self._term_groups
+        for term_id in hits:
+            group_indices = term_groups.get(term_id)
+            if group_indices:
+                candidates.update(group_indices)
+
+        matched = []
+        for group_index in sorted(candidates):
+            required, normal = self._groups[group_index]
+            if required and not required <= hits:
+                continue
+            if normal and normal.isdisjoint(hits):
+                continue
+            matched.append(group_index)
+        return matched
+
+    def match_groups(self, title: str) -> List[int]:
+        """
+        一次扫描返回标题匹配的全部词组
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            匹配的词组索引列表（升序）；被过滤或没有配置词组时返回空列表
+        """
+        title_lower = self._normalize_title(title)
+        if title_lower is None:
+            return []
+        hits = self.find_terms(title_lower)
+        if self._is_filtered(hits):
+            return []
+        return self._matched_groups(hits)
+
+    def matches(self, title: str) -> bool:
+        """
+        检查标题是否匹配词组规则（与 matches_word_groups 语义一致）
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            是否匹配；没有配置词组时，未被全局过滤的标题都视为匹配
+        """
+        title_lower = self._normalize_title(title)
+        if title_lower is None:
+            return False
+        hits = self.find_terms(title_lower)
+        if self._global_ids and not self._global_ids.isdisjoint(hits):
+            return False
+        if not self.has_groups:
+            return True
+        if self._filter_ids and not self._filter_ids.isdisjoint(hits):
+            return False
+        return bool(self._matched_groups(hits))
+
+
+# 编译结果缓存：以配置对象本身为键（按身份比较），同一份配置只编译一次
+_matcher_cache: "OrderedDict[Tuple[int, int, int], Tuple[Tuple, FrequencyMatcher]]" = OrderedDict()
+_matcher_cache_lock = threading.Lock()
+_MATCHER_CACHE_SIZE = 8
+
+
+def get_frequency_matcher(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> FrequencyMatcher:
+    """
+    获取词组配置对应的匹配器（带缓存）
+
+    缓存以传入的列表对象身份为键，调用方不应在编译后原地修改这些列表。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        FrequencyMatcher 实例
+    """
+    sources = (word_groups, filter_words, global_filters)
+    key = (id(word_groups), id(filter_words), id(global_filters))
+
+    with _matcher_cache_lock:
+        cached = _matcher_cache.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            _matcher_cache.move_to_end(key)
+            return cached[1]
+
+    matcher = FrequencyMatcher(word_groups, filter_words, global_filters)
+
+    with _matcher_cache_lock:
+        # 保存配置对象的强引用，避免对象被回收后 id 被复用
+        _matcher_cache[key] = (sources, matcher)
+        _matcher_cache.move_to_end(key)
+        while len(_matcher_cache) > _MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+
+    return matcher
@@ -0,0 +1,122 @@
+# coding=utf-8
+"""
+当天标题的列式视图
+
+TitleTable 直接由存储层的 NewsData 构建，每个标题一行、各字段各占一列：
+- 标题、URL、排名数组直接引用 NewsItem 中的对象，不复制
+- 平台 ID、首末出现时间等大量重复的字符串在表内共享同一个对象
+- 同一平台的行连续存放，同一平台内标题唯一（重复标题以后出现的记录为准，
+  与原先写入 {source_id: {title: ...}} 字典的结果一致）
+
+统计分析（count_word_frequency）可以直接接收 TitleTable，
+不再需要 all_results / title_info 两份嵌套字典。
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from trendradar.storage.base import NewsData
+
+
+class TitleTable:
+    """当天标题的列式视图"""
+
+    __slots__ = (
+        "source_ids", "titles", "ranks", "urls", "mobile_urls",
+        "first_times", "last_times", "counts",
+        "id_to_name", "_index",
+    )
+
+    def __init__(self) -> None:
+        self.source_ids: List[str] = []
+        self.titles: List[str] = []
+        self.ranks: List[Sequence[int]] = []
+        self.urls: List[str] = []
+        self.mobile_urls: List[str] = []
+        self.first_times: List[str] = []
+        self.last_times: List[str] = []
+        self.counts: List[int] = []
+        self.id_to_name: Dict[str, str] = {}
+        # {source_id: {title: 行号}}
+        self._index: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_news_data(
+        cls,
+        news_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> "TitleTable":
+        """
+        由 NewsData 构建列式视图
+
+        Args:
+            news_data: 存储层读取的当天数据
+            platform_ids: 只保留这些平台（为 None 时保留全部）
+
+        Returns:
+            TitleTable 对象
+        """
+        table = cls()
+        shared: Dict[str, str] = {}
+
+        for source_id, news_list in news_data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+
+            table.id_to_name[source_id] = news_data.id_to_name.get(source_id, source_id)
+            source_index = table._index.setdefault(source_id, {})
+
+            for item in news_list:
+                first_time = shared.setdefault(item.first_time, item.first_time)
+                last_time = shared.setdefault(item.last_time, item.last_time)
+                ranks = item.ranks
+
+                row = source_index.get(item.title)
+                if row is None:
+                    source_index[item.title] = len(table.titles)
+                    table.source_ids.append(source_id)
+                    table.titles.append(item.title)
+                    table.ranks.append(ranks)
+                    table.urls.append(item.url or "")
+                    table.mobile_urls.append(item.mobile_url or "")
+                    table.first_times.append(first_time)
+                    table.last_times.append(last_time)
+                    table.counts.append(item.count)
+                else:
+                    table.ranks[row] = ranks
+                    table.urls[row] = item.url or ""
+                    table.mobile_urls[row] = item.mobile_url or ""
+                    table.first_times[row] = first_time
+                    table.last_times[row] = last_time
+                    table.counts[row] = item.count
+
+        return table
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @property
+    def platform_ids(self) -> List[str]:
+        """包含数据的平台 ID（按出现顺序）"""
+        return list(self._index)
+
+    def find(self, source_id: str, title: str) -> Optional[int]:
+        """查找标题所在行，不存在时返回 None"""
+        source_index = self._index.get(source_id)
+        if source_index is None:
+            return None
+        return source_index.get(title)
+
+    def latest_time(self) -> Optional[str]:
+        """所有标题中最晚的出现时间"""
+        return max((t for t in self.last_times if t), default=None)
+
+    def rows(self, last_time: Optional[str] = None) -> List[int]:
+        """
+        按平台顺序返回行号
+
+        Args:
+            last_time: 只返回最后出现时间等于该值的行（current 模式）
+        """
+        if last_time is None:
+            return list(range(len(self.titles)))
+        return [row for row, t in enumerate(self.last_times) if t == last_time]
@@ -4,5 +4,7 @@
 """
 
 from trendradar.crawler.fetcher import DataFetcher
+from trendradar.crawler.limiter import HostRateLimiter
+from trendradar.crawler.scraper import ArticleScraper
 
-__all__ = ["DataFetcher"]
+__all__ = ["DataFetcher", "HostRateLimiter", "ArticleScraper"]
@@ -4,17 +4,23 @@
 
 负责从 NewsNow API 抓取新闻数据，支持：
 - 单个平台数据获取
-- 批量平台数据爬取
-- 自动重试机制
+- 批量平台数据爬取（支持按主机限速的并发模式）
+- 自动重试机制（应用层重试 + 连接层重试）
 - 代理支持
+- 长连接复用（共享 Session 连接池）
 """
 
 import json
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from trendradar.crawler.limiter import HostRateLimiter
 
 
 class DataFetcher:
@@ -32,10 +38,15 @@ class DataFetcher:
         "Cache-Control": "no-cache",
     }
 
+    # 连接层重试的状态码
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
     def __init__(
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        pool_size: int = 10,
+        transport_retries: int = 2,
     ):
         """
         初始化数据获取器
@@ -43,9 +54,48 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            pool_size: 每个主机的最大保持连接数（应不小于并发数）
+            transport_retries: 连接层重试次数（连接失败、5xx、429，0=禁用）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.pool_size = max(1, pool_size)
+        self.transport_retries = max(0, transport_retries)
+
+        # 共享会话：跨多次 crawl_websites / run_once 调用复用 TCP/TLS 连接
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池和连接层重试的请求会话"""
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+
+        retry = Retry(
+            total=self.transport_retries,
+            connect=self.transport_retries,
+            read=self.transport_retries,
+            status=self.transport_retries,
+            backoff_factor=0.5,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if self.proxy_url:
+            session.proxies = {"http": self.proxy_url, "https": self.proxy_url}
+
+        return session
+
+    def close(self) -> None:
+        """关闭会话，释放连接池中的空闲连接"""
+        self.session.close()
 
     def fetch_data(
         self,
@@ -53,6 +103,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        limiter: Optional[HostRateLimiter] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,6 +113,7 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            limiter: 按主机限速器（可选），首次请求和每次重试前都先预约时间槽
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
@@ -74,19 +126,12 @@ class DataFetcher:
 
         url = f"{self.api_url}?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
+                if limiter is not None:
+                    limiter.wait(url)
+                response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
                 data_text = response.text
@@ -114,71 +159,135 @@ class DataFetcher:
 
         return None, id_value, alias
 
+    def _parse_response(self, id_value: str, response: str) -> Optional[Dict]:
+        """
+        解析单个平台的响应文本
+
+        Args:
+            id_value: 平台ID
+            response: 响应文本
+
+        Returns:
+            {标题: {"ranks", "url", "mobileUrl"}} 字典，解析失败返回 None
+        """
+        try:
+            data = json.loads(response)
+            titles = {}
+
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in titles:
+                    titles[title]["ranks"].append(index)
+                else:
+                    titles[title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+            return titles
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            return None
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            return None
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        max_workers: int = 1,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        max_workers > 1 时启用并发模式：线程池大小即全局并发上限，
+        同一主机的请求按 request_interval 错开发出，不同主机互不限速。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒），并发模式下为同一主机的最小请求间隔
+            max_workers: 最大并发数（1=串行抓取）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
-        results = {}
         id_to_name = {}
-        failed_ids = []
-
-        for i, id_info in enumerate(ids_list):
+        platform_ids = []
+        for id_info in ids_list:
             if isinstance(id_info, tuple):
                 id_value, name = id_info
             else:
                 id_value = id_info
                 name = id_value
-
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
+            platform_ids.append(id_value)
+
+        if max_workers > 1 and len(ids_list) > 1:
+            responses = self._fetch_concurrently(ids_list, request_interval, max_workers)
+        else:
+            responses = self._fetch_serially(ids_list, request_interval)
+
+        # 按配置顺序汇总结果，保证输出与串行模式一致
+        results = {}
+        failed_ids = []
+        for id_value in platform_ids:
+            response = responses.get(id_value)
+            titles = self._parse_response(id_value, response) if response else None
+            if titles is None:
                 failed_ids.append(id_value)
+            else:
+                results[id_value] = titles
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
+
+    def _fetch_serially(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+    ) -> Dict[str, Optional[str]]:
+        """串行抓取，相邻请求之间固定间隔"""
+        responses = {}
+        for i, id_info in enumerate(ids_list):
+            response, id_value, _ = self.fetch_data(id_info)
+            responses[id_value] = response
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
                 actual_interval = request_interval + random.randint(-10, 20)
                 actual_interval = max(50, actual_interval)
                 time.sleep(actual_interval / 1000)
+        return responses
 
-        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
-        return results, id_to_name, failed_ids
+    def _fetch_concurrently(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+        max_workers: int,
+    ) -> Dict[str, Optional[str]]:
+        """线程池并发抓取，按主机限速"""
+        limiter = HostRateLimiter(
+            min_interval=max(50, request_interval) / 1000,
+            jitter=0.015,
+        )
+
+        def task(id_info):
+            return self.fetch_data(id_info, limiter=limiter)
+
+        responses = {}
+        workers = min(max_workers, len(ids_list))
+        print(f"并发抓取 {len(ids_list)} 个平台（并发数 {workers}）")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(task, id_info) for id_info in ids_list]
+            for future in as_completed(futures):
+                response, id_value, _ = future.result()
+                responses[id_value] = response
+        return responses
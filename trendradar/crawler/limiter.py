@@ -0,0 +1,70 @@
+# coding=utf-8
+"""
+请求限速器模块
+
+提供按主机维度的请求节流，用于并发抓取时保持对单个站点的礼貌访问：
+- 同一主机的相邻请求保持最小间隔
+- 不同主机之间互不影响
+- 线程安全，可在线程池中共享
+"""
+
+import random
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """按主机限速器"""
+
+    def __init__(self, min_interval: float = 0.0, jitter: float = 0.0):
+        """
+        初始化限速器
+
+        Args:
+            min_interval: 同一主机相邻请求的最小间隔（秒）
+            jitter: 间隔随机波动幅度（秒），实际间隔不会小于 0
+        """
+        self.min_interval = max(0.0, min_interval)
+        self.jitter = max(0.0, jitter)
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """提取 URL 的主机名（小写），无法解析时返回原字符串"""
+        try:
+            return urlparse(url).netloc.lower() or url
+        except Exception:
+            return url
+
+    def wait(self, url: str) -> float:
+        """
+        阻塞直到该 URL 所属主机允许发出下一个请求
+
+        采用"预约时间槽"的方式：持锁只用于计算本次请求的发出时间，
+        真正的等待在锁外进行，因此不同主机的请求不会相互阻塞。
+
+        Args:
+            url: 即将请求的 URL
+
+        Returns:
+            实际等待的秒数
+        """
+        if self.min_interval <= 0:
+            return 0.0
+
+        host = self.get_host(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            interval = self.min_interval
+            if self.jitter:
+                interval += random.uniform(-self.jitter, self.jitter)
+            self._next_slot[host] = slot + max(0.0, interval)
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(0.0, delay)
@@ -6,6 +6,7 @@ RSS 抓取模块
 """
 
 from .parser import RSSParser
+from .cache import FeedValidatorCache
 from .fetcher import RSSFetcher, RSSFeedConfig
 
-__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig"]
+__all__ = ["RSSParser", "FeedValidatorCache", "RSSFetcher", "RSSFeedConfig"]
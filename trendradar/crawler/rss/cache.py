@@ -0,0 +1,147 @@
+# coding=utf-8
+"""
+RSS 条件请求缓存
+
+按 feed 持久化保存 ETag / Last-Modified / 内容哈希，用于：
+- 发送 If-None-Match / If-Modified-Since 条件请求
+- 服务器不支持条件请求时，通过内容哈希识别未变化的响应
+
+缓存条目记录所属日期，跨天后自动失效，保证每个日期的数据库都有完整数据。
+本次抓取得到的验证信息先暂存在内存中（stage），数据写入存储后端成功后才提交（commit），
+避免写入失败或进程中断后，下次抓取把未入库的源误判为"未变化"。
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class FeedValidatorCache:
+    """RSS 源验证信息缓存（JSON 文件持久化，线程安全）"""
+
+    def __init__(self, cache_path: str):
+        """
+        初始化缓存
+
+        Args:
+            cache_path: 缓存文件路径
+        """
+        self.cache_path = Path(cache_path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._pending: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """从磁盘加载缓存，文件损坏时从空缓存开始"""
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data.get("feeds", {})
+        except Exception as e:
+            print(f"[RSS] 条件请求缓存加载失败，将重新建立: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        """持久化到磁盘（仅在有变更时写入）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"feeds": self._entries}, f, ensure_ascii=False, indent=2)
+                tmp_path.replace(self.cache_path)
+                self._dirty = False
+            except Exception as e:
+                print(f"[RSS] 条件请求缓存保存失败: {e}")
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """计算响应内容哈希"""
+        return hashlib.sha1(content).hexdigest()
+
+    def get(self, feed_id: str, url: str, date: str) -> Optional[Dict[str, str]]:
+        """
+        获取 feed 的有效缓存条目
+
+        Args:
+            feed_id: 源 ID
+            url: 源 URL（URL 变化时缓存失效）
+            date: 当前抓取日期（日期变化时缓存失效）
+
+        Returns:
+            缓存条目（etag, last_modified, content_hash），无效时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(feed_id)
+        if not entry or entry.get("url") != url or entry.get("date") != date:
+            return None
+        return entry
+
+    def get_request_headers(self, feed_id: str, url: str, date: str) -> Dict[str, str]:
+        """构建条件请求头"""
+        entry = self.get(feed_id, url, date)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def stage(
+        self,
+        feed_id: str,
+        url: str,
+        date: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: str,
+    ) -> None:
+        """暂存 feed 本次成功解析的验证信息（commit 后才生效）"""
+        with self._lock:
+            self._pending[feed_id] = {
+                "url": url,
+                "date": date,
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+                "content_hash": content_hash,
+            }
+
+    def commit(self) -> int:
+        """
+        提交暂存的验证信息并持久化（数据写入存储后端成功后调用）
+
+        Returns:
+            提交的条目数
+        """
+        with self._lock:
+            count = len(self._pending)
+            if count:
+                self._entries.update(self._pending)
+                self._pending = {}
+                self._dirty = True
+        self.save()
+        return count
+
+    def touch(self, feed_id: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """304 响应可能携带新的验证信息，更新之"""
+        with self._lock:
+            entry = self._entries.get(feed_id)
+            if not entry:
+                return
+            if etag and etag != entry.get("etag"):
+                entry["etag"] = etag
+                self._dirty = True
+            if last_modified and last_modified != entry.get("last_modified"):
+                entry["last_modified"] = last_modified
+                self._dirty = True
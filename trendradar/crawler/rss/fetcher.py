@@ -7,13 +7,17 @@ RSS 抓取器
 
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .cache import FeedValidatorCache
 from .parser import RSSParser, ParsedRSSItem
+from trendradar.crawler.limiter import HostRateLimiter
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
@@ -42,22 +46,27 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        cache_path: Optional[str] = None,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: RSS 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒），并行模式下为同一域名的最小请求间隔
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并行抓取的最大线程数（1=串行抓取）
+            cache_path: 条件请求缓存文件路径（None=禁用条件请求）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
+        self.max_workers = max(1, max_workers)
         self.timeout = timeout
         self.use_proxy = use_proxy
         self.proxy_url = proxy_url
@@ -67,6 +76,7 @@ class RSSFetcher:
 
         self.parser = RSSParser()
         self.session = self._create_session()
+        self.validator_cache = FeedValidatorCache(cache_path) if cache_path else None
 
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
@@ -83,6 +93,11 @@ class RSSFetcher:
                 "https": self.proxy_url,
             }
 
+        # 并行模式下每个主机可能同时有多个请求，连接池需不小于并发数
+        adapter = HTTPAdapter(pool_maxsize=max(10, self.max_workers))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         return session
 
     def _filter_by_freshness(
@@ -127,21 +142,47 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
-    def fetch_feed(self, feed: RSSFeedConfig, cycle_id: Optional[str] = None) -> Tuple[List[RSSItem], Optional[str]]:
+    def fetch_feed(self, feed: RSSFeedConfig, cycle_id: Optional[str] = None) -> Tuple[Optional[List[RSSItem]], Optional[str]]:
         """
         抓取单个 RSS 源
 
+        启用条件请求缓存时，会携带 If-None-Match / If-Modified-Since；
+        收到 304 或响应内容哈希与上次一致时跳过解析。
+
         Args:
             feed: RSS 源配置
             cycle_id: 周期ID，用于错误追踪去重
 
         Returns:
-            (条目列表, 错误信息) 元组
+            (条目列表, 错误信息) 元组；内容未变化时条目列表为 None
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
+            now = get_configured_time(self.timezone)
+            crawl_date = now.strftime("%Y-%m-%d")
+
+            headers = {}
+            if self.validator_cache:
+                headers = self.validator_cache.get_request_headers(feed.id, feed.url, crawl_date)
+
+            response = self.session.get(feed.url, timeout=self.timeout, headers=headers)
+
+            if response.status_code == 304 and headers:
+                self.validator_cache.touch(
+                    feed.id, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+                print(f"[RSS] {feed.name}: 未变化 (304)")
+                return None, None
+
             response.raise_for_status()
 
+            content_hash = None
+            if self.validator_cache:
+                content_hash = FeedValidatorCache.hash_content(response.content)
+                entry = self.validator_cache.get(feed.id, feed.url, crawl_date)
+                if entry and entry.get("content_hash") == content_hash:
+                    print(f"[RSS] {feed.name}: 未变化 (内容相同)")
+                    return None, None
+
             parsed_items = self.parser.parse(response.text, feed.url)
 
             # 限制条目数量（0=不限制）
@@ -149,7 +190,6 @@ class RSSFetcher:
                 parsed_items = parsed_items[:feed.max_items]
 
             # 转换为 RSSItem（使用配置的时区）
-            now = get_configured_time(self.timezone)
             crawl_time = now.strftime("%H:%M")
             items = []
 
@@ -171,6 +211,17 @@ class RSSFetcher:
 
             # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
             # 这样所有文章都会存入数据库，但旧文章不会推送
+            # 验证信息暂存，数据入库后由 commit_validators 提交
+            if self.validator_cache:
+                self.validator_cache.stage(
+                    feed.id,
+                    feed.url,
+                    crawl_date,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    content_hash=content_hash,
+                )
+
             print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
             return items, None
 
@@ -226,6 +277,7 @@ class RSSFetcher:
         all_items: Dict[str, List[RSSItem]] = {}
         id_to_name: Dict[str, str] = {}
         failed_ids: List[str] = []
+        unchanged_ids: List[str] = []
 
         # 使用配置的时区
         now = get_configured_time(self.timezone)
@@ -237,24 +289,27 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源 (周期: {cycle_id})...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed, cycle_id)
+        if self.max_workers > 1 and len(self.feeds) > 1:
+            outcomes = self._fetch_parallel(cycle_id)
+        else:
+            outcomes = self._fetch_serial(cycle_id)
 
+        # 按配置顺序汇总，保证与串行模式输出一致
+        for feed, (items, error) in zip(self.feeds, outcomes):
             id_to_name[feed.id] = feed.name
 
             if error:
                 failed_ids.append(feed.id)
+            elif items is None:
+                unchanged_ids.append(feed.id)
             else:
                 all_items[feed.id] = items
 
         total_items = sum(len(items) for items in all_items.values())
-        print(f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条")
+        summary = f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条"
+        if unchanged_ids:
+            summary += f"，{len(unchanged_ids)} 个源未变化"
+        print(summary)
 
         # 清理周期错误缓存
         try:
@@ -270,8 +325,50 @@ class RSSFetcher:
             items=all_items,
             id_to_name=id_to_name,
             failed_ids=failed_ids,
+            unchanged_ids=unchanged_ids,
         )
 
+    def commit_validators(self) -> None:
+        """
+        提交本次抓取的条件请求验证信息（save_rss_data 成功后调用）
+
+        fetch_all 只在内存中暂存 ETag / Last-Modified / 内容哈希，
+        数据未成功入库时不提交，下次抓取会重新下载并解析这些源。
+        """
+        if self.validator_cache:
+            self.validator_cache.commit()
+
+    def _fetch_serial(self, cycle_id: str) -> List[Tuple[Optional[List[RSSItem]], Optional[str]]]:
+        """串行抓取所有源，相邻请求之间固定间隔（带随机波动）"""
+        outcomes = []
+        for i, feed in enumerate(self.feeds):
+            if i > 0:
+                interval = self.request_interval / 1000
+                jitter = random.uniform(-0.2, 0.2) * interval
+                time.sleep(interval + jitter)
+
+            outcomes.append(self.fetch_feed(feed, cycle_id))
+        return outcomes
+
+    def _fetch_parallel(self, cycle_id: str) -> List[Tuple[Optional[List[RSSItem]], Optional[str]]]:
+        """
+        并行抓取所有源
+
+        线程池大小为全局并发上限；同一域名的请求按 request_interval 错开，
+        不同域名的源互不限速。
+        """
+        interval = self.request_interval / 1000
+        limiter = HostRateLimiter(min_interval=interval, jitter=0.2 * interval)
+
+        def task(feed: RSSFeedConfig) -> Tuple[Optional[List[RSSItem]], Optional[str]]:
+            limiter.wait(feed.url)
+            return self.fetch_feed(feed, cycle_id)
+
+        workers = min(self.max_workers, len(self.feeds))
+        print(f"[RSS] 并行抓取（并发数 {workers}）")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(task, self.feeds))
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -282,6 +379,8 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 4,
+                    "cache_path": "output/rss/feed_cache.json",
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -336,4 +435,6 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            cache_path=config.get("cache_path"),
         )
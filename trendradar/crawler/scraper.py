@@ -2,10 +2,17 @@
 """
 网页内容抓取器
 """
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
 import requests
 from bs4 import BeautifulSoup
 
+from trendradar.crawler.limiter import HostRateLimiter
+
+
 def scrape_article_content(url: str, session: requests.Session, timeout: int = 15) -> Optional[str]:
     """
     抓取并解析文章页面的主要文本内容
@@ -66,3 +73,103 @@ def scrape_article_content(url: str, session: requests.Session, timeout: int = 1
     except Exception as e:
         print(f"[Scraper] 解析失败: {url} ({e})")
         return None
+
+
+class ArticleScraper:
+    """
+    全文批量抓取器
+
+    作为数据库写入之后的独立阶段运行：
+    - 独立线程池并发抓取
+    - 同一主机限制并发数并保持最小请求间隔
+    - 整体时间预算耗尽后放弃剩余任务，不拖慢主流程
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_workers: int = 4,
+        timeout: int = 15,
+        time_budget: float = 60.0,
+        host_interval: float = 1.0,
+        max_per_host: int = 2,
+    ):
+        """
+        初始化全文抓取器
+
+        Args:
+            session: requests 会话对象
+            max_workers: 全局并发数
+            timeout: 单篇文章请求超时（秒）
+            time_budget: 整个抓取阶段的时间预算（秒），<=0 表示不限制
+            host_interval: 同一主机相邻请求的最小间隔（秒）
+            max_per_host: 同一主机的最大并发数
+        """
+        self.session = session
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.time_budget = time_budget
+        self.max_per_host = max(1, max_per_host)
+        self._limiter = HostRateLimiter(min_interval=host_interval, jitter=0.2 * host_interval)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def _get_host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """获取 URL 所属主机的并发槽"""
+        host = HostRateLimiter.get_host(url)
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def scrape_all(self, targets: List[Tuple[int, str]]) -> Dict[int, str]:
+        """
+        并发抓取多篇文章全文
+
+        Args:
+            targets: (条目 ID, 文章 URL) 列表
+
+        Returns:
+            条目 ID 到正文内容的映射（只包含抓取成功的条目）
+        """
+        if not targets:
+            return {}
+
+        deadline = time.monotonic() + self.time_budget if self.time_budget > 0 else None
+
+        def remaining() -> Optional[float]:
+            if deadline is None:
+                return None
+            return deadline - time.monotonic()
+
+        def task(url: str) -> Optional[str]:
+            with self._get_host_slot(url):
+                self._limiter.wait(url)
+                left = remaining()
+                if left is not None and left <= 0:
+                    return None
+                timeout = self.timeout if left is None else max(1, min(self.timeout, left))
+                return scrape_article_content(url, self.session, timeout=timeout)
+
+        results: Dict[int, str] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(task, url): item_id for item_id, url in targets}
+            done, not_done = wait(futures, timeout=remaining())
+            for future in done:
+                try:
+                    content = future.result()
+                except Exception as e:
+                    print(f"[Scraper] 抓取异常: {e}")
+                    continue
+                if content:
+                    results[futures[future]] = content
+            if not_done:
+                print(f"[Scraper] 时间预算耗尽，放弃 {len(not_done)} 篇文章")
+        finally:
+            # 未开始的任务直接取消，进行中的请求受单篇超时约束
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
@@ -34,6 +34,9 @@ from trendradar.notification.renderer import (
 )
 from trendradar.notification.splitter import (
     split_content_into_batches,
+    build_message_layout,
+    resolve_max_bytes,
+    MessageLayout,
     DEFAULT_BATCH_SIZES,
 )
 from trendradar.notification.senders import (
@@ -65,6 +68,9 @@ __all__ = [
     "render_dingtalk_content",
     # 消息分批
     "split_content_into_batches",
+    "build_message_layout",
+    "resolve_max_bytes",
+    "MessageLayout",
     "DEFAULT_BATCH_SIZES",
     # 消息发送器
     "send_to_feishu",
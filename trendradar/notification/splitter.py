@@ -3,10 +3,18 @@
 消息分批处理模块
 
 提供消息内容分批拆分功能，确保消息大小不超过各平台限制
+
+分批分两步完成：
+- build_message_layout：按格式类型把报告排版为分段序列（MessageLayout），
+  每段的 UTF-8 字节数在排版时计算一次，与字节上限无关
+- MessageLayout.pack：按字节上限贪心装箱，只做整数加法和字符串拼接
+
+同一次运行中多个渠道、多个账号推送同一份报告时，
+同一格式类型只需排版一次，不同的批次大小只重新装箱。
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
 from trendradar.report.formatter import format_title_for_platform
 from trendradar.utils.time import format_iso_time_friendly
@@ -20,6 +28,121 @@ DEFAULT_BATCH_SIZES = {
     "default": 4000,
 }
 
+# 分段类型
+_ATOMIC = 0    # 原子段：放不下时结束当前批次，新批次以 restart 开头
+_OPTIONAL = 1  # 可选段（分隔符）：放不下时直接丢弃
+_RAW = 2       # 直接追加，不检查大小
+
+
+def _utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+class MessageLayout:
+    """
+    排版后的消息内容（与字节上限无关）
+
+    由 build_message_layout 生成，调用 pack 按不同字节上限分批，
+    结果与逐段拼接、逐次计算字节数的分批方式完全一致。
+    """
+
+    def __init__(self, base_header: str, base_footer: str):
+        """
+        初始化排版结果
+
+        Args:
+            base_header: 每个批次的头部
+            base_footer: 每个批次的尾部
+        """
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.header_bytes = _utf8_len(base_header)
+        self.footer_bytes = _utf8_len(base_footer)
+        # (分段类型, 文本, 文本字节数, 新批次续接内容, 续接内容字节数)
+        self.segments: List[Tuple[int, str, int, str, int]] = []
+        # 无内容时的提示（整条消息固定为一个批次）
+        self.placeholder: Optional[str] = None
+
+    def add(self, text: str, restart: str) -> None:
+        """
+        添加原子段
+
+        Args:
+            text: 段内容
+            restart: 放不下时新批次在头部之后的内容（区块标题 + 分组标题 + 本段）
+        """
+        self.segments.append((_ATOMIC, text, _utf8_len(text), restart, _utf8_len(restart)))
+
+    def add_optional(self, text: str) -> None:
+        """添加可选段（放不下时丢弃，不开启新批次）"""
+        self.segments.append((_OPTIONAL, text, _utf8_len(text), "", 0))
+
+    def add_raw(self, text: str) -> None:
+        """添加直接追加的内容（不检查大小）"""
+        self.segments.append((_RAW, text, _utf8_len(text), "", 0))
+
+    def pack(self, max_bytes: int) -> List[str]:
+        """
+        按字节上限分批
+
+        Args:
+            max_bytes: 每个批次的最大字节数（含头部和尾部）
+
+        Returns:
+            分批后的消息内容列表
+        """
+        header, footer = self.base_header, self.base_footer
+        if self.placeholder is not None:
+            return [header + self.placeholder + footer]
+
+        limit = max_bytes - self.footer_bytes
+        batches = []
+        parts = [header]
+        size = self.header_bytes
+        has_content = False
+
+        for kind, text, text_bytes, restart, restart_bytes in self.segments:
+            if kind == _RAW or size + text_bytes < limit:
+                parts.append(text)
+                size += text_bytes
+                if kind == _ATOMIC:
+                    has_content = True
+            elif kind == _ATOMIC:
+                if has_content:
+                    parts.append(footer)
+                    batches.append("".join(parts))
+                parts = [header, restart]
+                size = self.header_bytes + restart_bytes
+                has_content = True
+
+        if has_content:
+            parts.append(footer)
+            batches.append("".join(parts))
+
+        return batches
+
+
+def resolve_max_bytes(format_type: str, batch_sizes: Optional[Dict[str, int]] = None) -> int:
+    """
+    获取格式类型的默认批次大小
+
+    Args:
+        format_type: 格式类型
+        batch_sizes: 批次大小配置字典（可选）
+
+    Returns:
+        最大字节数
+    """
+    sizes = {**DEFAULT_BATCH_SIZES, **(batch_sizes or {})}
+    if format_type == "dingtalk":
+        return sizes.get("dingtalk", 20000)
+    elif format_type == "feishu":
+        return sizes.get("feishu", 29000)
+    elif format_type == "ntfy":
+        return sizes.get("ntfy", 3800)
+    else:
+        return sizes.get("default", 4000)
+
 
 def split_content_into_batches(
     report_data: Dict,
@@ -59,21 +182,45 @@ def split_content_into_batches(
     Returns:
         分批后的消息内容列表
     """
-    # 合并批次大小配置
-    sizes = {**DEFAULT_BATCH_SIZES, **(batch_sizes or {})}
-
     if max_bytes is None:
-        if format_type == "dingtalk":
-            max_bytes = sizes.get("dingtalk", 20000)
-        elif format_type == "feishu":
-            max_bytes = sizes.get("feishu", 29000)
-        elif format_type == "ntfy":
-            max_bytes = sizes.get("ntfy", 3800)
-        else:
-            max_bytes = sizes.get("default", 4000)
+        max_bytes = resolve_max_bytes(format_type, batch_sizes)
+
+    layout = build_message_layout(
+        report_data,
+        format_type,
+        update_info=update_info,
+        mode=mode,
+        feishu_separator=feishu_separator,
+        reverse_content_order=reverse_content_order,
+        get_time_func=get_time_func,
+        rss_items=rss_items,
+        rss_new_items=rss_new_items,
+        timezone=timezone,
+        display_mode=display_mode,
+    )
+    return layout.pack(max_bytes)
+
+
+def build_message_layout(
+    report_data: Dict,
+    format_type: str,
+    update_info: Optional[Dict] = None,
+    mode: str = "daily",
+    feishu_separator: str = "---",
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+    rss_items: Optional[list] = None,
+    rss_new_items: Optional[list] = None,
+    timezone: str = "Asia/Shanghai",
+    display_mode: str = "keyword",
+) -> MessageLayout:
+    """按格式类型排版消息内容（不分批）
 
-    batches = []
+    参数含义与 split_content_into_batches 相同，排版结果可按不同字节上限多次分批。
 
+    Returns:
+        排版结果
+    """
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -139,8 +286,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}*\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
+    layout = MessageLayout(base_header, base_footer)
 
     if (
         not report_data["stats"]
@@ -153,32 +299,19 @@ def split_content_into_batches(
             mode_text = "当前榜单模式下暂无匹配的热点词汇"
         else:
             mode_text = "暂无匹配的热点词汇"
-        simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        layout.placeholder = f"📭 {mode_text}\n\n"
+        return layout
 
-    # 定义处理热点词汇统计的函数
-    def process_stats_section(current_batch, current_batch_has_content, batches):
-        """处理热点词汇统计"""
+    # 定义排版热点词汇统计的函数
+    def add_stats_section():
+        """排版热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        layout.add(stats_header, stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -285,27 +418,12 @@ def split_content_into_batches(
                 if len(stat["titles"]) > 1:
                     first_news_line += "\n"
 
-            # 原子性检查：词组标题+第一条新闻必须一起处理
+            # 原子性：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            layout.add(word_with_first_news, stats_header + word_with_first_news)
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
+            for j in range(1, len(stat["titles"])):
                 title_data = stat["titles"][j]
                 if format_type in ("wework", "bark"):
                     formatted_title = format_title_for_platform(
@@ -338,18 +456,7 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                layout.add(news_line, stats_header + word_header + news_line)
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -367,20 +474,13 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
-
-        return current_batch, current_batch_has_content, batches
+                layout.add_optional(separator)
 
-    # 定义处理新增新闻的函数
-    def process_new_titles_section(current_batch, current_batch_has_content, batches):
-        """处理新增新闻"""
+    # 定义排版新增新闻的函数
+    def add_new_titles_section():
+        """排版新增新闻"""
         if not report_data["new_titles"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         new_header = ""
         if format_type in ("wework", "bark"):
@@ -398,18 +498,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        layout.add(new_header, new_header)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -459,26 +548,12 @@ def split_content_into_batches(
 
                 first_news_line = f"  1. {formatted_title}\n"
 
-            # 原子性检查：来源标题+第一条新闻
+            # 原子性：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            layout.add(source_with_first_news, new_header + source_with_first_news)
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
+            for j in range(1, len(source_data["titles"])):
                 title_data = source_data["titles"][j]
                 title_data_copy = title_data.copy()
                 title_data_copy["is_new"] = False
@@ -508,68 +583,35 @@ def split_content_into_batches(
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
+                layout.add(news_line, new_header + source_header + news_line)
 
-        return current_batch, current_batch_has_content, batches
+            layout.add_raw("\n")
 
     # 根据配置决定处理顺序
     if reverse_content_order:
         # 新增热点在前，热点词汇统计在后
         # 1. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        add_new_titles_section()
         # 2. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _add_rss_new_titles_section(layout, rss_new_items, format_type, feishu_separator, timezone)
         # 3. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        add_stats_section()
         # 4. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _add_rss_stats_section(layout, rss_items, format_type, feishu_separator, timezone)
     else:
         # 默认：热点词汇统计在前，新增热点在后
         # 1. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        add_stats_section()
         # 2. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _add_rss_stats_section(layout, rss_items, format_type, feishu_separator, timezone)
         # 3. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        add_new_titles_section()
         # 4. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _add_rss_new_titles_section(layout, rss_new_items, format_type, feishu_separator, timezone)
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -584,18 +626,7 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        layout.add(failed_header, failed_header)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -605,58 +636,30 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-
-    # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+            layout.add(failed_line, failed_header + failed_line)
 
-    return batches
+    return layout
 
 
-def _process_rss_stats_section(
+def _add_rss_stats_section(
+    layout: MessageLayout,
     rss_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
     timezone: str = "Asia/Shanghai",
-) -> tuple:
-    """处理 RSS 统计区块（按关键词分组，与热榜统计格式一致）
+) -> None:
+    """排版 RSS 统计区块（按关键词分组，与热榜统计格式一致）
 
     Args:
+        layout: 排版结果
         rss_stats: RSS 关键词统计列表，格式与热榜 stats 一致：
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(stat["count"] for stat in rss_stats)
@@ -676,15 +679,7 @@ def _process_rss_stats_section(
         rss_header = f"\n\n📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
-        current_batch_has_content = True
-    else:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
-        current_batch_has_content = True
+    layout.add(rss_header, rss_header)
 
     # 逐个处理关键词组（与热榜一致）
     for i, stat in enumerate(rss_stats):
@@ -760,23 +755,12 @@ def _process_rss_stats_section(
             if len(stat["titles"]) > 1:
                 first_news_line += "\n"
 
-        # 原子性检查：关键词标题 + 第一条新闻必须一起处理
+        # 原子性：关键词标题 + 第一条新闻必须一起处理
         word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        layout.add(word_with_first_news, rss_header + word_with_first_news)
 
         # 处理剩余新闻条目
-        for j in range(start_index, len(stat["titles"])):
+        for j in range(1, len(stat["titles"])):
             title_data = stat["titles"][j]
             if format_type in ("wework", "bark"):
                 formatted_title = format_title_for_platform("wework", title_data, show_source=True)
@@ -797,15 +781,7 @@ def _process_rss_stats_section(
             if j < len(stat["titles"]) - 1:
                 news_line += "\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            layout.add(news_line, rss_header + word_header + news_line)
 
         # 关键词间分隔符
         if i < len(rss_stats) - 1:
@@ -823,45 +799,28 @@ def _process_rss_stats_section(
             elif format_type == "slack":
                 separator = "\n\n"
 
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
-
-    return current_batch, current_batch_has_content, batches
+            layout.add_optional(separator)
 
 
-def _process_rss_new_titles_section(
+def _add_rss_new_titles_section(
+    layout: MessageLayout,
     rss_new_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
     timezone: str = "Asia/Shanghai",
-) -> tuple:
-    """处理 RSS 新增区块（按来源分组，与热榜新增格式一致）
+) -> None:
+    """排版 RSS 新增区块（按来源分组，与热榜新增格式一致）
 
     Args:
+        layout: 排版结果
         rss_new_stats: RSS 新增关键词统计列表，格式与热榜 stats 一致：
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_new_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 从关键词分组中提取所有条目，重新按来源分组
     source_map = {}
@@ -873,7 +832,7 @@ def _process_rss_new_titles_section(
             source_map[source_name].append(title_data)
 
     if not source_map:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(len(titles) for titles in source_map.values())
@@ -894,15 +853,7 @@ def _process_rss_new_titles_section(
         new_header = f"\n\n🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
-        current_batch_has_content = True
-    else:
-        current_batch = test_content
-        current_batch_has_content = True
+    layout.add(new_header, new_header)
 
     # 按来源分组显示（与热榜新增格式一致）
     source_list = list(source_map.items())
@@ -946,23 +897,12 @@ def _process_rss_new_titles_section(
 
             first_news_line = f"  1. {formatted_title}\n"
 
-        # 原子性检查：来源标题 + 第一条新闻必须一起处理
+        # 原子性：来源标题 + 第一条新闻必须一起处理
         source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        layout.add(source_with_first_news, new_header + source_with_first_news)
 
         # 处理剩余新闻条目（禁用 new emoji）
-        for j in range(start_index, len(titles)):
+        for j in range(1, len(titles)):
             title_data = titles[j].copy()
             title_data["is_new"] = False
             if format_type in ("wework", "bark"):
@@ -982,20 +922,10 @@ def _process_rss_new_titles_section(
 
             news_line = f"  {j + 1}. {formatted_title}\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            layout.add(news_line, new_header + source_header + news_line)
 
         # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
-
-    return current_batch, current_batch_has_content, batches
+        layout.add_raw("\n")
 
 
 def _format_rss_item_line(
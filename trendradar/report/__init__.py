@@ -10,6 +10,8 @@
 - helpers: 报告辅助函数（清理、转义、格式化）
 - formatter: 平台标题格式化
 - html: HTML 报告渲染
+- template: 预编译报告模板（assets/ 下的页面框架）
+- fragment_cache: 分组 HTML 片段缓存（按输入内容哈希复用）
 - generator: 报告生成器
 """
 
@@ -19,10 +21,12 @@ from trendradar.report.helpers import (
     format_rank_display,
 )
 from trendradar.report.formatter import format_title_for_platform
-from trendradar.report.html import render_html_content
+from trendradar.report.html import render_html_content, iter_html_chunks
 from trendradar.report.generator import (
     prepare_report_data,
     generate_html_report,
+    write_html_file,
+    link_or_copy,
 )
 
 __all__ = [
@@ -34,7 +38,10 @@ __all__ = [
     "format_title_for_platform",
     # HTML 渲染
     "render_html_content",
+    "iter_html_chunks",
     # 报告生成器
     "prepare_report_data",
     "generate_html_report",
+    "write_html_file",
+    "link_or_copy",
 ]
@@ -0,0 +1,104 @@
+
+            const aiThemes = {{ai_themes_json}};
+            const aiModal = document.getElementById('ai-modal');
+            if (aiModal && Array.isArray(aiThemes)) {
+                const modalClose = document.getElementById('ai-modal-close');
+                const modalCategory = document.getElementById('ai-modal-category');
+                const modalTitle = document.getElementById('ai-modal-title');
+                const modalTags = document.getElementById('ai-modal-tags');
+                const modalSummary = document.getElementById('ai-modal-summary');
+                const modalPoints = document.getElementById('ai-modal-points');
+                const modalSources = document.getElementById('ai-modal-sources');
+
+                const clearNode = (node) => {
+                    while (node.firstChild) {
+                        node.removeChild(node.firstChild);
+                    }
+                };
+
+                const closeModal = () => {
+                    aiModal.classList.remove('active');
+                    document.body.style.overflow = '';
+                };
+
+                const openTheme = (index) => {
+                    const theme = aiThemes[index];
+                    if (!theme) {
+                        return;
+                    }
+                    modalCategory.textContent = theme.category || '其他';
+                    modalTitle.textContent = theme.title || '';
+                    modalSummary.textContent = theme.summary || '';
+
+                    clearNode(modalTags);
+                    (theme.tags || []).forEach((tag) => {
+                        const tagEl = document.createElement('span');
+                        tagEl.className = 'ai-tag';
+                        tagEl.textContent = tag;
+                        modalTags.appendChild(tagEl);
+                    });
+
+                    clearNode(modalPoints);
+                    const points = theme.key_points || [];
+                    if (points.length > 0) {
+                        points.forEach((point) => {
+                            const li = document.createElement('li');
+                            li.textContent = point;
+                            modalPoints.appendChild(li);
+                        });
+                    } else {
+                        const li = document.createElement('li');
+                        li.textContent = '暂无关键要点';
+                        modalPoints.appendChild(li);
+                    }
+
+                    clearNode(modalSources);
+                    const articles = theme.articles || [];
+                    if (articles.length > 0) {
+                        articles.forEach((article) => {
+                            const link = document.createElement('a');
+                            link.className = 'ai-source-link';
+                            link.href = article.url || '#';
+                            link.target = '_blank';
+                            link.rel = 'noopener';
+                            link.textContent = article.title || article.url || '来源链接';
+
+                            const meta = document.createElement('span');
+                            meta.className = 'ai-source-meta';
+                            const feedName = article.feed_name || '';
+                            const publishedAt = article.published_at || '';
+                            meta.textContent = [feedName, publishedAt].filter(Boolean).join(' · ');
+
+                            link.appendChild(meta);
+                            modalSources.appendChild(link);
+                        });
+                    } else {
+                        const empty = document.createElement('div');
+                        empty.className = 'ai-source-meta';
+                        empty.textContent = '暂无来源链接';
+                        modalSources.appendChild(empty);
+                    }
+
+                    aiModal.classList.add('active');
+                    document.body.style.overflow = 'hidden';
+                };
+
+                document.querySelectorAll('.ai-card').forEach((card) => {
+                    card.addEventListener('click', () => {
+                        const index = Number(card.dataset.themeIndex || 0);
+                        openTheme(index);
+                    });
+                });
+
+                modalClose.addEventListener('click', closeModal);
+                aiModal.addEventListener('click', (event) => {
+                    if (event.target === aiModal) {
+                        closeModal();
+                    }
+                });
+                document.addEventListener('keydown', (event) => {
+                    if (event.key === 'Escape') {
+                        closeModal();
+                    }
+                });
+            }
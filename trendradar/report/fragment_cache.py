@@ -0,0 +1,123 @@
+# coding=utf-8
+"""
+报告片段缓存
+
+current / daily 模式每次抓取都会重新生成整份报告，但两次抓取之间
+大多数关键词组（platform 模式下为平台组）、新增来源组和 RSS 分组的输入并没有变化。
+渲染层把这些分组的 HTML 按「渲染函数 + 输入内容哈希」缓存：
+- 输入（标题、排名、次数、序号等）不变的分组直接复用上次的 HTML
+- 缓存持久化到磁盘，定时运行的下一次进程也能复用
+- 只保留本次运行用到的片段，文件大小与一份报告相当
+- 渲染代码（html.py 及其调用的 helpers.py）变化后整份缓存失效，不会复用旧格式的片段
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+
+FRAGMENT_CACHE_FORMAT = 1
+
+# 片段渲染函数及其依赖所在的模块（新增依赖时需同步加入）
+RENDERER_SOURCES = ("html.py", "helpers.py")
+
+
+@lru_cache(maxsize=None)
+def renderer_fingerprint() -> str:
+    """渲染代码的指纹（RENDERER_SOURCES 中各模块的内容哈希）"""
+    digest = hashlib.sha1()
+    for name in RENDERER_SOURCES:
+        digest.update(name.encode("utf-8"))
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return f"{FRAGMENT_CACHE_FORMAT}:{digest.hexdigest()}"
+
+
+class FragmentCache:
+    """分组 HTML 片段缓存（内容哈希 -> HTML）"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        初始化片段缓存
+
+        Args:
+            path: 持久化文件路径，为空时只在进程内缓存
+        """
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, str] = {}
+        self._used: Dict[str, str] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(name: str, *args: Any) -> str:
+        """
+        计算片段的缓存键
+
+        Args:
+            name: 渲染函数名
+            *args: 渲染函数的全部输入
+
+        Returns:
+            内容哈希
+        """
+        payload = json.dumps(
+            [name, *args], ensure_ascii=False, sort_keys=True,
+            separators=(",", ":"), default=str,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def render(self, render_func: Callable[..., str], *args: Any) -> str:
+        """
+        获取片段 HTML，输入未变化时复用缓存
+
+        Args:
+            render_func: 渲染函数（结果只取决于参数）
+            *args: 渲染函数的参数
+
+        Returns:
+            片段 HTML
+        """
+        key = self.make_key(render_func.__name__, *args)
+        html = self._used.get(key)
+        if html is None:
+            html = self._entries.get(key)
+        if html is None:
+            html = render_func(*args)
+            self.misses += 1
+        else:
+            self.hits += 1
+        self._used[key] = html
+        return html
+
+    def _load(self) -> None:
+        """加载上次运行保存的片段，渲染代码已变化或文件损坏时忽略"""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("renderer") == renderer_fingerprint():
+                self._entries = data.get("fragments", {})
+        except Exception as e:
+            print(f"[报告] 片段缓存加载失败，将重新渲染: {e}")
+
+    def save(self) -> None:
+        """保存本次运行用到的片段（未用到的旧片段随之淘汰）"""
+        if self.path is None or not self._used:
+            return
+        if self.hits or self.misses:
+            print(f"[报告] 片段缓存: 复用 {self.hits} 个，重新渲染 {self.misses} 个")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"renderer": renderer_fingerprint(), "fragments": self._used},
+                    f, ensure_ascii=False, separators=(",", ":"),
+                )
+            tmp_path.replace(self.path)
+        except Exception as e:
+            print(f"[报告] 片段缓存保存失败: {e}")
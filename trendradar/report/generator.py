@@ -7,8 +7,53 @@
 - generate_html_report: 生成 HTML 报告
 """
 
+import os
+import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterable, List, Optional, Callable, Union
+
+
+def write_html_file(file_path: Union[str, Path], content: Union[str, Iterable[str]]) -> None:
+    """
+    写入 HTML 文件
+
+    先写入同目录的临时文件再原子替换，已有的硬链接副本（index.html）
+    不会在写入过程中看到半个文件。
+
+    Args:
+        file_path: 目标路径
+        content: HTML 字符串，或按顺序拼接的 HTML 片段
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        if isinstance(content, str):
+            f.write(content)
+        else:
+            f.writelines(content)
+    os.replace(tmp_path, file_path)
+
+
+def link_or_copy(source: Union[str, Path], dest: Union[str, Path]) -> None:
+    """
+    把已写好的文件放到另一个路径：优先硬链接，跨文件系统等无法链接时复制
+
+    Args:
+        source: 源文件
+        dest: 目标路径（已存在时替换）
+    """
+    source, dest = Path(source), Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists() and os.path.samefile(source, dest):
+        return
+
+    tmp_path = dest.with_name(dest.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, dest)
 
 
 def prepare_report_data(
@@ -158,6 +203,7 @@ def generate_html_report(
     load_frequency_words_func: Optional[Callable] = None,
     enable_index_copy: bool = True,
     ai_themes: Optional[List[Dict]] = None,
+    report_data: Optional[Dict] = None,
 ) -> str:
     """
     生成 HTML 报告
@@ -175,11 +221,12 @@ def generate_html_report(
         output_dir: 输出目录
         date_folder: 日期文件夹名称
         time_filename: 时间文件名
-        render_html_func: HTML 渲染函数
+        render_html_func: HTML 渲染函数，返回 HTML 字符串或 HTML 片段的可迭代对象
         matches_word_groups_func: 词组匹配函数
         load_frequency_words_func: 加载频率词函数
         enable_index_copy: 是否复制到 index.html
         ai_themes: AI 聚合主题数据（可选）
+        report_data: 已准备好的报告数据（可选，提供时不再调用 prepare_report_data）
 
     Returns:
         str: 生成的 HTML 文件路径
@@ -200,17 +247,18 @@ def generate_html_report(
     file_path = str(output_path / filename)
 
     # 准备报告数据
-    report_data = prepare_report_data(
-        stats,
-        failed_ids,
-        new_titles,
-        id_to_name,
-        mode,
-        rank_threshold,
-        matches_word_groups_func,
-        load_frequency_words_func,
-        ai_themes,
-    )
+    if report_data is None:
+        report_data = prepare_report_data(
+            stats,
+            failed_ids,
+            new_titles,
+            id_to_name,
+            mode,
+            rank_threshold,
+            matches_word_groups_func,
+            load_frequency_words_func,
+            ai_themes,
+        )
 
     # 渲染 HTML 内容
     if render_html_func:
@@ -221,21 +269,15 @@ def generate_html_report(
         # 默认简单 HTML
         html_content = f"<html><body><h1>Report</h1><pre>{report_data}</pre></body></html>"
 
-    # 写入文件
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # 写入文件（片段直接流式写入，只渲染、写入一次）
+    write_html_file(file_path, html_content)
 
     # 如果是每日汇总且启用 index 复制
     if is_daily_summary and enable_index_copy:
         # 生成到根目录（供 GitHub Pages 访问）
-        root_index_path = Path("index.html")
-        with open(root_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        link_or_copy(file_path, Path("index.html"))
 
         # 同时生成到 output 目录（供 Docker Volume 挂载访问）
-        output_index_path = Path(output_dir) / "index.html"
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        with open(output_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        link_or_copy(file_path, Path(output_dir) / "index.html")
 
     return file_path
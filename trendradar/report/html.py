@@ -2,901 +2,61 @@
 """
 HTML 报告渲染模块
 
-提供 HTML 格式的热点新闻报告生成功能
+提供 HTML 格式的热点新闻报告生成功能。
+报告按片段生成（iter_html_chunks），各区块内部用列表收集后一次 join，
+可以直接流式写入文件，渲染耗时和内存都与标题数量成线性关系。
+页面框架（CSS、JS、页头页脚）来自预编译模板 assets/report.html，见 template.py。
+传入 FragmentCache 时，关键词组 / 新增来源组 / RSS 分组按输入内容复用上次的渲染结果。
 """
 
 from datetime import datetime
 import json
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterable, Iterator, List, Optional, Callable
 
+from trendradar.report.fragment_cache import FragmentCache
 from trendradar.report.helpers import html_escape
+from trendradar.report.template import get_template, load_asset
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-    *,
-    reverse_content_order: bool = False,
-    get_time_func: Optional[Callable[[], datetime]] = None,
-    rss_items: Optional[List[Dict]] = None,
-    rss_new_items: Optional[List[Dict]] = None,
-    display_mode: str = "keyword",
-) -> str:
-    """渲染HTML内容
+def _fragment(fragment_cache: Optional[FragmentCache], render_func: Callable[..., str], *args) -> str:
+    """渲染分组片段，提供了片段缓存时输入未变化的分组直接复用"""
+    if fragment_cache is None:
+        return render_func(*args)
+    return fragment_cache.render(render_func, *args)
 
-    Args:
-        report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
-        total_titles: 新闻总数
-        is_daily_summary: 是否为当日汇总
-        mode: 报告模式 ("daily", "current", "incremental")
-        update_info: 更新信息（可选）
-        reverse_content_order: 是否反转内容顺序（新增热点在前）
-        get_time_func: 获取当前时间的函数（可选，默认使用 datetime.now）
-        rss_items: RSS 统计条目列表（可选）
-        rss_new_items: RSS 新增条目列表（可选）
-        display_mode: 显示模式 ("keyword"=按关键词分组, "platform"=按平台分组)
 
-    Returns:
-        渲染后的 HTML 字符串
-    """
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>热点新闻分析</title>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js" integrity="sha512-BNaRQnYJYiPSqHHDb58B0yaPfCu+Wgds8Gp/gU33kqBtgNS4tSPHuGibyoeqMV/TJlSKda6FXzoEyYGjTe+vXA==" crossorigin="anonymous" referrerpolicy="no-referrer"></script>
-        <style>
-            * { box-sizing: border-box; }
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
-                margin: 0;
-                padding: 16px;
-                background: #fafafa;
-                color: #333;
-                line-height: 1.5;
-            }
-
-            .container {
-                max-width: 600px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 12px;
-                overflow: hidden;
-                box-shadow: 0 2px 16px rgba(0,0,0,0.06);
-            }
-
-            .header {
-                background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
-                color: white;
-                padding: 32px 24px;
-                text-align: center;
-                position: relative;
-            }
-
-            .save-buttons {
-                position: absolute;
-                top: 16px;
-                right: 16px;
-                display: flex;
-                gap: 8px;
-            }
-
-            .save-btn {
-                background: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                color: white;
-                padding: 8px 16px;
-                border-radius: 6px;
-                cursor: pointer;
-                font-size: 13px;
-                font-weight: 500;
-                transition: all 0.2s ease;
-                backdrop-filter: blur(10px);
-                white-space: nowrap;
-            }
-
-            .save-btn:hover {
-                background: rgba(255, 255, 255, 0.3);
-                border-color: rgba(255, 255, 255, 0.5);
-                transform: translateY(-1px);
-            }
-
-            .save-btn:active {
-                transform: translateY(0);
-            }
-
-            .save-btn:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-            }
-
-            .header-title {
-                font-size: 22px;
-                font-weight: 700;
-                margin: 0 0 20px 0;
-            }
-
-            .header-info {
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 16px;
-                font-size: 14px;
-                opacity: 0.95;
-            }
-
-            .info-item {
-                text-align: center;
-            }
-
-            .info-label {
-                display: block;
-                font-size: 12px;
-                opacity: 0.8;
-                margin-bottom: 4px;
-            }
-
-            .info-value {
-                font-weight: 600;
-                font-size: 16px;
-            }
-
-            .content {
-                padding: 24px;
-            }
-
-            .ai-section {
-                margin-bottom: 36px;
-            }
-
-            .ai-section-header {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 16px;
-            }
-
-            .ai-section-title {
-                font-size: 18px;
-                font-weight: 700;
-                color: #111827;
-            }
-
-            .ai-section-subtitle {
-                font-size: 12px;
-                color: #6b7280;
-            }
-
-            .ai-grid {
-                display: grid;
-                gap: 12px;
-            }
-
-            .ai-card {
-                border: 1px solid #eef0f3;
-                border-radius: 12px;
-                padding: 14px 16px;
-                background: #ffffff;
-                text-align: left;
-                cursor: pointer;
-                transition: all 0.2s ease;
-            }
-
-            .ai-card:hover {
-                border-color: #c7d2fe;
-                box-shadow: 0 6px 18px rgba(79, 70, 229, 0.08);
-                transform: translateY(-1px);
-            }
-
-            .ai-card-top {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 8px;
-                gap: 8px;
-            }
-
-            .ai-category {
-                background: #eef2ff;
-                color: #4338ca;
-                font-size: 11px;
-                font-weight: 600;
-                padding: 4px 8px;
-                border-radius: 999px;
-            }
-
-            .ai-score {
-                font-size: 11px;
-                color: #6b7280;
-                white-space: nowrap;
-            }
-
-            .ai-title {
-                font-size: 16px;
-                font-weight: 600;
-                color: #111827;
-                margin-bottom: 6px;
-            }
-
-            .ai-summary {
-                font-size: 13px;
-                color: #4b5563;
-                line-height: 1.5;
-            }
-
-            .ai-tags {
-                margin-top: 10px;
-                display: flex;
-                flex-wrap: wrap;
-                gap: 6px;
-            }
-
-            .ai-tag {
-                font-size: 11px;
-                color: #1f2937;
-                background: #f3f4f6;
-                padding: 3px 8px;
-                border-radius: 999px;
-            }
-
-            .ai-modal {
-                position: fixed;
-                inset: 0;
-                background: rgba(15, 23, 42, 0.55);
-                display: none;
-                align-items: center;
-                justify-content: center;
-                z-index: 1000;
-                padding: 16px;
-            }
-
-            .ai-modal.active {
-                display: flex;
-            }
-
-            .ai-modal-content {
-                background: #ffffff;
-                border-radius: 16px;
-                max-width: 720px;
-                width: 100%;
-                max-height: 85vh;
-                overflow: auto;
-                padding: 22px 24px;
-                box-shadow: 0 24px 60px rgba(15, 23, 42, 0.25);
-                position: relative;
-            }
-
-            .ai-modal-close {
-                position: absolute;
-                top: 16px;
-                right: 16px;
-                border: none;
-                background: #f3f4f6;
-                width: 32px;
-                height: 32px;
-                border-radius: 999px;
-                cursor: pointer;
-                font-size: 18px;
-            }
-
-            .ai-modal-header {
-                margin-bottom: 16px;
-            }
-
-            .ai-modal-title {
-                font-size: 20px;
-                font-weight: 700;
-                color: #111827;
-                margin: 8px 0 10px;
-            }
-
-            .ai-modal-summary {
-                font-size: 14px;
-                color: #374151;
-                line-height: 1.6;
-                white-space: pre-wrap;
-            }
-
-            .ai-modal-section {
-                margin-top: 18px;
-            }
-
-            .ai-modal-label {
-                font-size: 12px;
-                font-weight: 600;
-                color: #6b7280;
-                text-transform: uppercase;
-                letter-spacing: 0.08em;
-                margin-bottom: 8px;
-            }
-
-            .ai-modal-list {
-                margin: 0;
-                padding-left: 18px;
-                color: #374151;
-                font-size: 14px;
-                line-height: 1.6;
-            }
-
-            .ai-modal-sources {
-                display: grid;
-                gap: 8px;
-            }
-
-            .ai-source-link {
-                display: inline-flex;
-                flex-direction: column;
-                gap: 2px;
-                text-decoration: none;
-                color: #1d4ed8;
-                font-size: 13px;
-            }
-
-            .ai-source-meta {
-                font-size: 11px;
-                color: #6b7280;
-            }
-
-            .word-group {
-                margin-bottom: 40px;
-            }
-
-            .word-group:first-child {
-                margin-top: 0;
-            }
-
-            .word-header {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 20px;
-                padding-bottom: 8px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-
-            .word-info {
-                display: flex;
-                align-items: center;
-                gap: 12px;
-            }
-
-            .word-name {
-                font-size: 17px;
-                font-weight: 600;
-                color: #1a1a1a;
-            }
-
-            .word-count {
-                color: #666;
-                font-size: 13px;
-                font-weight: 500;
-            }
-
-            .word-count.hot { color: #dc2626; font-weight: 600; }
-            .word-count.warm { color: #ea580c; font-weight: 600; }
-
-            .word-index {
-                color: #999;
-                font-size: 12px;
-            }
-
-            .news-item {
-                margin-bottom: 20px;
-                padding: 16px 0;
-                border-bottom: 1px solid #f5f5f5;
-                position: relative;
-                display: flex;
-                gap: 12px;
-                align-items: center;
-            }
-
-            .news-item:last-child {
-                border-bottom: none;
-            }
-
-            .news-item.new::after {
-                content: "NEW";
-                position: absolute;
-                top: 12px;
-                right: 0;
-                background: #fbbf24;
-                color: #92400e;
-                font-size: 9px;
-                font-weight: 700;
-                padding: 3px 6px;
-                border-radius: 4px;
-                letter-spacing: 0.5px;
-            }
-
-            .news-number {
-                color: #999;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 20px;
-                text-align: center;
-                flex-shrink: 0;
-                background: #f8f9fa;
-                border-radius: 50%;
-                width: 24px;
-                height: 24px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                align-self: flex-start;
-                margin-top: 8px;
-            }
-
-            .news-content {
-                flex: 1;
-                min-width: 0;
-                padding-right: 40px;
-            }
-
-            .news-item.new .news-content {
-                padding-right: 50px;
-            }
-
-            .news-header {
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                margin-bottom: 8px;
-                flex-wrap: wrap;
-            }
-
-            .source-name {
-                color: #666;
-                font-size: 12px;
-                font-weight: 500;
-            }
-
-            .keyword-tag {
-                color: #2563eb;
-                font-size: 12px;
-                font-weight: 500;
-                background: #eff6ff;
-                padding: 2px 6px;
-                border-radius: 4px;
-            }
-
-            .rank-num {
-                color: #fff;
-                background: #6b7280;
-                font-size: 10px;
-                font-weight: 700;
-                padding: 2px 6px;
-                border-radius: 10px;
-                min-width: 18px;
-                text-align: center;
-            }
-
-            .rank-num.top { background: #dc2626; }
-            .rank-num.high { background: #ea580c; }
-
-            .time-info {
-                color: #999;
-                font-size: 11px;
-            }
-
-            .count-info {
-                color: #059669;
-                font-size: 11px;
-                font-weight: 500;
-            }
-
-            .news-title {
-                font-size: 15px;
-                line-height: 1.4;
-                color: #1a1a1a;
-                margin: 0;
-            }
-
-            .news-link {
-                color: #2563eb;
-                text-decoration: none;
-            }
-
-            .news-link:hover {
-                text-decoration: underline;
-            }
-
-            .news-link:visited {
-                color: #7c3aed;
-            }
-
-            .new-section {
-                margin-top: 40px;
-                padding-top: 24px;
-                border-top: 2px solid #f0f0f0;
-            }
-
-            .new-section-title {
-                color: #1a1a1a;
-                font-size: 16px;
-                font-weight: 600;
-                margin: 0 0 20px 0;
-            }
-
-            .new-source-group {
-                margin-bottom: 24px;
-            }
-
-            .new-source-title {
-                color: #666;
-                font-size: 13px;
-                font-weight: 500;
-                margin: 0 0 12px 0;
-                padding-bottom: 6px;
-                border-bottom: 1px solid #f5f5f5;
-            }
-
-            .new-item {
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                padding: 8px 0;
-                border-bottom: 1px solid #f9f9f9;
-            }
-
-            .new-item:last-child {
-                border-bottom: none;
-            }
-
-            .new-item-number {
-                color: #999;
-                font-size: 12px;
-                font-weight: 600;
-                min-width: 18px;
-                text-align: center;
-                flex-shrink: 0;
-                background: #f8f9fa;
-                border-radius: 50%;
-                width: 20px;
-                height: 20px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }
-
-            .new-item-rank {
-                color: #fff;
-                background: #6b7280;
-                font-size: 10px;
-                font-weight: 700;
-                padding: 3px 6px;
-                border-radius: 8px;
-                min-width: 20px;
-                text-align: center;
-                flex-shrink: 0;
-            }
-
-            .new-item-rank.top { background: #dc2626; }
-            .new-item-rank.high { background: #ea580c; }
-
-            .new-item-content {
-                flex: 1;
-                min-width: 0;
-            }
-
-            .new-item-title {
-                font-size: 14px;
-                line-height: 1.4;
-                color: #1a1a1a;
-                margin: 0;
-            }
-
-            .error-section {
-                background: #fef2f2;
-                border: 1px solid #fecaca;
-                border-radius: 8px;
-                padding: 16px;
-                margin-bottom: 24px;
-            }
-
-            .error-title {
-                color: #dc2626;
-                font-size: 14px;
-                font-weight: 600;
-                margin: 0 0 8px 0;
-            }
-
-            .error-list {
-                list-style: none;
-                padding: 0;
-                margin: 0;
-            }
-
-            .error-item {
-                color: #991b1b;
-                font-size: 13px;
-                padding: 2px 0;
-                font-family: 'SF Mono', Consolas, monospace;
-            }
-
-            .footer {
-                margin-top: 32px;
-                padding: 20px 24px;
-                background: #f8f9fa;
-                border-top: 1px solid #e5e7eb;
-                text-align: center;
-            }
-
-            .footer-content {
-                font-size: 13px;
-                color: #6b7280;
-                line-height: 1.6;
-            }
-
-            .footer-link {
-                color: #4f46e5;
-                text-decoration: none;
-                font-weight: 500;
-                transition: color 0.2s ease;
-            }
-
-            .footer-link:hover {
-                color: #7c3aed;
-                text-decoration: underline;
-            }
-
-            .project-name {
-                font-weight: 600;
-                color: #374151;
-            }
-
-            @media (max-width: 480px) {
-                body { padding: 12px; }
-                .header { padding: 24px 20px; }
-                .content { padding: 20px; }
-                .footer { padding: 16px 20px; }
-                .header-info { grid-template-columns: 1fr; gap: 12px; }
-                .news-header { gap: 6px; }
-                .news-content { padding-right: 45px; }
-                .news-item { gap: 8px; }
-                .new-item { gap: 8px; }
-                .news-number { width: 20px; height: 20px; font-size: 12px; }
-                .save-buttons {
-                    position: static;
-                    margin-bottom: 16px;
-                    display: flex;
-                    gap: 8px;
-                    justify-content: center;
-                    flex-direction: column;
-                    width: 100%;
-                }
-                .save-btn {
-                    width: 100%;
-                }
-            }
-
-            /* RSS 订阅内容样式 */
-            .rss-section {
-                margin-top: 32px;
-                padding-top: 24px;
-                border-top: 2px solid #e5e7eb;
-            }
-
-            .rss-section-header {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 20px;
-            }
-
-            .rss-section-title {
-                font-size: 18px;
-                font-weight: 600;
-                color: #059669;
-            }
-
-            .rss-section-count {
-                color: #6b7280;
-                font-size: 14px;
-            }
-
-            .feed-group {
-                margin-bottom: 24px;
-            }
-
-            .feed-group:last-child {
-                margin-bottom: 0;
-            }
-
-            .feed-header {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 12px;
-                padding-bottom: 8px;
-                border-bottom: 2px solid #10b981;
-            }
-
-            .feed-name {
-                font-size: 15px;
-                font-weight: 600;
-                color: #059669;
-            }
-
-            .feed-count {
-                color: #666;
-                font-size: 13px;
-                font-weight: 500;
-            }
-
-            .rss-item {
-                margin-bottom: 12px;
-                padding: 14px;
-                background: #f0fdf4;
-                border-radius: 8px;
-                border-left: 3px solid #10b981;
-            }
-
-            .rss-item:last-child {
-                margin-bottom: 0;
-            }
-
-            .rss-meta {
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                margin-bottom: 6px;
-                flex-wrap: wrap;
-            }
-
-            .rss-time {
-                color: #6b7280;
-                font-size: 12px;
-            }
-
-            .rss-author {
-                color: #059669;
-                font-size: 12px;
-                font-weight: 500;
-            }
-
-            .rss-title {
-                font-size: 14px;
-                line-height: 1.5;
-                margin-bottom: 6px;
-            }
-
-            .rss-link {
-                color: #1f2937;
-                text-decoration: none;
-                font-weight: 500;
-            }
-
-            .rss-link:hover {
-                color: #059669;
-                text-decoration: underline;
-            }
-
-            .rss-summary {
-                font-size: 13px;
-                color: #6b7280;
-                line-height: 1.5;
-                margin: 0;
-                display: -webkit-box;
-                -webkit-line-clamp: 2;
-                -webkit-box-orient: vertical;
-                overflow: hidden;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <div class="save-buttons">
-                    <button class="save-btn" onclick="saveAsImage()">保存为图片</button>
-                    <button class="save-btn" onclick="saveAsMultipleImages()">分段保存</button>
-                </div>
-                <div class="header-title">热点新闻分析</div>
-                <div class="header-info">
-                    <div class="info-item">
-                        <span class="info-label">报告类型</span>
-                        <span class="info-value">"""
+def _short_summary(text: str, limit: int = 120) -> str:
+    cleaned = " ".join(text.strip().split())
+    if len(cleaned) <= limit:
+        return cleaned
+    return cleaned[:limit].rstrip() + "..."
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
 
-    html += f"{total_titles} 条"
+def _iter_ai_chunks(ai_themes: List[Dict]) -> Iterator[str]:
+    """AI 聚合主题卡片区块"""
+    if not ai_themes:
+        return
 
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    # 使用提供的时间函数或默认 datetime.now
-    if get_time_func:
-        now = get_time_func()
-    else:
-        now = datetime.now()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
-                </div>
-            </div>
-
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    ai_themes = report_data.get("ai_themes", [])
-    ai_html = ""
-    ai_modal_html = ""
-    ai_js_data = ""
-
-    def _short_summary(text: str, limit: int = 120) -> str:
-        cleaned = " ".join(text.strip().split())
-        if len(cleaned) <= limit:
-            return cleaned
-        return cleaned[:limit].rstrip() + "..."
-
-    if ai_themes:
-        total_ai = len(ai_themes)
-        ai_html += """
+    yield f"""
                 <div class="ai-section">
                     <div class="ai-section-header">
                         <div class="ai-section-title">AI 聚合分析</div>
-                        <div class="ai-section-subtitle">"""
-        ai_html += f"{total_ai} 个主题</div>"
-        ai_html += """
+                        <div class="ai-section-subtitle">{len(ai_themes)} 个主题</div>
                     </div>
                     <div class="ai-grid">"""
 
-        for idx, theme in enumerate(ai_themes):
-            title = html_escape(theme.get("title", ""))
-            summary = html_escape(_short_summary(theme.get("summary", "")))
-            category = html_escape(theme.get("category", "其他"))
-            importance = theme.get("importance", 0)
-            impact = theme.get("impact", 0)
-            tags = theme.get("tags", [])
-            tags_html = "".join(
-                f'<span class="ai-tag">{html_escape(tag)}</span>' for tag in tags
-            )
-
-            ai_html += f"""
+    for idx, theme in enumerate(ai_themes):
+        title = html_escape(theme.get("title", ""))
+        summary = html_escape(_short_summary(theme.get("summary", "")))
+        category = html_escape(theme.get("category", "其他"))
+        importance = theme.get("importance", 0)
+        impact = theme.get("impact", 0)
+        tags = theme.get("tags", [])
+        tags_html = "".join(
+            f'<span class="ai-tag">{html_escape(tag)}</span>' for tag in tags
+        )
+
+        yield f"""
                         <button class="ai-card" data-theme-index="{idx}">
                             <div class="ai-card-top">
                                 <span class="ai-category">{category}</span>
@@ -907,775 +67,507 @@ def render_html_content(
                             <div class="ai-tags">{tags_html}</div>
                         </button>"""
 
-        ai_html += """
+    yield """
                     </div>
                 </div>"""
 
-        ai_modal_html = """
-        <div class="ai-modal" id="ai-modal">
-            <div class="ai-modal-content" role="dialog" aria-modal="true">
-                <button class="ai-modal-close" id="ai-modal-close" aria-label="Close">×</button>
-                <div class="ai-modal-header">
-                    <span class="ai-category" id="ai-modal-category"></span>
-                    <div class="ai-modal-title" id="ai-modal-title"></div>
-                    <div class="ai-tags" id="ai-modal-tags"></div>
-                </div>
-                <div class="ai-modal-section">
-                    <div class="ai-modal-label">AI 总结</div>
-                    <div class="ai-modal-summary" id="ai-modal-summary"></div>
-                </div>
-                <div class="ai-modal-section">
-                    <div class="ai-modal-label">关键要点</div>
-                    <ul class="ai-modal-list" id="ai-modal-points"></ul>
-                </div>
-                <div class="ai-modal-section">
-                    <div class="ai-modal-label">数据源链接</div>
-                    <div class="ai-modal-sources" id="ai-modal-sources"></div>
-                </div>
-            </div>
-        </div>
-        """
-
-        ai_data_json = json.dumps(ai_themes, ensure_ascii=False).replace("</", "<\\/")
-        ai_js_data = f"const aiThemes = {ai_data_json};"
-
-    # 生成热点词汇统计部分的HTML
-    stats_html = ""
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
 
-            escaped_word = html_escape(stat["word"])
+def _render_word_group(index: int, total_count: int, stat: Dict, display_mode: str) -> str:
+    """
+    渲染单个热点词组
+
+    Args:
+        index: 词组序号（从 1 开始）
+        total_count: 词组总数
+        stat: 词组统计（word, count, titles）
+        display_mode: 显示模式 ("keyword" 显示来源, "platform" 显示关键词)
 
-            stats_html += f"""
+    Returns:
+        词组 HTML
+    """
+    count = stat["count"]
+
+    # 确定热度等级
+    if count >= 10:
+        count_class = "hot"
+    elif count >= 5:
+        count_class = "warm"
+    else:
+        count_class = ""
+
+    escaped_word = html_escape(stat["word"])
+
+    parts = [f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
                             <div class="word-name">{escaped_word}</div>
                             <div class="word-count {count_class}">{count} 条</div>
                         </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
+                        <div class="word-index">{index}/{total_count}</div>
+                    </div>"""]
 
-            # 处理每个词组下的新闻标题，给每条新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
+    # 处理每个词组下的新闻标题，给每条新闻标上序号
+    for j, title_data in enumerate(stat["titles"], 1):
+        is_new = title_data.get("is_new", False)
+        new_class = "new" if is_new else ""
 
-                stats_html += f"""
+        parts.append(f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
-                            <div class="news-header">"""
-
-                # 根据 display_mode 决定显示来源还是关键词
-                if display_mode == "keyword":
-                    # keyword 模式：显示来源
-                    stats_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
-                else:
-                    # platform 模式：显示关键词
-                    matched_keyword = title_data.get("matched_keyword", "")
-                    if matched_keyword:
-                        stats_html += f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>'
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    stats_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    stats_html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    stats_html += f'<span class="count-info">{count_info}次</span>'
-
-                stats_html += """
+                            <div class="news-header">""")
+
+        # 根据 display_mode 决定显示来源还是关键词
+        if display_mode == "keyword":
+            # keyword 模式：显示来源
+            parts.append(f'<span class="source-name">{html_escape(title_data["source_name"])}</span>')
+        else:
+            # platform 模式：显示关键词
+            matched_keyword = title_data.get("matched_keyword", "")
+            if matched_keyword:
+                parts.append(f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>')
+
+        # 处理排名显示
+        ranks = title_data.get("ranks", [])
+        if ranks:
+            min_rank = min(ranks)
+            max_rank = max(ranks)
+            rank_threshold = title_data.get("rank_threshold", 10)
+
+            # 确定排名等级
+            if min_rank <= 3:
+                rank_class = "top"
+            elif min_rank <= rank_threshold:
+                rank_class = "high"
+            else:
+                rank_class = ""
+
+            if min_rank == max_rank:
+                rank_text = str(min_rank)
+            else:
+                rank_text = f"{min_rank}-{max_rank}"
+
+            parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
+
+        # 处理时间显示
+        time_display = title_data.get("time_display", "")
+        if time_display:
+            # 简化时间显示格式，将波浪线替换为~
+            simplified_time = (
+                time_display.replace(" ~ ", "~")
+                .replace("[", "")
+                .replace("]", "")
+            )
+            parts.append(f'<span class="time-info">{html_escape(simplified_time)}</span>')
+
+        # 处理出现次数
+        count_info = title_data.get("count", 1)
+        if count_info > 1:
+            parts.append(f'<span class="count-info">{count_info}次</span>')
+
+        parts.append("""
                             </div>
-                            <div class="news-title">"""
+                            <div class="news-title">""")
 
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+        # 处理标题和链接
+        escaped_title = html_escape(title_data["title"])
+        link_url = title_data.get("mobile_url") or title_data.get("url", "")
 
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    stats_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    stats_html += escaped_title
+        if link_url:
+            escaped_url = html_escape(link_url)
+            parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
+        else:
+            parts.append(escaped_title)
 
-                stats_html += """
+        parts.append("""
                             </div>
                         </div>
-                    </div>"""
+                    </div>""")
 
-            stats_html += """
-                </div>"""
+    parts.append("""
+                </div>""")
+    return "".join(parts)
 
-    # 生成新增新闻区域的HTML
-    new_titles_html = ""
-    if report_data["new_titles"]:
-        new_titles_html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
 
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
+def _iter_stats_chunks(
+    stats: List[Dict], display_mode: str, fragment_cache: Optional[FragmentCache] = None
+) -> Iterator[str]:
+    """热点词汇统计区块，每个词组一个片段"""
+    total_count = len(stats)
+    for i, stat in enumerate(stats, 1):
+        yield _fragment(fragment_cache, _render_word_group, i, total_count, stat, display_mode)
 
-            new_titles_html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
 
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
+def _render_new_source_group(source_data: Dict) -> str:
+    """
+    渲染单个来源的新增热点
 
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                new_titles_html += f"""
+    Args:
+        source_data: 来源数据（source_name, titles）
+
+    Returns:
+        来源分组 HTML
+    """
+    escaped_source = html_escape(source_data["source_name"])
+    titles_count = len(source_data["titles"])
+
+    parts = [f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""]
+
+    # 为新增新闻也添加序号
+    for idx, title_data in enumerate(source_data["titles"], 1):
+        ranks = title_data.get("ranks", [])
+
+        # 处理新增新闻的排名显示
+        rank_class = ""
+        if ranks:
+            min_rank = min(ranks)
+            if min_rank <= 3:
+                rank_class = "top"
+            elif min_rank <= title_data.get("rank_threshold", 10):
+                rank_class = "high"
+
+            if len(ranks) == 1:
+                rank_text = str(ranks[0])
+            else:
+                rank_text = f"{min(ranks)}-{max(ranks)}"
+        else:
+            rank_text = "?"
+
+        parts.append(f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
                             <div class="new-item-content">
-                                <div class="new-item-title">"""
+                                <div class="new-item-title">""")
 
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+        # 处理新增新闻的链接
+        escaped_title = html_escape(title_data["title"])
+        link_url = title_data.get("mobile_url") or title_data.get("url", "")
 
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    new_titles_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    new_titles_html += escaped_title
+        if link_url:
+            escaped_url = html_escape(link_url)
+            parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
+        else:
+            parts.append(escaped_title)
 
-                new_titles_html += """
+        parts.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
+
+    parts.append("""
+                    </div>""")
+    return "".join(parts)
 
-            new_titles_html += """
-                    </div>"""
 
-        new_titles_html += """
+def _iter_new_titles_chunks(
+    report_data: Dict, fragment_cache: Optional[FragmentCache] = None
+) -> Iterator[str]:
+    """本次新增热点区块，每个来源一个片段"""
+    if not report_data["new_titles"]:
+        return
+
+    yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+
+    for source_data in report_data["new_titles"]:
+        yield _fragment(fragment_cache, _render_new_source_group, source_data)
+
+    yield """
                 </div>"""
 
-    # 生成 RSS 统计内容
-    def render_rss_stats_html(stats: List[Dict], title: str = "RSS 订阅更新") -> str:
-        """渲染 RSS 统计区块 HTML
-
-        Args:
-            stats: RSS 分组统计列表，格式与热榜一致：
-                [
-                    {
-                        "word": "关键词",
-                        "count": 5,
-                        "titles": [
-                            {
-                                "title": "标题",
-                                "source_name": "Feed 名称",
-                                "time_display": "12-29 08:20",
-                                "url": "...",
-                                "is_new": True/False
-                            }
-                        ]
-                    }
-                ]
-            title: 区块标题
-
-        Returns:
-            渲染后的 HTML 字符串
-        """
-        if not stats:
-            return ""
-
-        # 计算总条目数
-        total_count = sum(stat.get("count", 0) for stat in stats)
-        if total_count == 0:
-            return ""
-
-        rss_html = f"""
-                <div class="rss-section">
-                    <div class="rss-section-header">
-                        <div class="rss-section-title">{title}</div>
-                        <div class="rss-section-count">{total_count} 条</div>
-                    </div>"""
 
-        # 按关键词分组渲染（与热榜格式一致）
-        for stat in stats:
-            keyword = stat.get("word", "")
-            titles = stat.get("titles", [])
-            if not titles:
-                continue
+def _render_rss_group(stat: Dict) -> str:
+    """
+    渲染单个 RSS 关键词分组
+
+    Args:
+        stat: 分组统计（word, titles），titles 非空
 
-            keyword_count = len(titles)
+    Returns:
+        分组 HTML
+    """
+    titles = stat.get("titles", [])
 
-            rss_html += f"""
+    parts = [f"""
                     <div class="feed-group">
                         <div class="feed-header">
-                            <div class="feed-name">{html_escape(keyword)}</div>
-                            <div class="feed-count">{keyword_count} 条</div>
-                        </div>"""
-
-            for title_data in titles:
-                item_title = title_data.get("title", "")
-                url = title_data.get("url", "")
-                time_display = title_data.get("time_display", "")
-                source_name = title_data.get("source_name", "")
-                is_new = title_data.get("is_new", False)
-
-                rss_html += """
+                            <div class="feed-name">{html_escape(stat.get("word", ""))}</div>
+                            <div class="feed-count">{len(titles)} 条</div>
+                        </div>"""]
+
+    for title_data in titles:
+        item_title = title_data.get("title", "")
+        url = title_data.get("url", "")
+        time_display = title_data.get("time_display", "")
+        source_name = title_data.get("source_name", "")
+        is_new = title_data.get("is_new", False)
+
+        parts.append("""
                         <div class="rss-item">
-                            <div class="rss-meta">"""
+                            <div class="rss-meta">""")
 
-                if time_display:
-                    rss_html += f'<span class="rss-time">{html_escape(time_display)}</span>'
+        if time_display:
+            parts.append(f'<span class="rss-time">{html_escape(time_display)}</span>')
 
-                if source_name:
-                    rss_html += f'<span class="rss-author">{html_escape(source_name)}</span>'
+        if source_name:
+            parts.append(f'<span class="rss-author">{html_escape(source_name)}</span>')
 
-                if is_new:
-                    rss_html += '<span class="rss-author" style="color: #dc2626;">NEW</span>'
+        if is_new:
+            parts.append('<span class="rss-author" style="color: #dc2626;">NEW</span>')
 
-                rss_html += """
+        parts.append("""
                             </div>
-                            <div class="rss-title">"""
-
-                escaped_title = html_escape(item_title)
-                if url:
-                    # 如果有theme_id，使用AI分析总结页面的链接
-                    if title_data.get("theme_id"):
-                        theme_id = title_data.get("theme_id")
-                        rss_html += f'<a href="/api/themes/{theme_id}" target="_blank" class="rss-link">{escaped_title}</a>'
-                    else:
-                        # 否则使用原始URL
-                        escaped_url = html_escape(url)
-                        rss_html += f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>'
-                else:
-                    rss_html += escaped_title
-
-                rss_html += """
+                            <div class="rss-title">""")
+
+        escaped_title = html_escape(item_title)
+        if url:
+            # 如果有theme_id，使用AI分析总结页面的链接
+            if title_data.get("theme_id"):
+                theme_id = title_data.get("theme_id")
+                parts.append(f'<a href="/api/themes/{theme_id}" target="_blank" class="rss-link">{escaped_title}</a>')
+            else:
+                # 否则使用原始URL
+                escaped_url = html_escape(url)
+                parts.append(f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>')
+        else:
+            parts.append(escaped_title)
+
+        parts.append("""
                             </div>
-                        </div>"""
+                        </div>""")
+
+    parts.append("""
+                    </div>""")
+    return "".join(parts)
+
+
+def _iter_rss_chunks(
+    stats: Optional[List[Dict]],
+    title: str = "RSS 订阅更新",
+    fragment_cache: Optional[FragmentCache] = None,
+) -> Iterator[str]:
+    """渲染 RSS 统计区块
+
+    Args:
+        stats: RSS 分组统计列表，格式与热榜一致：
+            [
+                {
+                    "word": "关键词",
+                    "count": 5,
+                    "titles": [
+                        {
+                            "title": "标题",
+                            "source_name": "Feed 名称",
+                            "time_display": "12-29 08:20",
+                            "url": "...",
+                            "is_new": True/False
+                        }
+                    ]
+                }
+            ]
+        title: 区块标题
+        fragment_cache: 片段缓存（可选）
+
+    Yields:
+        区块 HTML 片段（每个分组一个）
+    """
+    if not stats:
+        return
+
+    # 计算总条目数
+    total_count = sum(stat.get("count", 0) for stat in stats)
+    if total_count == 0:
+        return
 
-            rss_html += """
+    yield f"""
+                <div class="rss-section">
+                    <div class="rss-section-header">
+                        <div class="rss-section-title">{title}</div>
+                        <div class="rss-section-count">{total_count} 条</div>
                     </div>"""
 
-        rss_html += """
+    # 按关键词分组渲染（与热榜格式一致）
+    for stat in stats:
+        if stat.get("titles"):
+            yield _fragment(fragment_cache, _render_rss_group, stat)
+
+    yield """
                 </div>"""
-        return rss_html
 
-    # 生成 RSS 统计和新增 HTML
-    rss_stats_html = render_rss_stats_html(rss_items, "RSS 订阅更新") if rss_items else ""
-    rss_new_html = render_rss_stats_html(rss_new_items, "RSS 新增更新") if rss_new_items else ""
+
+def _iter_content_chunks(
+    report_data: Dict,
+    reverse_content_order: bool,
+    rss_items: Optional[List[Dict]],
+    rss_new_items: Optional[List[Dict]],
+    display_mode: str,
+    fragment_cache: Optional[FragmentCache] = None,
+) -> Iterator[str]:
+    """报告正文：失败平台、AI 聚合、热榜统计/新增、RSS 统计/新增"""
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    ai_section = _iter_ai_chunks(report_data.get("ai_themes", []))
+    stats_section = _iter_stats_chunks(report_data["stats"], display_mode, fragment_cache)
+    new_titles_section = _iter_new_titles_chunks(report_data, fragment_cache)
+    rss_stats_section = _iter_rss_chunks(rss_items, "RSS 订阅更新", fragment_cache)
+    rss_new_section = _iter_rss_chunks(rss_new_items, "RSS 新增更新", fragment_cache)
 
     # 根据配置决定内容顺序（与推送逻辑一致）
     if reverse_content_order:
         # 新增在前，统计在后
         # 顺序：AI 聚合 → 热榜新增 → RSS新增 → 热榜统计 → RSS统计
-        html += ai_html + new_titles_html + rss_new_html + stats_html + rss_stats_html
+        sections = (ai_section, new_titles_section, rss_new_section, stats_section, rss_stats_section)
     else:
         # 默认：统计在前，新增在后
         # 顺序：AI 聚合 → 热榜统计 → RSS统计 → 热榜新增 → RSS新增
-        html += ai_html + stats_html + rss_stats_html + new_titles_html + rss_new_html
+        sections = (ai_section, stats_section, rss_stats_section, new_titles_section, rss_new_section)
 
-    html += """
-            </div>
+    for section in sections:
+        yield from section
 
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 ·
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>"""
 
+def iter_html_chunks(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    *,
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+    rss_items: Optional[List[Dict]] = None,
+    rss_new_items: Optional[List[Dict]] = None,
+    display_mode: str = "keyword",
+    fragment_cache: Optional[FragmentCache] = None,
+) -> Iterator[str]:
+    """按片段渲染HTML内容
+
+    Args:
+        report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
+        total_titles: 新闻总数
+        is_daily_summary: 是否为当日汇总
+        mode: 报告模式 ("daily", "current", "incremental")
+        update_info: 更新信息（可选）
+        reverse_content_order: 是否反转内容顺序（新增热点在前）
+        get_time_func: 获取当前时间的函数（可选，默认使用 datetime.now）
+        rss_items: RSS 统计条目列表（可选）
+        rss_new_items: RSS 新增条目列表（可选）
+        display_mode: 显示模式 ("keyword"=按关键词分组, "platform"=按平台分组)
+        fragment_cache: 分组片段缓存（可选），输入未变化的分组复用上次的渲染结果
+
+    Yields:
+        HTML 片段，按顺序拼接即为完整报告
+    """
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            report_type = "当前榜单"
+        elif mode == "incremental":
+            report_type = "增量模式"
+        else:
+            report_type = "当日汇总"
+    else:
+        report_type = "实时分析"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    # 使用提供的时间函数或默认 datetime.now
+    if get_time_func:
+        now = get_time_func()
+    else:
+        now = datetime.now()
+
+    update_html = ""
     if update_info:
-        html += f"""
+        update_html = f"""
                     <br>
                     <span style="color: #ea580c; font-weight: 500;">
                         发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
                     </span>"""
 
-    html += """
-                </div>
-            </div>
-        </div>
-"""
+    ai_themes = report_data.get("ai_themes", [])
+    ai_modal = ""
+    ai_script: Iterable[str] = ""
+    if ai_themes:
+        ai_modal = load_asset("report_ai_modal.html")
+        ai_script = get_template("report_ai_script.js").iter_render({
+            "ai_themes_json": json.dumps(ai_themes, ensure_ascii=False).replace("</", "<\\/"),
+        })
+
+    yield from get_template("report.html").iter_render({
+        "report_type": report_type,
+        "total_titles": str(total_titles),
+        "hot_news_count": str(hot_news_count),
+        "generated_at": now.strftime("%m-%d %H:%M"),
+        "content": _iter_content_chunks(
+            report_data, reverse_content_order, rss_items, rss_new_items, display_mode,
+            fragment_cache,
+        ),
+        "update_info": update_html,
+        "ai_modal": ai_modal,
+        "ai_script": ai_script,
+    })
 
-    if ai_modal_html:
-        html += ai_modal_html
 
-    html += """
-        <script>
-"""
-    if ai_js_data:
-        html += f"""
-            {ai_js_data}
-            const aiModal = document.getElementById('ai-modal');
-            if (aiModal && Array.isArray(aiThemes)) {{
-                const modalClose = document.getElementById('ai-modal-close');
-                const modalCategory = document.getElementById('ai-modal-category');
-                const modalTitle = document.getElementById('ai-modal-title');
-                const modalTags = document.getElementById('ai-modal-tags');
-                const modalSummary = document.getElementById('ai-modal-summary');
-                const modalPoints = document.getElementById('ai-modal-points');
-                const modalSources = document.getElementById('ai-modal-sources');
-
-                const clearNode = (node) => {{
-                    while (node.firstChild) {{
-                        node.removeChild(node.firstChild);
-                    }}
-                }};
-
-                const closeModal = () => {{
-                    aiModal.classList.remove('active');
-                    document.body.style.overflow = '';
-                }};
-
-                const openTheme = (index) => {{
-                    const theme = aiThemes[index];
-                    if (!theme) {{
-                        return;
-                    }}
-                    modalCategory.textContent = theme.category || '其他';
-                    modalTitle.textContent = theme.title || '';
-                    modalSummary.textContent = theme.summary || '';
-
-                    clearNode(modalTags);
-                    (theme.tags || []).forEach((tag) => {{
-                        const tagEl = document.createElement('span');
-                        tagEl.className = 'ai-tag';
-                        tagEl.textContent = tag;
-                        modalTags.appendChild(tagEl);
-                    }});
-
-                    clearNode(modalPoints);
-                    const points = theme.key_points || [];
-                    if (points.length > 0) {{
-                        points.forEach((point) => {{
-                            const li = document.createElement('li');
-                            li.textContent = point;
-                            modalPoints.appendChild(li);
-                        }});
-                    }} else {{
-                        const li = document.createElement('li');
-                        li.textContent = '暂无关键要点';
-                        modalPoints.appendChild(li);
-                    }}
-
-                    clearNode(modalSources);
-                    const articles = theme.articles || [];
-                    if (articles.length > 0) {{
-                        articles.forEach((article) => {{
-                            const link = document.createElement('a');
-                            link.className = 'ai-source-link';
-                            link.href = article.url || '#';
-                            link.target = '_blank';
-                            link.rel = 'noopener';
-                            link.textContent = article.title || article.url || '来源链接';
-
-                            const meta = document.createElement('span');
-                            meta.className = 'ai-source-meta';
-                            const feedName = article.feed_name || '';
-                            const publishedAt = article.published_at || '';
-                            meta.textContent = [feedName, publishedAt].filter(Boolean).join(' · ');
-
-                            link.appendChild(meta);
-                            modalSources.appendChild(link);
-                        }});
-                    }} else {{
-                        const empty = document.createElement('div');
-                        empty.className = 'ai-source-meta';
-                        empty.textContent = '暂无来源链接';
-                        modalSources.appendChild(empty);
-                    }}
-
-                    aiModal.classList.add('active');
-                    document.body.style.overflow = 'hidden';
-                }};
-
-                document.querySelectorAll('.ai-card').forEach((card) => {{
-                    card.addEventListener('click', () => {{
-                        const index = Number(card.dataset.themeIndex || 0);
-                        openTheme(index);
-                    }});
-                }});
-
-                modalClose.addEventListener('click', closeModal);
-                aiModal.addEventListener('click', (event) => {{
-                    if (event.target === aiModal) {{
-                        closeModal();
-                    }}
-                }});
-                document.addEventListener('keydown', (event) => {{
-                    if (event.key === 'Escape') {{
-                        closeModal();
-                    }}
-                }});
-            }}
-"""
-    html += """
-            async function saveAsImage() {
-                const button = event.target;
-                const originalText = button.textContent;
-
-                try {
-                    button.textContent = '生成中...';
-                    button.disabled = true;
-                    window.scrollTo(0, 0);
-
-                    // 等待页面稳定
-                    await new Promise(resolve => setTimeout(resolve, 200));
-
-                    // 截图前隐藏按钮
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'hidden';
-
-                    // 再次等待确保按钮完全隐藏
-                    await new Promise(resolve => setTimeout(resolve, 100));
-
-                    const container = document.querySelector('.container');
-
-                    const canvas = await html2canvas(container, {
-                        backgroundColor: '#ffffff',
-                        scale: 1.5,
-                        useCORS: true,
-                        allowTaint: false,
-                        imageTimeout: 10000,
-                        removeContainer: false,
-                        foreignObjectRendering: false,
-                        logging: false,
-                        width: container.offsetWidth,
-                        height: container.offsetHeight,
-                        x: 0,
-                        y: 0,
-                        scrollX: 0,
-                        scrollY: 0,
-                        windowWidth: window.innerWidth,
-                        windowHeight: window.innerHeight
-                    });
-
-                    buttons.style.visibility = 'visible';
-
-                    const link = document.createElement('a');
-                    const now = new Date();
-                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
-
-                    link.download = filename;
-                    link.href = canvas.toDataURL('image/png', 1.0);
-
-                    // 触发下载
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-
-                    button.textContent = '保存成功!';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-
-                } catch (error) {
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
-
-            async function saveAsMultipleImages() {
-                const button = event.target;
-                const originalText = button.textContent;
-                const container = document.querySelector('.container');
-                const scale = 1.5;
-                const maxHeight = 5000 / scale;
-
-                try {
-                    button.textContent = '分析中...';
-                    button.disabled = true;
-
-                    // 获取所有可能的分割元素
-                    const newsItems = Array.from(container.querySelectorAll('.news-item'));
-                    const wordGroups = Array.from(container.querySelectorAll('.word-group'));
-                    const newSection = container.querySelector('.new-section');
-                    const errorSection = container.querySelector('.error-section');
-                    const header = container.querySelector('.header');
-                    const footer = container.querySelector('.footer');
-
-                    // 计算元素位置和高度
-                    const containerRect = container.getBoundingClientRect();
-                    const elements = [];
-
-                    // 添加header作为必须包含的元素
-                    elements.push({
-                        type: 'header',
-                        element: header,
-                        top: 0,
-                        bottom: header.offsetHeight,
-                        height: header.offsetHeight
-                    });
-
-                    // 添加错误信息（如果存在）
-                    if (errorSection) {
-                        const rect = errorSection.getBoundingClientRect();
-                        elements.push({
-                            type: 'error',
-                            element: errorSection,
-                            top: rect.top - containerRect.top,
-                            bottom: rect.bottom - containerRect.top,
-                            height: rect.height
-                        });
-                    }
-
-                    // 按word-group分组处理news-item
-                    wordGroups.forEach(group => {
-                        const groupRect = group.getBoundingClientRect();
-                        const groupNewsItems = group.querySelectorAll('.news-item');
-
-                        // 添加word-group的header部分
-                        const wordHeader = group.querySelector('.word-header');
-                        if (wordHeader) {
-                            const headerRect = wordHeader.getBoundingClientRect();
-                            elements.push({
-                                type: 'word-header',
-                                element: wordHeader,
-                                parent: group,
-                                top: groupRect.top - containerRect.top,
-                                bottom: headerRect.bottom - containerRect.top,
-                                height: headerRect.height
-                            });
-                        }
 
-                        // 添加每个news-item
-                        groupNewsItems.forEach(item => {
-                            const rect = item.getBoundingClientRect();
-                            elements.push({
-                                type: 'news-item',
-                                element: item,
-                                parent: group,
-                                top: rect.top - containerRect.top,
-                                bottom: rect.bottom - containerRect.top,
-                                height: rect.height
-                            });
-                        });
-                    });
-
-                    // 添加新增新闻部分
-                    if (newSection) {
-                        const rect = newSection.getBoundingClientRect();
-                        elements.push({
-                            type: 'new-section',
-                            element: newSection,
-                            top: rect.top - containerRect.top,
-                            bottom: rect.bottom - containerRect.top,
-                            height: rect.height
-                        });
-                    }
-
-                    // 添加footer
-                    const footerRect = footer.getBoundingClientRect();
-                    elements.push({
-                        type: 'footer',
-                        element: footer,
-                        top: footerRect.top - containerRect.top,
-                        bottom: footerRect.bottom - containerRect.top,
-                        height: footer.offsetHeight
-                    });
-
-                    // 计算分割点
-                    const segments = [];
-                    let currentSegment = { start: 0, end: 0, height: 0, includeHeader: true };
-                    let headerHeight = header.offsetHeight;
-                    currentSegment.height = headerHeight;
-
-                    for (let i = 1; i < elements.length; i++) {
-                        const element = elements[i];
-                        const potentialHeight = element.bottom - currentSegment.start;
-
-                        // 检查是否需要创建新分段
-                        if (potentialHeight > maxHeight && currentSegment.height > headerHeight) {
-                            // 在前一个元素结束处分割
-                            currentSegment.end = elements[i - 1].bottom;
-                            segments.push(currentSegment);
-
-                            // 开始新分段
-                            currentSegment = {
-                                start: currentSegment.end,
-                                end: 0,
-                                height: element.bottom - currentSegment.end,
-                                includeHeader: false
-                            };
-                        } else {
-                            currentSegment.height = potentialHeight;
-                            currentSegment.end = element.bottom;
-                        }
-                    }
-
-                    // 添加最后一个分段
-                    if (currentSegment.height > 0) {
-                        currentSegment.end = container.offsetHeight;
-                        segments.push(currentSegment);
-                    }
-
-                    button.textContent = `生成中 (0/${segments.length})...`;
-
-                    // 隐藏保存按钮
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'hidden';
-
-                    // 为每个分段生成图片
-                    const images = [];
-                    for (let i = 0; i < segments.length; i++) {
-                        const segment = segments[i];
-                        button.textContent = `生成中 (${i + 1}/${segments.length})...`;
-
-                        // 创建临时容器用于截图
-                        const tempContainer = document.createElement('div');
-                        tempContainer.style.cssText = `
-                            position: absolute;
-                            left: -9999px;
-                            top: 0;
-                            width: ${container.offsetWidth}px;
-                            background: white;
-                        `;
-                        tempContainer.className = 'container';
-
-                        // 克隆容器内容
-                        const clonedContainer = container.cloneNode(true);
-
-                        // 移除克隆内容中的保存按钮
-                        const clonedButtons = clonedContainer.querySelector('.save-buttons');
-                        if (clonedButtons) {
-                            clonedButtons.style.display = 'none';
-                        }
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    *,
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+    rss_items: Optional[List[Dict]] = None,
+    rss_new_items: Optional[List[Dict]] = None,
+    display_mode: str = "keyword",
+    fragment_cache: Optional[FragmentCache] = None,
+) -> str:
+    """渲染HTML内容
 
-                        tempContainer.appendChild(clonedContainer);
-                        document.body.appendChild(tempContainer);
-
-                        // 等待DOM更新
-                        await new Promise(resolve => setTimeout(resolve, 100));
-
-                        // 使用html2canvas截取特定区域
-                        const canvas = await html2canvas(clonedContainer, {
-                            backgroundColor: '#ffffff',
-                            scale: scale,
-                            useCORS: true,
-                            allowTaint: false,
-                            imageTimeout: 10000,
-                            logging: false,
-                            width: container.offsetWidth,
-                            height: segment.end - segment.start,
-                            x: 0,
-                            y: segment.start,
-                            windowWidth: window.innerWidth,
-                            windowHeight: window.innerHeight
-                        });
-
-                        images.push(canvas.toDataURL('image/png', 1.0));
-
-                        // 清理临时容器
-                        document.body.removeChild(tempContainer);
-                    }
-
-                    // 恢复按钮显示
-                    buttons.style.visibility = 'visible';
-
-                    // 下载所有图片
-                    const now = new Date();
-                    const baseFilename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}`;
-
-                    for (let i = 0; i < images.length; i++) {
-                        const link = document.createElement('a');
-                        link.download = `${baseFilename}_part${i + 1}.png`;
-                        link.href = images[i];
-                        document.body.appendChild(link);
-                        link.click();
-                        document.body.removeChild(link);
-
-                        // 延迟一下避免浏览器阻止多个下载
-                        await new Promise(resolve => setTimeout(resolve, 100));
-                    }
-
-                    button.textContent = `已保存 ${segments.length} 张图片!`;
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-
-                } catch (error) {
-                    console.error('分段保存失败:', error);
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
-
-            document.addEventListener('DOMContentLoaded', function() {
-                window.scrollTo(0, 0);
-            });
-        </script>
-    </body>
-    </html>
-    """
+    Args:
+        report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
+        total_titles: 新闻总数
+        is_daily_summary: 是否为当日汇总
+        mode: 报告模式 ("daily", "current", "incremental")
+        update_info: 更新信息（可选）
+        reverse_content_order: 是否反转内容顺序（新增热点在前）
+        get_time_func: 获取当前时间的函数（可选，默认使用 datetime.now）
+        rss_items: RSS 统计条目列表（可选）
+        rss_new_items: RSS 新增条目列表（可选）
+        display_mode: 显示模式 ("keyword"=按关键词分组, "platform"=按平台分组)
+        fragment_cache: 分组片段缓存（可选），输入未变化的分组复用上次的渲染结果
 
-    return html
+    Returns:
+        渲染后的 HTML 字符串
+    """
+    return "".join(iter_html_chunks(
+        report_data,
+        total_titles,
+        is_daily_summary,
+        mode,
+        update_info,
+        reverse_content_order=reverse_content_order,
+        get_time_func=get_time_func,
+        rss_items=rss_items,
+        rss_new_items=rss_new_items,
+        display_mode=display_mode,
+        fragment_cache=fragment_cache,
+    ))
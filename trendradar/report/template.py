@@ -0,0 +1,89 @@
+# coding=utf-8
+"""
+报告模板
+
+HTML 报告的页面框架（内联 CSS、JS、页头页脚）与数据无关，
+保存在 report/assets/ 下的模板文件中，用 {{name}} 标记数据插槽。
+模板在每个进程中只读取、解析一次，编译为「静态片段 + 插槽名」序列；
+渲染时依次输出静态片段和插槽值，不做字符串格式化或正则替换，
+同一次运行中的实时报告、汇总报告共用同一份编译结果。
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Tuple, Union
+
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+_SLOT_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+SlotValue = Union[str, Iterable[str]]
+
+
+class CompiledTemplate:
+    """预编译模板：静态片段与插槽交替排列"""
+
+    def __init__(self, source: str):
+        """
+        编译模板
+
+        Args:
+            source: 模板文本，插槽写作 {{name}}
+        """
+        parts = _SLOT_PATTERN.split(source)
+        self.segments: Tuple[str, ...] = tuple(parts[0::2])
+        self.slots: Tuple[str, ...] = tuple(parts[1::2])
+
+    def iter_render(self, values: Mapping[str, SlotValue]) -> Iterator[str]:
+        """
+        按片段渲染
+
+        Args:
+            values: 插槽值，字符串或片段的可迭代对象（按顺序惰性输出）；
+                未提供的插槽输出为空
+
+        Yields:
+            HTML 片段
+        """
+        for segment, slot in zip(self.segments, self.slots):
+            yield segment
+            value = values.get(slot, "")
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+        yield self.segments[-1]
+
+    def render(self, values: Mapping[str, SlotValue]) -> str:
+        """渲染为完整字符串"""
+        return "".join(self.iter_render(values))
+
+
+@lru_cache(maxsize=None)
+def load_asset(name: str) -> str:
+    """
+    读取静态资源文件（每个进程只读取一次）
+
+    Args:
+        name: assets 目录下的文件名
+
+    Returns:
+        文件内容
+    """
+    return (ASSETS_DIR / name).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> CompiledTemplate:
+    """
+    获取编译后的模板（每个进程只编译一次）
+
+    Args:
+        name: assets 目录下的模板文件名
+
+    Returns:
+        编译后的模板
+    """
+    return CompiledTemplate(load_asset(name))
@@ -9,14 +9,17 @@
 """
 
 from trendradar.storage.base import (
+    ContentFetcher,
     StorageBackend,
     NewsItem,
     NewsData,
+    compact_ranks,
     convert_crawl_results_to_news_data,
     convert_news_data_to_results,
 )
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
+from trendradar.storage.multiday import MultiDayQuery
 
 # 远程后端可选导入（需要 boto3）
 try:
@@ -28,10 +31,12 @@ except ImportError:
 
 __all__ = [
     # 基础类
+    "ContentFetcher",
     "StorageBackend",
     "NewsItem",
     "NewsData",
     # 转换函数
+    "compact_ranks",
     "convert_crawl_results_to_news_data",
     "convert_news_data_to_results",
     # 后端实现
@@ -41,4 +46,6 @@ __all__ = [
     # 管理器
     "StorageManager",
     "get_storage_manager",
+    # 跨日期查询
+    "MultiDayQuery",
 ]
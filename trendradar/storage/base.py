@@ -6,15 +6,47 @@
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-import requests
 
+# 全文抓取函数：(条目 ID, 文章 URL) 列表 -> 条目 ID 到正文内容的映射（只包含抓取成功的条目）。
+# 由调用方注入（如 ArticleScraper.scrape_all），存储层不依赖抓取实现
+ContentFetcher = Callable[[List[Tuple[int, str]]], Dict[int, str]]
 
-@dataclass
+
+def compact_ranks(ranks: Iterable[int]) -> array:
+    """
+    将排名列表转换为紧凑数组
+
+    排名是 1~几百 的小整数，array('H') 每个元素只占 2 字节，
+    而 list 中每个元素是一个指针加一个 int 对象。
+
+    Args:
+        ranks: 排名序列
+
+    Returns:
+        array('H')；出现超出范围的排名时退回 array('i')
+    """
+    if isinstance(ranks, array):
+        return ranks
+    if not isinstance(ranks, (list, tuple)):
+        ranks = list(ranks)
+    try:
+        return array("H", ranks)
+    except (OverflowError, TypeError):
+        return array("i", (int(rank) for rank in ranks))
+
+
+@dataclass(slots=True)
 class NewsItem:
-    """新闻条目数据模型（热榜数据）"""
+    """
+    新闻条目数据模型（热榜数据）
+
+    使用 __slots__ 并以 array 存储排名历史，全天数据（数十万条）常驻内存时更省空间。
+    ranks 支持 len / 索引 / 迭代 / min / max，与 list 的只读用法一致。
+    """
 
     title: str                          # 新闻标题
     source_id: str                      # 来源平台ID（如 toutiao, baidu）
@@ -25,11 +57,14 @@ class NewsItem:
     crawl_time: str = ""                # 抓取时间（HH:MM 格式）
 
     # 统计信息（用于分析）
-    ranks: List[int] = field(default_factory=list)  # 历史排名列表
+    ranks: array = field(default_factory=lambda: array("H"))  # 历史排名
     first_time: str = ""                # 首次出现时间
     last_time: str = ""                 # 最后出现时间
     count: int = 1                      # 出现次数
 
+    def __post_init__(self) -> None:
+        self.ranks = compact_ranks(self.ranks)
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -40,7 +75,7 @@ class NewsItem:
             "url": self.url,
             "mobile_url": self.mobile_url,
             "crawl_time": self.crawl_time,
-            "ranks": self.ranks,
+            "ranks": self.ranks.tolist(),
             "first_time": self.first_time,
             "last_time": self.last_time,
             "count": self.count,
@@ -64,7 +99,7 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """RSS 条目数据模型"""
 
@@ -119,7 +154,7 @@ class RSSItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSData:
     """
     RSS 数据集合
@@ -130,6 +165,7 @@ class RSSData:
     - items: 按 feed_id 分组的 RSS 条目
     - id_to_name: feed_id 到名称的映射
     - failed_ids: 失败的 feed_id 列表
+    - unchanged_ids: 内容未变化的 feed_id 列表（条件请求命中，无条目）
     """
 
     date: str                                   # 日期
@@ -137,6 +173,7 @@ class RSSData:
     items: Dict[str, List[RSSItem]]             # 按 feed_id 分组的条目
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
+    unchanged_ids: List[str] = field(default_factory=list)     # 未变化的ID
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -150,6 +187,7 @@ class RSSData:
             "items": items_dict,
             "id_to_name": self.id_to_name,
             "failed_ids": self.failed_ids,
+            "unchanged_ids": self.unchanged_ids,
         }
 
     @classmethod
@@ -166,6 +204,7 @@ class RSSData:
             items=items,
             id_to_name=data.get("id_to_name", {}),
             failed_ids=data.get("failed_ids", []),
+            unchanged_ids=data.get("unchanged_ids", []),
         )
 
     def get_total_count(self) -> int:
@@ -173,7 +212,7 @@ class RSSData:
         return sum(len(rss_list) for rss_list in self.items.values())
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """
     新闻数据集合
@@ -254,8 +293,7 @@ class NewsData:
                     # 合并排名
                     existing_ranks = set(existing.ranks) if existing.ranks else set()
                     new_ranks = set(item.ranks) if item.ranks else set()
-                    merged_ranks = sorted(existing_ranks | new_ranks)
-                    existing.ranks = merged_ranks
+                    existing.ranks = compact_ranks(sorted(existing_ranks | new_ranks))
 
                     # 更新时间
                     if item.first_time and (not existing.first_time or item.first_time < existing.first_time):
@@ -387,13 +425,17 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    def save_rss_data(self, data: RSSData, session: Optional[requests.Session] = None) -> bool:
+    def save_rss_data(
+        self,
+        data: RSSData,
+        fetch_contents: Optional[ContentFetcher] = None,
+    ) -> bool:
         """
         保存 RSS 数据
 
         Args:
             data: RSS 数据
-            session: requests 会话对象（用于二次抓取）
+            fetch_contents: 全文抓取函数（写入完成后抓取新条目全文），为空时跳过全文抓取
 
         Returns:
             是否保存成功
@@ -548,6 +590,9 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
     """
     将 NewsData 转换回原有的 results 格式（用于兼容现有代码）
 
+    results 与 title_info 中同一标题共享同一个字典（包含两者的全部字段），
+    ranks 直接引用 NewsItem 中的数组，不再为每个标题复制两份。调用方应只读使用。
+
     Args:
         data: NewsData 对象
 
@@ -558,23 +603,19 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
     title_info = {}
 
     for source_id, news_list in data.items.items():
-        results[source_id] = {}
-        title_info[source_id] = {}
+        source_results = results[source_id] = {}
+        source_info = title_info[source_id] = {}
 
         for item in news_list:
-            results[source_id][item.title] = {
+            entry = {
                 "ranks": item.ranks,
                 "url": item.url,
                 "mobileUrl": item.mobile_url,
-            }
-
-            title_info[source_id][item.title] = {
                 "first_time": item.first_time,
                 "last_time": item.last_time,
                 "count": item.count,
-                "ranks": item.ranks,
-                "url": item.url,
-                "mobileUrl": item.mobile_url,
             }
+            source_results[item.title] = entry
+            source_info[item.title] = entry
 
     return results, data.id_to_name, title_info
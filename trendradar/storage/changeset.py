@@ -0,0 +1,199 @@
+# coding=utf-8
+"""
+SQLite 增量变更集
+
+远程存储的增量同步模式（sync_mode: delta）使用：
+- 打开连接后为 main 库的每张表安装 TEMP 触发器，写入时只记录 (表名, rowid)
+- 同步时按记录的 rowid 读取各行的最终状态，打包成 gzip 压缩的 JSON 变更集
+  （行已不存在则记为删除），体积只与本次写入涉及的行数有关
+- 回放时按 rowid 执行 INSERT OR REPLACE / DELETE，唯一键冲突的旧行由 REPLACE 一并替换，
+  结果与写入端的数据库一致
+
+触发器和变更记录表都在 temp 库中，只对当前连接生效，不会写入数据库文件。
+"""
+
+import gzip
+import json
+import sqlite3
+from typing import Dict, List
+
+
+CHANGESET_FORMAT = 1
+
+# temp 库中的变更记录表
+_CHANGES_TABLE = "_sync_changes"
+
+
+def _user_tables(conn: sqlite3.Connection) -> List[str]:
+    """main 库中的业务表（不含 sqlite_ 内部表）"""
+    rows = conn.execute("""
+        SELECT name FROM main.sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+    """).fetchall()
+    return [row[0] for row in rows]
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """表的字段名（按定义顺序）"""
+    return [row[1] for row in conn.execute(f'PRAGMA main.table_info("{table}")')]
+
+
+def install_change_tracking(conn: sqlite3.Connection) -> None:
+    """
+    为 main 库的所有表安装变更跟踪触发器
+
+    应在 ensure_schema 之后调用（迁移新增的表也需要跟踪）；重复调用是安全的。
+
+    Args:
+        conn: 数据库连接
+    """
+    # 不使用唯一约束：触发器内语句的冲突处理会被外层语句（如 INSERT OR REPLACE、UPSERT）覆盖，
+    # 改为写入前判断是否已记录
+    conn.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS {_CHANGES_TABLE} (
+            tbl TEXT NOT NULL,
+            row_id INTEGER NOT NULL
+        )
+    """)
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS temp.idx{_CHANGES_TABLE} ON {_CHANGES_TABLE}(tbl, row_id)"
+    )
+
+    for table in _user_tables(conn):
+        # 触发器内不允许使用 temp. 前缀，未限定的表名优先解析到 temp 库
+        log = (
+            f"INSERT INTO {_CHANGES_TABLE} (tbl, row_id) SELECT '{table}', %(row)s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {_CHANGES_TABLE} "
+            f"WHERE tbl = '{table}' AND row_id = %(row)s);"
+        )
+        conn.execute(f"""
+            CREATE TEMP TRIGGER IF NOT EXISTS "_sync_{table}_ins"
+            AFTER INSERT ON main."{table}"
+            BEGIN {log % {"row": "NEW.rowid"}} END
+        """)
+        conn.execute(f"""
+            CREATE TEMP TRIGGER IF NOT EXISTS "_sync_{table}_upd"
+            AFTER UPDATE ON main."{table}"
+            BEGIN {log % {"row": "OLD.rowid"}} {log % {"row": "NEW.rowid"}} END
+        """)
+        conn.execute(f"""
+            CREATE TEMP TRIGGER IF NOT EXISTS "_sync_{table}_del"
+            AFTER DELETE ON main."{table}"
+            BEGIN {log % {"row": "OLD.rowid"}} END
+        """)
+
+
+def count_changes(conn: sqlite3.Connection) -> int:
+    """尚未同步的变更行数（未安装跟踪时为 0）"""
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM temp.{_CHANGES_TABLE}").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0
+
+
+def clear_changes(conn: sqlite3.Connection) -> None:
+    """清空变更记录（变更集上传成功或已上传完整快照后调用）"""
+    try:
+        conn.execute(f"DELETE FROM temp.{_CHANGES_TABLE}")
+        conn.commit()
+    except sqlite3.OperationalError:
+        pass
+
+
+def export_changeset(conn: sqlite3.Connection, schema_version: int = 0) -> bytes:
+    """
+    导出自上次清空以来的变更集
+
+    Args:
+        conn: 已安装变更跟踪的数据库连接
+        schema_version: 写入端的结构版本（回放端据此判断字段是否齐全）
+
+    Returns:
+        gzip 压缩的 JSON 变更集
+    """
+    tables: Dict[str, Dict] = {}
+    changed = [row[0] for row in conn.execute(
+        f"SELECT DISTINCT tbl FROM temp.{_CHANGES_TABLE} ORDER BY tbl"
+    )]
+
+    for table in changed:
+        columns = _table_columns(conn, table)
+        if not columns:
+            continue
+        column_sql = ", ".join(f't."{name}"' for name in columns)
+        cursor = conn.execute(f"""
+            SELECT c.row_id, t.rowid IS NOT NULL, {column_sql}
+            FROM temp.{_CHANGES_TABLE} c
+            LEFT JOIN main."{table}" t ON t.rowid = c.row_id
+            WHERE c.tbl = ?
+            ORDER BY c.row_id
+        """, (table,))
+
+        rows = []
+        deleted = []
+        for row in cursor:
+            if row[1]:
+                rows.append([row[0], *row[2:]])
+            else:
+                deleted.append(row[0])
+
+        tables[table] = {"columns": columns, "rows": rows, "deleted": deleted}
+
+    payload = {
+        "format": CHANGESET_FORMAT,
+        "schema_version": schema_version,
+        "tables": tables,
+    }
+    return gzip.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+def apply_changeset(conn: sqlite3.Connection, data: bytes) -> int:
+    """
+    回放变更集
+
+    同一表内先删除再写入；写入端有而本地没有的字段（写入端版本更新）会被忽略。
+    调用方负责提交事务。
+
+    Args:
+        conn: 数据库连接（结构应已由 ensure_schema 升级）
+        data: export_changeset 生成的数据
+
+    Returns:
+        回放的行数
+    """
+    payload = json.loads(gzip.decompress(data).decode("utf-8"))
+    if payload.get("format") != CHANGESET_FORMAT:
+        raise ValueError(f"不支持的变更集格式: {payload.get('format')}")
+
+    existing_tables = set(_user_tables(conn))
+    applied = 0
+
+    for table, change in payload.get("tables", {}).items():
+        if table not in existing_tables:
+            print(f"[存储] 变更集中的表在本地不存在，已跳过: {table}")
+            continue
+
+        if change["deleted"]:
+            conn.executemany(
+                f'DELETE FROM main."{table}" WHERE rowid = ?',
+                [(row_id,) for row_id in change["deleted"]],
+            )
+            applied += len(change["deleted"])
+
+        if not change["rows"]:
+            continue
+
+        local_columns = set(_table_columns(conn, table))
+        positions = [i for i, name in enumerate(change["columns"]) if name in local_columns]
+        names = ", ".join(f'"{change["columns"][i]}"' for i in positions)
+        placeholders = ", ".join("?" * (len(positions) + 1))
+        conn.executemany(
+            f'INSERT OR REPLACE INTO main."{table}" (rowid, {names}) VALUES ({placeholders})',
+            [[row[0], *(row[i + 1] for i in positions)] for row in change["rows"]],
+        )
+        applied += len(change["rows"])
+
+    return applied
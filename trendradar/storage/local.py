@@ -12,12 +12,11 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import requests
-
-from trendradar.crawler.scraper import scrape_article_content
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.base import ContentFetcher, StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.migrations import ensure_schema
+from trendradar.storage.sqlite_profile import connect_sqlite, resolve_sqlite_profile
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -42,6 +41,7 @@ class LocalStorageBackend(StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict] = None,
     ):
         """
         初始化本地存储后端
@@ -51,11 +51,13 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接配置（PRAGMA），为空时使用默认配置
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = resolve_sqlite_profile(sqlite_profile)
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
     @property
@@ -112,50 +114,31 @@ class LocalStorageBackend(StorageBackend):
         db_path = str(self._get_db_path(date, db_type))
 
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = connect_sqlite(db_path, self.sqlite_profile)
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
-    def _get_schema_path(self, db_type: str = "news") -> Path:
-        """
-        获取 schema.sql 文件路径
-
-        Args:
-            db_type: 数据库类型 ("news" 或 "rss")
-
-        Returns:
-            schema 文件路径
-        """
-        if db_type == "rss":
-            return Path(__file__).parent / "rss_schema.sql"
-        return Path(__file__).parent / "schema.sql"
-
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        确保数据库表结构为最新版本
+
+        通过 PRAGMA user_version 判断，已是最新版本时不会重复执行 schema 脚本
 
         Args:
             conn: 数据库连接
             db_type: 数据库类型 ("news" 或 "rss")
         """
-        schema_path = self._get_schema_path(db_type)
-
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        conn.commit()
+        ensure_schema(conn, db_type)
 
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到 SQLite（以 URL 为唯一标识，支持标题更新检测）
 
+        采用批量写入：一次查询预加载已有记录，按新增/更新分组后用
+        executemany 写入，整个过程在同一个显式事务中完成。
+
         Args:
             data: 新闻数据
 
@@ -164,119 +147,33 @@ class LocalStorageBackend(StorageBackend):
         """
         try:
             conn = self._get_connection(data.date)
-            cursor = conn.cursor()
+        except Exception as e:
+            print(f"[本地存储] 保存失败: {e}")
+            return False
 
+        cursor = conn.cursor()
+        try:
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
+            # 整个保存过程放在一个显式事务中
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
 
+            # 首先同步平台信息到 platforms 表
+            cursor.executemany("""
+                INSERT INTO platforms (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(source_id, source_name, now_str)
+                  for source_id, source_name in data.id_to_name.items()])
+
+            new_count, updated_count, title_changed_count = self._upsert_news_items(
+                cursor, data, now_str
+            )
+            success_sources = list(data.items.keys())
             total_items = new_count + updated_count
 
             # 记录抓取信息
@@ -294,27 +191,20 @@ class LocalStorageBackend(StorageBackend):
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                # 确保失败的平台也在 platforms 表中
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO platforms (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+                # 记录成功和失败的来源
+                status_rows = [(crawl_record_id, source_id, "success") for source_id in success_sources]
+                status_rows.extend((crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids)
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO crawl_source_status
+                    (crawl_record_id, platform_id, status)
+                    VALUES (?, ?, ?)
+                """, status_rows)
 
             conn.commit()
 
@@ -329,9 +219,244 @@ class LocalStorageBackend(StorageBackend):
             return True
 
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             print(f"[本地存储] 保存失败: {e}")
             return False
 
+    def _upsert_news_items(self, cursor: sqlite3.Cursor, data: NewsData, now_str: str) -> Tuple[int, int, int]:
+        """
+        写入新闻条目（新增 / 更新 / 排名历史 / 标题变更）
+
+        整批条目先在一个保存点内批量写入；批量写入出错时回滚到保存点，
+        改为逐条写入（每条一个保存点），出错的条目记录日志后跳过，其余条目照常保存。
+
+        Args:
+            cursor: 处于事务中的游标
+            data: 新闻数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数)
+        """
+        source_ids = list(data.items.keys())
+        if not source_ids:
+            return 0, 0, 0
+
+        entries = [(source_id, item) for source_id, news_list in data.items.items() for item in news_list]
+        known = self._load_known_news(cursor, source_ids)
+
+        cursor.execute("SAVEPOINT news_batch")
+        try:
+            return self._write_news_entries(cursor, entries, known, data.crawl_time, now_str)
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO news_batch")
+            print(f"[本地存储] 批量写入失败，改为逐条写入: {e}")
+        finally:
+            cursor.execute("RELEASE news_batch")
+
+        new_count, updated_count, title_changed_count = 0, 0, 0
+        for source_id, item in entries:
+            cursor.execute("SAVEPOINT news_item")
+            try:
+                added, updated, changed = self._write_news_entries(
+                    cursor, [(source_id, item)], known, data.crawl_time, now_str
+                )
+                new_count += added
+                updated_count += updated
+                title_changed_count += changed
+            except sqlite3.Error as e:
+                cursor.execute("ROLLBACK TO news_item")
+                print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
+            finally:
+                cursor.execute("RELEASE news_item")
+
+        return new_count, updated_count, title_changed_count
+
+    def _load_known_news(self, cursor: sqlite3.Cursor, source_ids: List[str]) -> Dict[Tuple[str, str], Tuple[int, str]]:
+        """
+        预加载指定平台已有的新闻记录
+
+        Args:
+            cursor: 游标
+            source_ids: 平台 ID 列表
+
+        Returns:
+            (url, platform_id) -> (id, title)
+        """
+        placeholders = ",".join("?" * len(source_ids))
+        cursor.execute(f"""
+            SELECT id, url, platform_id, title FROM news_items
+            WHERE url != '' AND platform_id IN ({placeholders})
+        """, source_ids)
+        return {(row[1], row[2]): (row[0], row[3]) for row in cursor.fetchall()}
+
+    def _write_news_entries(
+        self,
+        cursor: sqlite3.Cursor,
+        entries: List[Tuple[str, NewsItem]],
+        known: Dict[Tuple[str, str], Tuple[int, str]],
+        crawl_time: str,
+        now_str: str,
+    ) -> Tuple[int, int, int]:
+        """
+        批量写入一组新闻条目
+
+        写入次数只与批次数有关，与条目数量无关：
+        1. 按顺序把条目分为新增和更新（同一批次内重复的 URL，后出现的视为更新）
+        2. executemany 插入新增条目，按自增 ID 顺序取回新 ID
+        3. executemany 写入标题变更、更新和排名历史
+
+        全部写入成功后才更新 known，写入出错时 known 保持不变。
+
+        Args:
+            cursor: 处于事务中的游标
+            entries: (平台 ID, 新闻条目) 列表
+            known: 已有记录 (url, platform_id) -> (id, title)
+            crawl_time: 抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数)
+        """
+        # 本批次新增或改名的记录，写入成功后合并到 known
+        staged: Dict[Tuple[str, str], Tuple[int, str]] = {}
+
+        # 分组：新增条目 / 更新条目（更新目标可能是本批次刚新增的条目）
+        insert_rows = []
+        insert_keys = []
+        insert_ranks = []
+        pending_updates = []
+        pending_keys = set()
+
+        for source_id, item in entries:
+            # 标准化 URL（去除动态参数，如微博的 band_rank）
+            normalized_url = normalize_url(item.url, source_id) if item.url else ""
+            key = (normalized_url, source_id)
+
+            if normalized_url and (key in known or key in pending_keys):
+                pending_updates.append((key, item))
+                continue
+
+            # 不存在或 URL 为空（不做去重），插入新记录（存储标准化后的 URL）
+            insert_rows.append((item.title, source_id, item.rank, normalized_url,
+                                item.mobile_url, crawl_time, crawl_time,
+                                now_str, now_str))
+            insert_keys.append(key if normalized_url else None)
+            insert_ranks.append(item.rank)
+            if normalized_url:
+                pending_keys.add(key)
+
+        rank_rows = []
+
+        if insert_rows:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM news_items")
+            max_id_before = cursor.fetchone()[0]
+
+            cursor.executemany("""
+                INSERT INTO news_items
+                (title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, insert_rows)
+
+            # 自增 ID 与插入顺序一致
+            cursor.execute("""
+                SELECT id FROM news_items WHERE id > ? ORDER BY id
+            """, (max_id_before,))
+            new_ids = [row[0] for row in cursor.fetchall()]
+
+            for new_id, key, row, rank in zip(new_ids, insert_keys, insert_rows, insert_ranks):
+                if key is not None:
+                    staged[key] = (new_id, row[0])
+                # 记录初始排名
+                rank_rows.append((new_id, rank, crawl_time, now_str))
+
+        # 更新已存在记录
+        title_change_rows = []
+        update_rows = []
+        for key, item in pending_updates:
+            existing_id, existing_title = staged[key] if key in staged else known[key]
+
+            # 检查标题是否变化
+            if existing_title != item.title:
+                title_change_rows.append((existing_id, existing_title, item.title, now_str))
+                staged[key] = (existing_id, item.title)
+
+            rank_rows.append((existing_id, item.rank, crawl_time, now_str))
+            update_rows.append((item.title, item.rank, item.mobile_url,
+                                crawl_time, now_str, existing_id))
+
+        # 记录标题变更
+        cursor.executemany("""
+            INSERT INTO title_changes
+            (news_item_id, old_title, new_title, changed_at)
+            VALUES (?, ?, ?, ?)
+        """, title_change_rows)
+
+        # 记录排名历史
+        cursor.executemany("""
+            INSERT INTO rank_history
+            (news_item_id, rank, crawl_time, created_at)
+            VALUES (?, ?, ?, ?)
+        """, rank_rows)
+
+        cursor.executemany("""
+            UPDATE news_items SET
+                title = ?,
+                rank = ?,
+                mobile_url = ?,
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE id = ?
+        """, update_rows)
+
+        known.update(staged)
+        return len(insert_rows), len(update_rows), len(title_change_rows)
+
+    def _load_rank_history(
+        self, cursor: sqlite3.Cursor, last_crawl_time: Optional[str] = None
+    ) -> Dict[int, List[int]]:
+        """
+        读取排名历史（按条目聚合）
+
+        在数据库中按 news_item_id 分组、用 group_concat 拼接「crawl_time=rank」，每个条目只返回一行。
+        SQLite 不保证 group_concat 的拼接顺序，因此带上抓取时间，在 Python 端按时间排序后
+        再按首次出现去重，结果不依赖执行计划（分组仍由 idx_rank_history_item_time 覆盖，无临时排序）。
+        不再拼接 IN (?, ?, ...) 参数列表，避免超出 SQLite 变量数上限。
+
+        Args:
+            cursor: 数据库游标
+            last_crawl_time: 只读取该批次仍在榜的条目，为空时读取全天
+
+        Returns:
+            {news_item_id: [rank, ...]}，排名按首次出现顺序去重
+        """
+        if last_crawl_time is None:
+            cursor.execute("""
+                SELECT news_item_id, group_concat(crawl_time || '=' || rank)
+                FROM rank_history
+                GROUP BY news_item_id
+            """)
+        else:
+            cursor.execute("""
+                SELECT n.id, group_concat(rh.crawl_time || '=' || rh.rank)
+                FROM news_items n
+                JOIN rank_history rh ON rh.news_item_id = n.id
+                WHERE n.last_crawl_time = ?
+                GROUP BY n.id
+            """, (last_crawl_time,))
+
+        rank_history_map: Dict[int, List[int]] = {}
+        for news_id, entries in cursor.fetchall():
+            if entries:
+                # crawl_time 为定长的 HH-MM，按字符串排序即按时间排序
+                ranks = (int(entry.rpartition("=")[2]) for entry in sorted(entries.split(",")))
+                rank_history_map[news_id] = list(dict.fromkeys(ranks))
+        return rank_history_map
+
     def get_today_all_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -364,24 +489,8 @@ class LocalStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 排名历史（在数据库中按条目聚合）
+            rank_history_map = self._load_rank_history(cursor)
 
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
@@ -494,24 +603,8 @@ class LocalStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 排名历史（只读取该批次仍在榜的条目）
+            rank_history_map = self._load_rank_history(cursor, latest_time)
 
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
@@ -572,6 +665,10 @@ class LocalStorageBackend(StorageBackend):
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
 
+        直接用当前批次的 (platform_id, title) 到 news_items 中查询，
+        通过 idx_news_platform_title 索引一次得到"已见过"的标题，
+        不再加载当天全部新闻和排名历史。
+
         Args:
             current_data: 当前抓取的数据
 
@@ -579,41 +676,55 @@ class LocalStorageBackend(StorageBackend):
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
+            db_path = self._get_db_path(current_data.date)
+            if not db_path.exists():
                 # 没有历史数据，所有都是新的
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
+                return self._all_titles_new(current_data)
+            conn = self._get_connection(current_data.date)
+            cursor = conn.cursor()
 
             # 获取当前批次时间
             current_time = current_data.crawl_time
 
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
+            cursor.execute("""
+                SELECT EXISTS(SELECT 1 FROM news_items),
+                       EXISTS(SELECT 1 FROM news_items WHERE first_crawl_time < ?)
+            """, (current_time,))
+            has_any_data, has_historical_data = cursor.fetchone()
+
+            if not has_any_data:
+                # 没有历史数据，所有都是新的
+                return self._all_titles_new(current_data)
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
             if not has_historical_data:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
+            # 查询当前批次中已在历史批次出现过的标题（first_crawl_time < current_time）
+            # 同一标题因 URL 变化而产生多条记录时，任意一条更早出现即视为已见过
+            candidates = [
+                [source_id, item.title]
+                for source_id, news_list in current_data.items.items()
+                for item in news_list
+            ]
+            if not candidates:
+                return {}
+
+            cursor.execute("""
+                SELECT n.platform_id, n.title
+                FROM json_each(?) AS c
+                JOIN news_items n
+                  ON n.platform_id = json_extract(c.value, '$[0]')
+                 AND n.title = json_extract(c.value, '$[1]')
+                WHERE n.first_crawl_time < ?
+            """, (json.dumps(candidates, ensure_ascii=False), current_time))
+            seen_titles = {(row[0], row[1]) for row in cursor.fetchall()}
+
             # 检测新增
             new_titles = {}
             for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
                 for item in news_list:
-                    if item.title not in hist_set:
+                    if (source_id, item.title) not in seen_titles:
                         if source_id not in new_titles:
                             new_titles[source_id] = {}
                         new_titles[source_id][item.title] = item
@@ -624,6 +735,14 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 检测新标题失败: {e}")
             return {}
 
+    @staticmethod
+    def _all_titles_new(current_data: NewsData) -> Dict[str, Dict]:
+        """当天尚无任何数据时，当前批次的所有标题都视为新增"""
+        new_titles = {}
+        for source_id, news_list in current_data.items.items():
+            new_titles[source_id] = {item.title: item for item in news_list}
+        return new_titles
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
         保存 TXT 快照
@@ -860,9 +979,13 @@ class LocalStorageBackend(StorageBackend):
                             except Exception:
                                 pass
 
-                        # 删除文件
+                        # 删除文件（连同 WAL 模式的 -wal / -shm 附属文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                sidecar = db_file.with_name(db_file.name + suffix)
+                                if sidecar.exists():
+                                    sidecar.unlink()
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
@@ -965,106 +1088,65 @@ class LocalStorageBackend(StorageBackend):
     # RSS 数据存储方法
     # ========================================
 
-    def save_rss_data(self, data: RSSData, session: Optional[requests.Session] = None) -> bool:
+    def save_rss_data(
+        self,
+        data: RSSData,
+        fetch_contents: Optional[ContentFetcher] = None,
+    ) -> bool:
         """
         保存 RSS 数据到 SQLite（以 URL 为唯一标识）
 
+        条目在一个事务内批量写入并提交；全文抓取作为独立阶段在写入之后
+        并发执行，结果再批量写入 article_contents，慢站点不会阻塞数据写入。
+
         Args:
             data: RSS 数据
-            session: requests 会话对象（用于二次抓取）
+            fetch_contents: 全文抓取函数，为空时跳过全文抓取
 
         Returns:
             是否保存成功
         """
         try:
             conn = self._get_connection(data.date, db_type="rss")
-            cursor = conn.cursor()
+        except Exception as e:
+            print(f"[本地存储] 保存 RSS 数据失败: {e}")
+            return False
 
+        cursor = conn.cursor()
+        try:
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
+            # 条目写入放在一个显式事务中
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
+
             # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
+            cursor.executemany("""
+                INSERT INTO rss_feeds (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(feed_id, feed_name, now_str) for feed_id, feed_name in data.id_to_name.items()])
 
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            content_scraped_count = 0
+            new_count, updated_count, scrape_targets = self._upsert_rss_items(cursor, data, now_str)
 
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_id = cursor.lastrowid
-                                new_count += 1
-
-                                # --- 全文抓取 ---
-                                if session and item.url:
-                                    content = scrape_article_content(item.url, session)
-                                    if content:
-                                        cursor.execute("""
-                                            INSERT INTO article_contents (rss_item_id, content)
-                                            VALUES (?, ?)
-                                        """, (new_id, content))
-                                        content_scraped_count += 1
-
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[本地存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+            # 内容未变化的源（条件请求命中）：无需逐条写入，
+            # 只把该源最近一批条目顺延到本次抓取，保证"当前榜单"完整
+            carried_count = 0
+            for feed_id in data.unchanged_ids:
+                cursor.execute("""
+                    UPDATE rss_items SET
+                        last_crawl_time = ?,
+                        crawl_count = crawl_count + 1,
+                        updated_at = ?
+                    WHERE feed_id = ? AND last_crawl_time = (
+                        SELECT MAX(last_crawl_time) FROM rss_items WHERE feed_id = ?
+                    )
+                """, (data.crawl_time, now_str, feed_id, feed_id))
+                carried_count += cursor.rowcount
 
-            total_items = new_count + updated_count
+            total_items = new_count + updated_count + carried_count
 
             # 记录抓取信息
             cursor.execute("""
@@ -1081,26 +1163,21 @@ class LocalStorageBackend(StorageBackend):
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                # 确保失败的源也在 rss_feeds 表中
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+                # 记录成功的源（含内容未变化的源）和失败的源
+                status_rows = [(crawl_record_id, feed_id, "success")
+                               for feed_id in list(data.items.keys()) + list(data.unchanged_ids)]
+                status_rows.extend((crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids)
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO rss_crawl_status
+                    (crawl_record_id, feed_id, status)
+                    VALUES (?, ?, ?)
+                """, status_rows)
 
             conn.commit()
 
@@ -1108,16 +1185,203 @@ class LocalStorageBackend(StorageBackend):
             log_parts = [f"[本地存储] RSS 处理完成：新增 {new_count} 条"]
             if updated_count > 0:
                 log_parts.append(f"更新 {updated_count} 条")
-            if content_scraped_count > 0:
-                log_parts.append(f"抓取全文 {content_scraped_count} 篇")
+            if data.unchanged_ids:
+                log_parts.append(f"{len(data.unchanged_ids)} 个源未变化")
             print("，".join(log_parts))
 
-            return True
-
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             print(f"[本地存储] 保存 RSS 数据失败: {e}")
             return False
 
+        # --- 全文抓取（独立阶段，失败不影响已写入的数据） ---
+        if fetch_contents and scrape_targets:
+            self._save_article_contents(conn, fetch_contents, scrape_targets)
+
+        return True
+
+    def _upsert_rss_items(
+        self, cursor: sqlite3.Cursor, data: RSSData, now_str: str
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        写入 RSS 条目
+
+        整批条目先在一个保存点内批量写入；批量写入出错时回滚到保存点，
+        改为逐条写入（每条一个保存点），出错的条目记录日志后跳过，其余条目照常保存。
+
+        Args:
+            cursor: 处于事务中的游标
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 需要抓取全文的 (条目 ID, URL) 列表)
+        """
+        feed_ids = list(data.items.keys())
+        if not feed_ids:
+            return 0, 0, []
+
+        entries = [(feed_id, item) for feed_id, rss_list in data.items.items() for item in rss_list]
+
+        # 预加载已有记录
+        placeholders = ",".join("?" * len(feed_ids))
+        cursor.execute(f"""
+            SELECT id, url, feed_id FROM rss_items
+            WHERE feed_id IN ({placeholders})
+        """, feed_ids)
+        known: Dict[Tuple[str, str], int] = {(row[1], row[2]): row[0] for row in cursor.fetchall()}
+
+        cursor.execute("SAVEPOINT rss_batch")
+        try:
+            return self._write_rss_entries(cursor, entries, known, data.crawl_time, now_str)
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO rss_batch")
+            print(f"[本地存储] RSS 批量写入失败，改为逐条写入: {e}")
+        finally:
+            cursor.execute("RELEASE rss_batch")
+
+        new_count, updated_count = 0, 0
+        scrape_targets: List[Tuple[int, str]] = []
+        for feed_id, item in entries:
+            cursor.execute("SAVEPOINT rss_item")
+            try:
+                added, updated, targets = self._write_rss_entries(
+                    cursor, [(feed_id, item)], known, data.crawl_time, now_str
+                )
+                new_count += added
+                updated_count += updated
+                scrape_targets.extend(targets)
+            except sqlite3.Error as e:
+                cursor.execute("ROLLBACK TO rss_item")
+                print(f"[本地存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+            finally:
+                cursor.execute("RELEASE rss_item")
+
+        return new_count, updated_count, scrape_targets
+
+    def _write_rss_entries(
+        self,
+        cursor: sqlite3.Cursor,
+        entries: List[Tuple[str, RSSItem]],
+        known: Dict[Tuple[str, str], int],
+        crawl_time: str,
+        now_str: str,
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        批量写入一组 RSS 条目
+
+        按新增/更新分组后用 executemany 写入。(url, feed_id) 有唯一索引，重复条目只保留第一条。
+        全部写入成功后才更新 known，写入出错时 known 保持不变。
+
+        Args:
+            cursor: 处于事务中的游标
+            entries: (源 ID, RSS 条目) 列表
+            known: 已有记录 (url, feed_id) -> id
+            crawl_time: 抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 需要抓取全文的 (条目 ID, URL) 列表)
+        """
+        # 本批次新增的记录，写入成功后合并到 known
+        staged: Dict[Tuple[str, str], int] = {}
+
+        insert_rows = []
+        pending_updates = []
+        pending_keys = set()
+
+        for feed_id, item in entries:
+            url = item.url or ""
+            key = (url, feed_id)
+
+            if key in known or key in pending_keys:
+                # 已存在（或同一批次内已出现）的条目更新之；URL 为空的重复条目直接跳过
+                if url:
+                    pending_updates.append((key, item))
+                continue
+
+            pending_keys.add(key)
+            insert_rows.append((item.title, feed_id, url, item.published_at,
+                                item.summary, item.author, crawl_time,
+                                crawl_time, now_str, now_str))
+
+        scrape_targets: List[Tuple[int, str]] = []
+        if insert_rows:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM rss_items")
+            max_id_before = cursor.fetchone()[0]
+
+            cursor.executemany("""
+                INSERT INTO rss_items
+                (title, feed_id, url, published_at, summary, author,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, insert_rows)
+
+            cursor.execute("""
+                SELECT id, url, feed_id FROM rss_items WHERE id > ? ORDER BY id
+            """, (max_id_before,))
+            for row in cursor.fetchall():
+                staged[(row[1], row[2])] = row[0]
+                if row[1]:
+                    scrape_targets.append((row[0], row[1]))
+
+        # 更新目标可能是本批次刚插入的条目，插入后再确定 ID
+        update_rows = [(item.title, item.published_at, item.summary, item.author,
+                        crawl_time, now_str, staged[key] if key in staged else known[key])
+                       for key, item in pending_updates]
+
+        cursor.executemany("""
+            UPDATE rss_items SET
+                title = ?,
+                published_at = ?,
+                summary = ?,
+                author = ?,
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE id = ?
+        """, update_rows)
+
+        known.update(staged)
+        return len(insert_rows), len(update_rows), scrape_targets
+
+    def _save_article_contents(
+        self,
+        conn: sqlite3.Connection,
+        fetch_contents: ContentFetcher,
+        targets: List[Tuple[int, str]],
+    ) -> int:
+        """
+        并发抓取新条目全文并批量写入 article_contents
+
+        Args:
+            conn: RSS 数据库连接
+            fetch_contents: 全文抓取函数
+            targets: (条目 ID, URL) 列表
+
+        Returns:
+            成功写入的全文数量
+        """
+        contents = fetch_contents(targets)
+        if not contents:
+            return 0
+
+        try:
+            conn.executemany("""
+                INSERT OR IGNORE INTO article_contents (rss_item_id, content)
+                VALUES (?, ?)
+            """, list(contents.items()))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"[本地存储] 保存全文失败: {e}")
+            return 0
+
+        print(f"[本地存储] 抓取全文 {len(contents)}/{len(targets)} 篇")
+        return len(contents)
+
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """
         获取指定日期的所有 RSS 数据
@@ -1210,18 +1474,10 @@ class LocalStorageBackend(StorageBackend):
             conn = self._get_connection(date, db_type="rss")
             cursor = conn.cursor()
 
-            cursor.execute("PRAGMA table_info(analysis_themes)")
-            columns = {row["name"] for row in cursor.fetchall()}
-            if not columns:
-                return []
-
             select_cols = [
                 "id", "title", "summary", "key_points",
-                "category", "importance", "impact", "created_at",
+                "category", "importance", "impact", "created_at", "tags",
             ]
-            has_tags = "tags" in columns
-            if has_tags:
-                select_cols.append("tags")
 
             cursor.execute(
                 f"SELECT {', '.join(select_cols)} FROM analysis_themes "
@@ -1239,7 +1495,7 @@ class LocalStorageBackend(StorageBackend):
                 FROM rss_items i
                 LEFT JOIN rss_feeds f ON i.feed_id = f.id
                 WHERE i.theme_id IN ({placeholders})
-                ORDER BY i.published_at DESC
+                ORDER BY i.theme_id, i.published_at DESC
             """, theme_ids)
             article_rows = cursor.fetchall()
 
@@ -1275,7 +1531,7 @@ class LocalStorageBackend(StorageBackend):
                     "importance": row["importance"] or 0,
                     "impact": row["impact"] or 0,
                     "created_at": row["created_at"] or "",
-                    "tags": parse_json_list(row["tags"]) if has_tags else [],
+                    "tags": parse_json_list(row["tags"]),
                     "articles": theme_articles.get(theme_id, []),
                 })
 
@@ -1291,6 +1547,9 @@ class LocalStorageBackend(StorageBackend):
         该方法比较当前抓取数据与历史数据，找出新增的 RSS 条目。
         关键逻辑：只有在历史批次中从未出现过的 URL 才算新增。
 
+        直接用当前批次的 (feed_id, url) 通过 idx_rss_url_feed 索引查询已见过的条目，
+        不再加载当天全部 RSS 数据。
+
         Args:
             current_data: 当前抓取的 RSS 数据
 
@@ -1298,39 +1557,52 @@ class LocalStorageBackend(StorageBackend):
             新增的 RSS 条目 {feed_id: [RSSItem, ...]}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_rss_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                return current_data.items.copy()
+            conn = self._get_connection(current_data.date, db_type="rss")
+            cursor = conn.cursor()
 
             # 获取当前批次时间
             current_time = current_data.crawl_time
 
-            # 收集历史 URL（first_time < current_time 的条目）
-            historical_urls: Dict[str, set] = {}
-            for feed_id, rss_list in historical_data.items.items():
-                historical_urls[feed_id] = set()
-                for item in rss_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        if item.url:
-                            historical_urls[feed_id].add(item.url)
+            cursor.execute("""
+                SELECT EXISTS(SELECT 1 FROM rss_items),
+                       EXISTS(SELECT 1 FROM rss_items WHERE first_crawl_time < ? AND url != '')
+            """, (current_time,))
+            has_any_data, has_historical_data = cursor.fetchone()
+
+            if not has_any_data:
+                # 没有历史数据，所有都是新的
+                return current_data.items.copy()
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(urls) > 0 for urls in historical_urls.values())
             if not has_historical_data:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
+            candidates = [
+                [feed_id, item.url]
+                for feed_id, rss_list in current_data.items.items()
+                for item in rss_list
+                if item.url
+            ]
+            if not candidates:
+                return {}
+
+            # 查询当前批次中已在历史批次出现过的 URL（first_crawl_time < current_time）
+            cursor.execute("""
+                SELECT i.feed_id, i.url
+                FROM json_each(?) AS c
+                JOIN rss_items i
+                  ON i.url = json_extract(c.value, '$[1]')
+                 AND i.feed_id = json_extract(c.value, '$[0]')
+                WHERE i.first_crawl_time < ?
+            """, (json.dumps(candidates, ensure_ascii=False), current_time))
+            seen_urls = {(row[0], row[1]) for row in cursor.fetchall()}
+
             # 检测新增
             new_items: Dict[str, List[RSSItem]] = {}
             for feed_id, rss_list in current_data.items.items():
-                hist_set = historical_urls.get(feed_id, set())
                 for item in rss_list:
                     # 通过 URL 判断是否新增
-                    if item.url and item.url not in hist_set:
+                    if item.url and (feed_id, item.url) not in seen_urls:
                         if feed_id not in new_items:
                             new_items[feed_id] = []
                         new_items[feed_id].append(item)
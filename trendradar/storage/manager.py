@@ -6,11 +6,10 @@
 """
 
 import os
+from pathlib import Path
 from typing import Optional
 
-import requests
-
-from trendradar.storage.base import StorageBackend, NewsData, RSSData
+from trendradar.storage.base import ContentFetcher, StorageBackend, NewsData, RSSData
 
 
 # 存储管理器单例
@@ -40,6 +39,7 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[dict] = None,
     ):
         """
         初始化存储管理器
@@ -55,6 +55,7 @@ class StorageManager:
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接配置（PRAGMA）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -66,6 +67,7 @@ class StorageManager:
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -139,6 +141,11 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                sqlite_profile=self.sqlite_profile,
+                sync_mode=self.remote_config.get("sync_mode") or os.environ.get("REMOTE_SYNC_MODE", "full"),
+                compact_every=self.remote_config.get("compact_every", 24),
+                cache_dir=self.remote_config.get("cache_dir") or str(Path(self.data_dir) / ".remote_cache"),
+                cache_max_mb=self.remote_config.get("cache_max_mb", 512),
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -169,6 +176,7 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    sqlite_profile=self.sqlite_profile,
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -203,9 +211,13 @@ class StorageManager:
         """保存新闻数据"""
         return self.get_backend().save_news_data(data)
 
-    def save_rss_data(self, data: RSSData, session: Optional[requests.Session] = None) -> bool:
+    def save_rss_data(
+        self,
+        data: RSSData,
+        fetch_contents: Optional[ContentFetcher] = None,
+    ) -> bool:
         """保存 RSS 数据"""
-        return self.get_backend().save_rss_data(data, session=session)
+        return self.get_backend().save_rss_data(data, fetch_contents=fetch_contents)
 
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """获取指定日期的所有 RSS 数据（当日汇总模式）"""
@@ -321,6 +333,7 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    sqlite_profile: Optional[dict] = None,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -337,6 +350,7 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        sqlite_profile: SQLite 连接配置（PRAGMA）
         force_new: 是否强制创建新实例
 
     Returns:
@@ -356,6 +370,7 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            sqlite_profile=sqlite_profile,
         )
 
     return _storage_manager
@@ -0,0 +1,177 @@
+# coding=utf-8
+"""
+SQLite 数据库结构版本管理
+
+使用 PRAGMA user_version 记录每个数据库文件的结构版本：
+- 打开连接时只读取一次 user_version，已是最新版本则不做任何操作
+- 版本落后时按顺序执行尚未应用的迁移，每步完成后更新 user_version
+- 版本 1 为 schema.sql / rss_schema.sql 定义的基础结构（CREATE ... IF NOT EXISTS，
+  对引入版本管理之前创建的旧数据库同样适用）
+
+新增字段或索引时，在 MIGRATIONS 对应的列表末尾追加一个迁移即可，
+不要修改已发布的迁移。
+"""
+
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+
+Migration = Tuple[int, str, Callable[[sqlite3.Connection], None]]
+
+SCHEMA_FILES = {
+    "news": "schema.sql",
+    "rss": "rss_schema.sql",
+}
+
+
+@lru_cache(maxsize=None)
+def _read_schema_sql(db_type: str) -> str:
+    """读取基础结构 SQL（进程内缓存）"""
+    schema_path = Path(__file__).parent / SCHEMA_FILES.get(db_type, SCHEMA_FILES["news"])
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _base_schema(db_type: str) -> Callable[[sqlite3.Connection], None]:
+    """版本 1：执行基础结构脚本"""
+    def migrate(conn: sqlite3.Connection) -> None:
+        conn.executescript(_read_schema_sql(db_type))
+    return migrate
+
+
+def _execute(*statements: str) -> Callable[[sqlite3.Connection], None]:
+    """按顺序执行若干条 SQL（用于新增索引等幂等操作）"""
+    def migrate(conn: sqlite3.Connection) -> None:
+        for statement in statements:
+            conn.execute(statement)
+    return migrate
+
+
+def _add_columns(table: str, columns: List[Tuple[str, str]]) -> Callable[[sqlite3.Connection], None]:
+    """
+    添加缺失的字段
+
+    旧数据库可能已经通过早期的临时逻辑添加过部分字段，因此逐个检查后再添加。
+    """
+    def migrate(conn: sqlite3.Connection) -> None:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns:
+            if name in existing:
+                continue
+            try:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+            except sqlite3.OperationalError as e:
+                # 其他进程可能同时完成了相同的迁移
+                if "duplicate column" not in str(e).lower():
+                    raise
+    return migrate
+
+
+# 主题阅读状态、去重标记和分组字段（原先由 API 在每次请求时临时检查添加）
+_THEME_COLUMNS = [
+    ("tags", "TEXT"),
+    ("status", "TEXT DEFAULT 'unread'"),
+    ("read_at", "TIMESTAMP"),
+    ("is_duplicate", "INTEGER DEFAULT 0"),
+    ("duplicate_similarity", "REAL"),
+    ("group_id", "TEXT"),
+    ("group_name", "TEXT"),
+]
+
+# 热点查询的复合/覆盖索引（查询计划由 test_query_plans.py 校验）
+# 被新索引前缀覆盖的单列索引一并删除，减少写入开销
+_NEWS_INDEXES_V3 = (
+    # get_today_all_data: ORDER BY platform_id, last_crawl_time；写入前按平台预加载
+    "CREATE INDEX IF NOT EXISTS idx_news_platform_last ON news_items(platform_id, last_crawl_time)",
+    # detect_new_titles: 是否存在更早批次
+    "CREATE INDEX IF NOT EXISTS idx_news_first_crawl ON news_items(first_crawl_time)",
+    # 排名历史按条目、时间顺序读取，rank 放入索引避免回表
+    "CREATE INDEX IF NOT EXISTS idx_rank_history_item_time ON rank_history(news_item_id, crawl_time, rank)",
+    # 失败来源: WHERE status = 'failed'
+    "CREATE INDEX IF NOT EXISTS idx_crawl_status_failed ON crawl_source_status(status, platform_id)",
+    "DROP INDEX IF EXISTS idx_news_platform",
+    "DROP INDEX IF EXISTS idx_rank_history_news",
+    "DROP INDEX IF EXISTS idx_crawl_status_record",
+)
+
+_RSS_INDEXES_V3 = (
+    # 主题列表: ORDER BY importance DESC, created_at DESC，可按 status / group_id 过滤
+    "CREATE INDEX IF NOT EXISTS idx_themes_rank ON analysis_themes(importance DESC, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_themes_status_rank "
+    "ON analysis_themes(status, importance DESC, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_themes_group_rank "
+    "ON analysis_themes(group_id, importance DESC, created_at DESC)",
+    # 内容未变化的源顺延最近一批；写入前按源预加载
+    "CREATE INDEX IF NOT EXISTS idx_rss_feed_last ON rss_items(feed_id, last_crawl_time)",
+    # get_latest_rss_data: WHERE last_crawl_time = ? ORDER BY published_at DESC
+    "CREATE INDEX IF NOT EXISTS idx_rss_last_published ON rss_items(last_crawl_time, published_at)",
+    # detect_new_rss_items: 是否存在更早批次
+    "CREATE INDEX IF NOT EXISTS idx_rss_first_crawl ON rss_items(first_crawl_time)",
+    # 主题关联文章: WHERE theme_id = ? / IN (...) ORDER BY [theme_id,] published_at DESC
+    "CREATE INDEX IF NOT EXISTS idx_rss_theme_published ON rss_items(theme_id, published_at DESC)",
+    # 失败来源: WHERE status = 'failed'
+    "CREATE INDEX IF NOT EXISTS idx_rss_crawl_status_failed ON rss_crawl_status(status, feed_id)",
+    "DROP INDEX IF EXISTS idx_rss_feed",
+    "DROP INDEX IF EXISTS idx_rss_theme_id",
+)
+
+MIGRATIONS: Dict[str, List[Migration]] = {
+    "news": [
+        (1, "基础表结构", _base_schema("news")),
+        (2, "新增 (platform_id, title) 索引，用于增量检测新标题", _execute(
+            "CREATE INDEX IF NOT EXISTS idx_news_platform_title "
+            "ON news_items(platform_id, title, first_crawl_time)",
+        )),
+        (3, "复合/覆盖索引：排名历史、失败来源、按平台读取", _execute(*_NEWS_INDEXES_V3)),
+    ],
+    "rss": [
+        (1, "基础表结构", _base_schema("rss")),
+        (2, "analysis_themes 增加阅读状态/去重/分组字段", _add_columns("analysis_themes", _THEME_COLUMNS)),
+        (3, "复合/覆盖索引：主题排序、按源/主题读取、失败来源", _execute(*_RSS_INDEXES_V3)),
+    ],
+}
+
+
+def get_latest_version(db_type: str = "news") -> int:
+    """获取指定数据库类型的最新结构版本"""
+    return MIGRATIONS[db_type][-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """读取数据库当前的结构版本"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def ensure_schema(conn: sqlite3.Connection, db_type: str = "news") -> int:
+    """
+    确保数据库结构为最新版本
+
+    Args:
+        conn: 数据库连接
+        db_type: 数据库类型 ("news" 或 "rss")
+
+    Returns:
+        迁移后的结构版本
+    """
+    if db_type not in MIGRATIONS:
+        raise ValueError(f"未知的数据库类型: {db_type}")
+
+    current = get_schema_version(conn)
+    latest = get_latest_version(db_type)
+    if current >= latest:
+        return current
+
+    for version, description, migrate in MIGRATIONS[db_type]:
+        if version <= current:
+            continue
+        migrate(conn)
+        conn.execute(f"PRAGMA user_version = {version}")
+        conn.commit()
+        if current > 0:
+            print(f"[存储] 数据库结构已升级到 v{version}: {description}")
+
+    return latest
@@ -0,0 +1,277 @@
+# coding=utf-8
+"""
+跨日期查询
+
+数据按日期分库（output/news/{date}.db、output/rss/{date}.db），
+单日接口（get_today_all_data、/api/themes 等）每次只能看一天。
+MultiDayQuery 把一段日期的数据库以只读方式 ATTACH 到同一个连接上，
+用 UNION ALL 拼出跨日期视图，一条 SQL 回答跨日期的问题（替代逐天打开/查询/关闭）：
+- 最近 N 天的分析主题
+- 某个标题在各天的出现情况（生命周期）
+- 各平台每天的条目数量走势
+
+单个连接可附加的数据库数量有上限（SQLITE_LIMIT_ATTACHED，默认 10），
+日期更多时按批次附加，每批一条 SQL，结果在 Python 端合并排序。
+旧数据库可能缺少后续迁移新增的字段，缺失的字段按 NULL 返回（只读附加，不做迁移）。
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from trendradar.utils.time import DEFAULT_TIMEZONE, format_date_folder
+
+
+# 单次查询最多覆盖的天数（每天需要检查一个数据库文件）
+MAX_QUERY_DAYS = 90
+
+# 无法读取连接上限时（Python 3.10 没有 Connection.getlimit）使用 SQLite 的编译默认值
+DEFAULT_ATTACH_LIMIT = 10
+
+THEME_COLUMNS = (
+    "id", "title", "summary", "category", "importance", "impact", "created_at",
+    "status", "tags", "read_at", "is_duplicate", "duplicate_similarity",
+    "group_id", "group_name",
+)
+
+
+class MultiDayQuery:
+    """按日期范围附加每日数据库的只读查询门面"""
+
+    def __init__(
+        self,
+        data_dir: str = "output",
+        timezone: str = DEFAULT_TIMEZONE,
+        busy_timeout: int = 5000,
+    ):
+        """
+        初始化查询门面
+
+        Args:
+            data_dir: 数据目录（与 LocalStorageBackend 相同）
+            timezone: 时区（确定"今天"）
+            busy_timeout: 遇到写锁时的等待时间（毫秒）
+        """
+        self.data_dir = Path(data_dir)
+        self.timezone = timezone
+        self.busy_timeout = busy_timeout
+
+    # ========================================
+    # 日期与连接
+    # ========================================
+
+    def get_dates(self, db_type: str = "news", days: int = 7, end_date: Optional[str] = None) -> List[str]:
+        """
+        获取日期范围内存在数据库文件的日期
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+            days: 天数（含 end_date 当天），超过 MAX_QUERY_DAYS 时按上限处理
+            end_date: 结束日期（YYYY-MM-DD），默认为今天
+
+        Returns:
+            日期列表（从新到旧）
+
+        Raises:
+            ValueError: end_date 不是有效的 YYYY-MM-DD 日期
+        """
+        end = datetime.strptime(format_date_folder(end_date, self.timezone), "%Y-%m-%d")
+        dates = []
+        for i in range(min(max(days, 0), MAX_QUERY_DAYS)):
+            try:
+                date = (end - timedelta(days=i)).strftime("%Y-%m-%d")
+            except OverflowError:
+                # 早于公元 1 年 1 月 1 日
+                break
+            if self._db_path(db_type, date).exists():
+                dates.append(date)
+        return dates
+
+    def _db_path(self, db_type: str, date: str) -> Path:
+        return self.data_dir / db_type / f"{date}.db"
+
+    def _attach_batches(
+        self, db_type: str, dates: Sequence[str]
+    ) -> Iterator[Tuple[sqlite3.Connection, List[Tuple[str, str]]]]:
+        """
+        按批次只读附加日期数据库
+
+        Yields:
+            (连接, [(schema 别名, 日期), ...])，每批不超过连接可附加的上限
+        """
+        conn = sqlite3.connect("file::memory:", uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        getlimit = getattr(conn, "getlimit", None)
+        limit = getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) if getlimit else DEFAULT_ATTACH_LIMIT
+
+        try:
+            for start in range(0, len(dates), limit):
+                aliases = []
+                try:
+                    for i, date in enumerate(dates[start:start + limit]):
+                        alias = f"d{i}"
+                        uri = self._db_path(db_type, date).resolve().as_uri() + "?mode=ro"
+                        conn.execute(f"ATTACH DATABASE ? AS {alias}", (uri,))
+                        aliases.append((alias, date))
+                    yield conn, aliases
+                finally:
+                    for alias, _ in aliases:
+                        conn.execute(f"DETACH DATABASE {alias}")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _select_columns(conn: sqlite3.Connection, alias: str, table: str, columns: Sequence[str]) -> str:
+        """生成 SELECT 字段列表，附加库中不存在的字段以 NULL 代替"""
+        existing = {row[1] for row in conn.execute(f"PRAGMA {alias}.table_info({table})")}
+        return ", ".join(name if name in existing else f"NULL AS {name}" for name in columns)
+
+    def _union_query(
+        self,
+        db_type: str,
+        dates: Sequence[str],
+        build: Callable[[sqlite3.Connection, str], str],
+        params: Sequence[Any] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        对每批附加的数据库执行一条 UNION ALL 查询
+
+        Args:
+            db_type: 数据库类型
+            dates: 日期列表
+            build: (conn, schema 别名) -> 单日 SELECT 语句，
+                第一个占位符为日期，其后依次为 params
+            params: 每个单日查询共用的参数
+
+        Returns:
+            所有批次的结果行（字典）
+        """
+        results: List[Dict[str, Any]] = []
+        if not dates:
+            return results
+
+        for conn, aliases in self._attach_batches(db_type, dates):
+            bind: List[Any] = []
+            for _, date in aliases:
+                bind.append(date)
+                bind.extend(params)
+            sql = " UNION ALL ".join(build(conn, alias) for alias, _ in aliases)
+            results.extend(dict(row) for row in conn.execute(sql, bind))
+
+        return results
+
+    # ========================================
+    # 跨日期查询
+    # ========================================
+
+    def get_themes(
+        self,
+        days: int = 7,
+        end_date: Optional[str] = None,
+        status: Optional[str] = None,
+        group_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        获取最近 N 天的分析主题
+
+        Args:
+            days: 天数
+            end_date: 结束日期，默认为今天
+            status: 过滤状态 (unread, read, archived)
+            group_id: 过滤分组 ID
+            limit: 最多返回条数
+
+        Returns:
+            主题列表（含 date 字段），按重要性、创建时间倒序
+        """
+        conditions = []
+        params: List[Any] = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if group_id:
+            conditions.append("group_id = ?")
+            params.append(group_id)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        def build(conn, alias):
+            columns = self._select_columns(conn, alias, "analysis_themes", THEME_COLUMNS)
+            return f"SELECT ? AS date, * FROM (SELECT {columns} FROM {alias}.analysis_themes){where}"
+
+        themes = self._union_query("rss", self.get_dates("rss", days, end_date), build, params)
+        themes.sort(key=lambda t: (t["importance"] or 0, t["created_at"] or ""), reverse=True)
+        return themes[:limit] if limit else themes
+
+    def get_title_history(
+        self,
+        title: str,
+        platform_id: Optional[str] = None,
+        days: int = 30,
+        end_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        获取标题在最近 N 天中每天的出现情况
+
+        Args:
+            title: 完整标题（精确匹配，命中 idx_news_title）
+            platform_id: 只查询该平台
+            days: 天数
+            end_date: 结束日期，默认为今天
+
+        Returns:
+            [{date, platform_id, title, url, first_crawl_time, last_crawl_time,
+              crawl_count, best_rank}, ...]，按日期从旧到新
+        """
+        params: List[Any] = [title]
+        platform_filter = ""
+        if platform_id:
+            platform_filter = " AND n.platform_id = ?"
+            params.append(platform_id)
+
+        def build(conn, alias):
+            return f"""
+                SELECT ? AS date, n.platform_id, n.title, n.url,
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       (SELECT MIN(rh.rank) FROM {alias}.rank_history rh
+                        WHERE rh.news_item_id = n.id) AS best_rank
+                FROM {alias}.news_items n
+                WHERE n.title = ?{platform_filter}
+            """
+
+        history = self._union_query("news", self.get_dates("news", days, end_date), build, params)
+        history.sort(key=lambda h: (h["date"], h["platform_id"], h["first_crawl_time"]))
+        return history
+
+    def get_platform_volume(self, days: int = 7, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        获取各平台每天的条目数量走势
+
+        Args:
+            days: 天数
+            end_date: 结束日期，默认为今天
+
+        Returns:
+            [{date, platform_id, platform_name, items, crawls}, ...]，按平台、日期排序；
+            items 为当天去重后的条目数，crawls 为当天抓取成功的次数
+        """
+
+        def build(conn, alias):
+            return f"""
+                SELECT ? AS date, v.platform_id,
+                       COALESCE(p.name, v.platform_id) AS platform_name,
+                       v.items,
+                       (SELECT COUNT(*) FROM {alias}.crawl_source_status cs
+                        WHERE cs.platform_id = v.platform_id AND cs.status = 'success') AS crawls
+                FROM (
+                    SELECT platform_id, COUNT(*) AS items
+                    FROM {alias}.news_items GROUP BY platform_id
+                ) v
+                LEFT JOIN {alias}.platforms p ON p.id = v.platform_id
+            """
+
+        volume = self._union_query("news", self.get_dates("news", days, end_date), build)
+        volume.sort(key=lambda v: (v["platform_id"], v["date"]))
+        return volume
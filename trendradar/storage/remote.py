@@ -7,15 +7,17 @@
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
 """
 
+import json
 import pytz
 import re
 import shutil
 import sys
 import tempfile
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     import boto3
@@ -28,7 +30,17 @@ except ImportError:
     BotoConfig = None
     ClientError = Exception
 
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.base import ContentFetcher, StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.changeset import (
+    apply_changeset,
+    clear_changes,
+    count_changes,
+    export_changeset,
+    install_change_tracking,
+)
+from trendradar.storage.migrations import ensure_schema, get_schema_version
+from trendradar.storage.remote_cache import RemoteFileCache
+from trendradar.storage.sqlite_profile import checkpoint_sqlite, connect_sqlite, resolve_sqlite_profile
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -37,6 +49,14 @@ from trendradar.utils.time import (
 from trendradar.utils.url import normalize_url
 
 
+# 超过该大小的文件分片上传；分片逐个读取，上传时内存中最多只有一个分片
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 拉取历史数据时的并发下载数
+PULL_MAX_WORKERS = 8
+
+
 class RemoteStorageBackend(StorageBackend):
     """
     远程云存储后端（S3 兼容协议）
@@ -61,6 +81,11 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict] = None,
+        sync_mode: str = "full",
+        compact_every: int = 24,
+        cache_dir: Optional[str] = None,
+        cache_max_mb: int = 512,
     ):
         """
         初始化远程存储后端
@@ -75,6 +100,12 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接配置（PRAGMA），为空时使用默认配置
+            sync_mode: 同步方式，"full" 每次上传整个数据库，
+                "delta" 每次只上传本次写入的变更集，定期合并为完整快照
+            compact_every: delta 模式下累计多少个变更集后上传一次完整快照（0 表示只在当天首次写入时上传）
+            cache_dir: 远程数据库本地缓存目录（为空时不缓存，每次运行都重新下载）
+            cache_max_mb: 本地缓存总大小上限（MB，0 表示不缓存）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,6 +116,16 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = resolve_sqlite_profile(sqlite_profile)
+        self.sync_mode = (sync_mode or "full").lower()
+        if self.sync_mode not in ("full", "delta"):
+            print(f"[远程存储] 未知的同步方式 {sync_mode}，使用 full")
+            self.sync_mode = "full"
+        self.compact_every = max(0, int(compact_every or 0))
+        self._cache = (
+            RemoteFileCache(cache_dir, int(cache_max_mb) * 1024 * 1024)
+            if cache_dir and cache_max_mb and cache_max_mb > 0 else None
+        )
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -117,8 +158,11 @@ class RemoteStorageBackend(StorageBackend):
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # delta 模式的同步状态:
+        # {本地路径: {"base_exists", "base_seq", "cached_seq", "last_seq", "changeset_keys"}}
+        self._sync_state: Dict[str, Dict] = {}
 
-        print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
+        print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}，同步方式: {self.sync_mode}")
 
     @property
     def backend_name(self) -> str:
@@ -195,57 +239,215 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
-    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+    def _get_changeset_prefix(self, date: Optional[str] = None, db_type: str = "news") -> str:
         """
-        从远程存储下载当天的 SQLite 文件到本地临时目录
+        获取 delta 模式下变更集的对象键前缀
+
+        Returns:
+            如 "news/2025-12-28.changes/"，变更集为 "{前缀}{序号:06d}.json.gz"
+        """
+        date_folder = self._format_date_folder(date)
+        return f"{db_type}/{date_folder}.changes/"
+
+    def _list_changesets(self, date: Optional[str] = None, db_type: str = "news") -> List[Tuple[int, str]]:
+        """
+        列出远程存储中某天的变更集
+
+        Returns:
+            [(序号, 对象键), ...]，按序号升序
+        """
+        prefix = self._get_changeset_prefix(date, db_type)
+        changesets = []
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                match = re.match(r'(\d+)\.json\.gz$', obj['Key'][len(prefix):])
+                if match:
+                    changesets.append((int(match.group(1)), obj['Key']))
+
+        return sorted(changesets)
+
+    def _fetch_object(self, r2_key: str, local_path: Path) -> Optional[Dict]:
+        """
+        下载对象到本地文件
 
         使用 get_object + iter_chunks 替代 download_file，
         以正确处理腾讯云 COS 的 chunked transfer encoding。
+        不预先 HEAD，对象不存在时由 get_object 的错误码判断。
 
         Args:
-            date: 日期字符串
-            db_type: 数据库类型 ("news" 或 "rss")
+            r2_key: 远程对象键
+            local_path: 本地文件路径
 
         Returns:
-            本地文件路径，如果不存在返回 None
+            get_object 响应（Body 已读完，含 Metadata / ETag 等），对象不存在时返回 None
         """
-        r2_key = self._get_remote_db_key(date, db_type)
-        local_path = self._get_local_db_path(date, db_type)
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            # S3 兼容存储可能返回不同的错误码
+            if error_code in ("404", "NoSuchKey", "Not Found"):
+                return None
+            print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
+            raise
 
-        # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(local_path, 'wb') as f:
+            for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                f.write(chunk)
+        return response
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-            return None
+    def _head_object(self, r2_key: str) -> Optional[Dict]:
+        """
+        获取对象的 HEAD 响应
 
+        Returns:
+            HEAD 响应，对象不存在时返回 None（其他错误抛出异常）
+        """
         try:
-            # 使用 get_object + iter_chunks 替代 download_file
-            # iter_chunks 会自动处理 chunked transfer encoding
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-            with open(local_path, 'wb') as f:
-                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                    f.write(chunk)
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
+            return self.s3_client.head_object(Bucket=self.bucket_name, Key=r2_key)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
-            # S3 兼容存储可能返回不同的错误码
             if error_code in ("404", "NoSuchKey", "Not Found"):
-                print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
                 return None
-            else:
-                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
-                raise
-        except Exception as e:
-            print(f"[远程存储] 下载异常: {e}")
             raise
 
+    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+        """
+        从远程存储下载当天的 SQLite 文件到本地临时目录
+
+        配置了本地缓存时先 HEAD 校验，缓存副本与远程一致则直接复制，不再下载。
+        delta 模式下只下载完整快照，变更集在打开连接时回放（见 _replay_changesets）。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            本地文件路径，如果不存在返回 None
+        """
+        r2_key = self._get_remote_db_key(date, db_type)
+        local_path = self._get_local_db_path(date, db_type)
+
+        response = None
+        fetched = False
+        cache_hit = False
+        cached_seq = 0
+
+        # 本地缓存：一次 HEAD 校验，副本与远程一致时不再下载
+        if self._cache is not None:
+            try:
+                response = self._head_object(r2_key)
+                fetched = response is None
+                entry = self._cache.get(r2_key, RemoteFileCache.validator(response)) if response else None
+                if entry is not None:
+                    self._cache.copy_to(r2_key, local_path)
+                    cached_seq = entry.get("applied_seq", 0)
+                    fetched = cache_hit = True
+                    print(f"[远程缓存] 命中，跳过下载: {r2_key}")
+            except Exception as e:
+                print(f"[远程缓存] 校验失败，直接下载 ({r2_key}): {e}")
+                response = None
+                fetched = cache_hit = False
+
+        if not fetched:
+            try:
+                response = self._fetch_object(r2_key, local_path)
+            except Exception as e:
+                print(f"[远程存储] 下载异常: {e}")
+                raise
+            if response is not None:
+                print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
+
+        metadata = (response or {}).get("Metadata") or {}
+        base_seq = int(metadata.get("changeset-seq", 0) or 0)
+        self._sync_state[str(local_path)] = {
+            "base_exists": response is not None,
+            "base_seq": base_seq,
+            "cached_seq": max(base_seq, cached_seq),
+            "last_seq": 0,
+            "changeset_keys": [],
+        }
+
+        if response is None:
+            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+            return None
+
+        if not cache_hit and self._cache is not None:
+            self._cache.put(r2_key, local_path, RemoteFileCache.validator(response), base_seq)
+
+        self._downloaded_files.append(local_path)
+        return local_path
+
+    def _replay_changesets(
+        self,
+        conn: sqlite3.Connection,
+        date: Optional[str] = None,
+        db_type: str = "news",
+        base_seq: int = 0,
+    ) -> Tuple[int, List[str]]:
+        """
+        按序号回放快照之后的变更集
+
+        Args:
+            conn: 已完成结构升级的数据库连接
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+            base_seq: 快照已包含的最大变更集序号
+
+        Returns:
+            (远程最大变更集序号, 远程全部变更集对象键)
+        """
+        changesets = self._list_changesets(date, db_type)
+        applied = 0
+
+        for seq, key in changesets:
+            if seq <= base_seq:
+                continue
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            apply_changeset(conn, response['Body'].read())
+            applied += 1
+
+        if applied:
+            conn.commit()
+            print(f"[远程存储] 已回放 {applied} 个变更集: {self._get_changeset_prefix(date, db_type)}")
+
+        last_seq = max([base_seq] + [seq for seq, _ in changesets])
+        return last_seq, [key for _, key in changesets]
+
     def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
-        上传本地 SQLite 文件到远程存储
+        把本地写入同步到远程存储
+
+        full 模式上传整个数据库；delta 模式上传本次写入的变更集，
+        远程还没有快照或变更集累计达到 compact_every 个时改为上传完整快照。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否上传成功
+        """
+        if self.sync_mode != "delta":
+            return self._upload_snapshot(date, db_type)
+
+        state = self._sync_state.get(str(self._get_local_db_path(date, db_type)))
+        if state is None or not state["base_exists"]:
+            return self._upload_snapshot(date, db_type)
+        if self.compact_every and len(state["changeset_keys"]) >= self.compact_every:
+            print(f"[远程存储] 已累计 {len(state['changeset_keys'])} 个变更集，合并为完整快照")
+            return self._upload_snapshot(date, db_type)
+        return self._upload_changeset(date, db_type)
+
+    def _upload_snapshot(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        上传完整的 SQLite 文件
+
+        delta 模式下在对象元数据中记录快照包含的变更集序号，
+        上传成功后删除已合并的变更集。
 
         Args:
             date: 日期字符串
@@ -261,39 +463,179 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 本地文件不存在，无法上传: {local_path}")
             return False
 
+        # WAL 模式下未合并的写入只在 -wal 文件中，上传前先合并回主文件
+        conn = self._db_connections.get(str(local_path))
+        if conn is not None:
+            checkpoint_sqlite(conn)
+
+        state = self._sync_state.get(str(local_path)) if self.sync_mode == "delta" else None
+
         try:
-            # 获取本地文件大小
             local_size = local_path.stat().st_size
             print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
 
-            # 读取文件内容为 bytes 后上传
-            # 避免传入文件对象时 requests 库使用 chunked transfer encoding
-            # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
+            metadata = {"changeset-seq": str(state["last_seq"])} if state is not None else None
+            response = self._put_file(local_path, r2_key, 'application/x-sqlite3', metadata)
+            print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+
+        except Exception as e:
+            print(f"[远程存储] 上传失败: {e}")
+            return False
+
+        # 上传后的文件即远程最新版本，刷新缓存副本（PUT 响应没有 ETag 时缓存失效）
+        if self._cache is not None:
+            self._cache.put(
+                r2_key,
+                local_path,
+                {"etag": response.get("ETag") or "", "size": str(local_size), "last_modified": ""},
+                state["last_seq"] if state is not None else 0,
+            )
+
+        if state is not None:
+            state["base_exists"] = True
+            state["base_seq"] = state["last_seq"]
+            if conn is not None:
+                clear_changes(conn)
+            self._delete_objects(state["changeset_keys"])
+            state["changeset_keys"] = []
+
+        return True
+
+    def _put_file(
+        self,
+        local_path: Path,
+        r2_key: str,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """
+        上传本地文件，内存占用不超过一个分片
+
+        腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked transfer encoding，
+        因此不传入文件对象，而是每次读取一段 bytes 并明确设置 ContentLength：
+        - 不超过 MULTIPART_THRESHOLD 的文件一次 put_object
+        - 更大的文件按 MULTIPART_CHUNK_SIZE 分片上传，失败时中止分片上传，不留下残片
+
+        put_object / complete_multipart_upload 失败会抛出异常，不再额外 HEAD 验证。
+
+        Args:
+            local_path: 本地文件路径
+            r2_key: 远程对象键
+            content_type: Content-Type
+            metadata: 对象用户元数据
+
+        Returns:
+            put_object / complete_multipart_upload 响应（含 ETag）
+        """
+        extra = {"Metadata": metadata} if metadata else {}
+        file_size = local_path.stat().st_size
+
+        if file_size <= MULTIPART_THRESHOLD:
             with open(local_path, 'rb') as f:
-                file_content = f.read()
+                body = f.read()
+            return self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                Body=body,
+                ContentLength=len(body),
+                ContentType=content_type,
+                **extra,
+            )
 
-            # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=r2_key, ContentType=content_type, **extra
+        )["UploadId"]
+        parts = []
+        try:
+            with open(local_path, 'rb') as f:
+                while True:
+                    chunk = f.read(MULTIPART_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    part_number = len(parts) + 1
+                    response = self.s3_client.upload_part(
+                        Bucket=self.bucket_name,
+                        Key=r2_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=chunk,
+                        ContentLength=len(chunk),
+                    )
+                    parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+            response = self.s3_client.complete_multipart_upload(
                 Bucket=self.bucket_name,
                 Key=r2_key,
-                Body=file_content,
-                ContentLength=local_size,
-                ContentType='application/x-sqlite3',
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
             )
-            print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+            print(f"[远程存储] 分片上传完成: {r2_key} ({len(parts)} 个分片)")
+            return response
+        except Exception:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=r2_key, UploadId=upload_id
+                )
+            except Exception as e:
+                print(f"[远程存储] 中止分片上传失败 ({r2_key}): {e}")
+            raise
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
-                print(f"[远程存储] 上传验证成功: {r2_key}")
-                return True
-            else:
-                print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
-                return False
+    def _upload_changeset(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        上传自上次同步以来的变更集（delta 模式）
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
 
+        Returns:
+            是否上传成功（没有变更时直接返回 True）
+        """
+        local_path = self._get_local_db_path(date, db_type)
+        conn = self._db_connections.get(str(local_path))
+        state = self._sync_state[str(local_path)]
+
+        if conn is None or count_changes(conn) == 0:
+            return True
+
+        seq = state["last_seq"] + 1
+        r2_key = f"{self._get_changeset_prefix(date, db_type)}{seq:06d}.json.gz"
+
+        try:
+            body = export_changeset(conn, get_schema_version(conn))
+            # bytes + ContentLength，避免 chunked encoding（腾讯云 COS）
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                Body=body,
+                ContentLength=len(body),
+                ContentType='application/gzip',
+            )
+            print(f"[远程存储] 已上传变更集: {r2_key} ({len(body)} bytes)")
         except Exception as e:
-            print(f"[远程存储] 上传失败: {e}")
+            # 变更记录保留，下次同步时合并进新的变更集
+            print(f"[远程存储] 上传变更集失败: {e}")
             return False
 
+        state["last_seq"] = seq
+        state["changeset_keys"].append(r2_key)
+        clear_changes(conn)
+
+        # 工作副本此时等于远程快照 + 全部变更集，刷新缓存副本，下次运行无需回放
+        if self._cache is not None:
+            checkpoint_sqlite(conn)
+            self._cache.set_applied_seq(self._get_remote_db_key(date, db_type), local_path, seq)
+        return True
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        """批量删除远程对象（每次最多 1000 个），失败只打印警告"""
+        for i in range(0, len(keys), 1000):
+            batch = [{'Key': key} for key in keys[i:i + 1000]]
+            try:
+                self.s3_client.delete_objects(Bucket=self.bucket_name, Delete={'Objects': batch})
+            except Exception as e:
+                print(f"[远程存储] 删除对象失败: {e}")
+
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
         获取数据库连接
@@ -316,45 +658,44 @@ class RemoteStorageBackend(StorageBackend):
             if not local_path.exists():
                 self._download_sqlite(date, db_type)
 
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = connect_sqlite(db_path, self.sqlite_profile)
             self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
 
-        return self._db_connections[db_path]
+            if self.sync_mode == "delta":
+                state = self._sync_state.get(db_path)
+                if state is not None:
+                    # 缓存副本可能已包含快照之后的部分变更集
+                    state["last_seq"], state["changeset_keys"] = self._replay_changesets(
+                        conn, date, db_type, state["cached_seq"]
+                    )
+                else:
+                    # 本地已有文件（未经本次下载）：以本地为准，首次同步时上传完整快照并清理远程变更集
+                    changesets = self._list_changesets(date, db_type)
+                    last_seq = changesets[-1][0] if changesets else 0
+                    self._sync_state[db_path] = {
+                        "base_exists": False,
+                        "base_seq": last_seq,
+                        "cached_seq": last_seq,
+                        "last_seq": last_seq,
+                        "changeset_keys": [key for _, key in changesets],
+                    }
+                install_change_tracking(conn)
 
-    def _get_schema_path(self, db_type: str = "news") -> Path:
-        """
-        获取 schema.sql 文件路径
-
-        Args:
-            db_type: 数据库类型 ("news" 或 "rss")
+            self._db_connections[db_path] = conn
 
-        Returns:
-            schema 文件路径
-        """
-        if db_type == "rss":
-            return Path(__file__).parent / "rss_schema.sql"
-        return Path(__file__).parent / "schema.sql"
+        return self._db_connections[db_path]
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        确保数据库表结构为最新版本
+
+        通过 PRAGMA user_version 判断，已是最新版本时不会重复执行 schema 脚本
 
         Args:
             conn: 数据库连接
             db_type: 数据库类型 ("news" 或 "rss")
         """
-        schema_path = self._get_schema_path(db_type)
-
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        conn.commit()
+        ensure_schema(conn, db_type)
 
     def save_news_data(self, data: NewsData) -> bool:
         """
@@ -408,9 +749,10 @@ class RemoteStorageBackend(StorageBackend):
 
                         # 检查是否已存在（通过标准化 URL + platform_id）
                         if normalized_url:
+                            # url != '' 让查询命中部分唯一索引 idx_news_url_platform
                             cursor.execute("""
                                 SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
+                                WHERE url = ? AND platform_id = ? AND url != ''
                             """, (normalized_url, source_id))
                             existing = cursor.fetchone()
 
@@ -557,6 +899,47 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 保存失败: {e}")
             return False
 
+    def _load_rank_history(
+        self, cursor: sqlite3.Cursor, last_crawl_time: Optional[str] = None
+    ) -> Dict[int, List[int]]:
+        """
+        读取排名历史（按条目聚合）
+
+        在数据库中按 news_item_id 分组、用 group_concat 拼接「crawl_time=rank」，每个条目只返回一行。
+        SQLite 不保证 group_concat 的拼接顺序，因此带上抓取时间，在 Python 端按时间排序后
+        再按首次出现去重，结果不依赖执行计划（分组仍由 idx_rank_history_item_time 覆盖，无临时排序）。
+        不再拼接 IN (?, ?, ...) 参数列表，避免超出 SQLite 变量数上限。
+
+        Args:
+            cursor: 数据库游标
+            last_crawl_time: 只读取该批次仍在榜的条目，为空时读取全天
+
+        Returns:
+            {news_item_id: [rank, ...]}，排名按首次出现顺序去重
+        """
+        if last_crawl_time is None:
+            cursor.execute("""
+                SELECT news_item_id, group_concat(crawl_time || '=' || rank)
+                FROM rank_history
+                GROUP BY news_item_id
+            """)
+        else:
+            cursor.execute("""
+                SELECT n.id, group_concat(rh.crawl_time || '=' || rh.rank)
+                FROM news_items n
+                JOIN rank_history rh ON rh.news_item_id = n.id
+                WHERE n.last_crawl_time = ?
+                GROUP BY n.id
+            """, (last_crawl_time,))
+
+        rank_history_map: Dict[int, List[int]] = {}
+        for news_id, entries in cursor.fetchall():
+            if entries:
+                # crawl_time 为定长的 HH-MM，按字符串排序即按时间排序
+                ranks = (int(entry.rpartition("=")[2]) for entry in sorted(entries.split(",")))
+                rank_history_map[news_id] = list(dict.fromkeys(ranks))
+        return rank_history_map
+
     def get_today_all_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取指定日期的所有新闻数据（合并后）"""
         try:
@@ -577,24 +960,8 @@ class RemoteStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 排名历史（在数据库中按条目聚合）
+            rank_history_map = self._load_rank_history(cursor)
 
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
@@ -749,40 +1116,63 @@ class RemoteStorageBackend(StorageBackend):
 
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+
+        直接用当前批次的 (platform_id, title) 到 news_items 中查询，
+        通过 idx_news_platform_title 索引一次得到"已见过"的标题，
+        不再加载当天全部新闻和排名历史。
+
+        Args:
+            current_data: 当前抓取的数据
+
+        Returns:
+            新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
+            conn = self._get_connection(current_data.date)
+            cursor = conn.cursor()
 
             # 获取当前批次时间
             current_time = current_data.crawl_time
 
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
+            cursor.execute("""
+                SELECT EXISTS(SELECT 1 FROM news_items),
+                       EXISTS(SELECT 1 FROM news_items WHERE first_crawl_time < ?)
+            """, (current_time,))
+            has_any_data, has_historical_data = cursor.fetchone()
+
+            if not has_any_data:
+                # 没有历史数据，所有都是新的
+                return self._all_titles_new(current_data)
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
             if not has_historical_data:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
+            # 查询当前批次中已在历史批次出现过的标题（first_crawl_time < current_time）
+            # 同一标题因 URL 变化而产生多条记录时，任意一条更早出现即视为已见过
+            candidates = [
+                [source_id, item.title]
+                for source_id, news_list in current_data.items.items()
+                for item in news_list
+            ]
+            if not candidates:
+                return {}
+
+            cursor.execute("""
+                SELECT n.platform_id, n.title
+                FROM json_each(?) AS c
+                JOIN news_items n
+                  ON n.platform_id = json_extract(c.value, '$[0]')
+                 AND n.title = json_extract(c.value, '$[1]')
+                WHERE n.first_crawl_time < ?
+            """, (json.dumps(candidates, ensure_ascii=False), current_time))
+            seen_titles = {(row[0], row[1]) for row in cursor.fetchall()}
+
+            # 检测新增
             new_titles = {}
             for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
                 for item in news_list:
-                    if item.title not in hist_set:
+                    if (source_id, item.title) not in seen_titles:
                         if source_id not in new_titles:
                             new_titles[source_id] = {}
                         new_titles[source_id][item.title] = item
@@ -793,6 +1183,14 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检测新标题失败: {e}")
             return {}
 
+    @staticmethod
+    def _all_titles_new(current_data: NewsData) -> Dict[str, Dict]:
+        """当天尚无任何数据时，当前批次的所有标题都视为新增"""
+        new_titles = {}
+        for source_id, news_list in current_data.items.items():
+            new_titles[source_id] = {item.title: item for item in news_list}
+        return new_titles
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照（远程存储模式下默认不支持）"""
         if not self.enable_txt:
@@ -949,8 +1347,8 @@ class RemoteStorageBackend(StorageBackend):
                     # 解析日期（格式: news/YYYY-MM-DD.db 或 news/YYYY年MM月DD日.db）
                     folder_date = None
                     try:
-                        # ISO 格式: news/YYYY-MM-DD.db
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        # ISO 格式: news/YYYY-MM-DD.db，delta 模式的变更集 news/YYYY-MM-DD.changes/*
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})(?:\.db$|\.changes/)', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -1079,94 +1477,64 @@ class RemoteStorageBackend(StorageBackend):
     # RSS 数据存储方法
     # ========================================
 
-    def save_rss_data(self, data: RSSData) -> bool:
+    def save_rss_data(
+        self,
+        data: RSSData,
+        fetch_contents: Optional[ContentFetcher] = None,
+    ) -> bool:
         """
         保存 RSS 数据到远程存储（以 URL 为唯一标识）
 
-        流程：下载现有数据库 → 插入/更新数据 → 上传回远程存储
+        流程：下载现有数据库 → 批量插入/更新数据 → 并发抓取全文 → 上传回远程存储
 
         Args:
             data: RSS 数据
+            fetch_contents: 全文抓取函数，为空时跳过全文抓取
 
         Returns:
             是否保存成功
         """
         try:
             conn = self._get_connection(data.date, db_type="rss")
-            cursor = conn.cursor()
+        except Exception as e:
+            print(f"[远程存储] 保存 RSS 数据失败: {e}")
+            return False
 
+        cursor = conn.cursor()
+        try:
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
+            # 条目写入放在一个显式事务中
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
 
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
+            # 同步 RSS 源信息到 rss_feeds 表
+            cursor.executemany("""
+                INSERT INTO rss_feeds (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(feed_id, feed_name, now_str) for feed_id, feed_name in data.id_to_name.items()])
 
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+            new_count, updated_count, scrape_targets = self._upsert_rss_items(cursor, data, now_str)
 
-            total_items = new_count + updated_count
+            # 内容未变化的源（条件请求命中）：无需逐条写入，
+            # 只把该源最近一批条目顺延到本次抓取，保证"当前榜单"完整
+            carried_count = 0
+            for feed_id in data.unchanged_ids:
+                cursor.execute("""
+                    UPDATE rss_items SET
+                        last_crawl_time = ?,
+                        crawl_count = crawl_count + 1,
+                        updated_at = ?
+                    WHERE feed_id = ? AND last_crawl_time = (
+                        SELECT MAX(last_crawl_time) FROM rss_items WHERE feed_id = ?
+                    )
+                """, (data.crawl_time, now_str, feed_id, feed_id))
+                carried_count += cursor.rowcount
+
+            total_items = new_count + updated_count + carried_count
 
             # 记录抓取信息
             cursor.execute("""
@@ -1183,26 +1551,21 @@ class RemoteStorageBackend(StorageBackend):
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                # 确保失败的源也在 rss_feeds 表中
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+
+                # 记录成功的源（含内容未变化的源）和失败的源
+                status_rows = [(crawl_record_id, feed_id, "success")
+                               for feed_id in list(data.items.keys()) + list(data.unchanged_ids)]
+                status_rows.extend((crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids)
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO rss_crawl_status
+                    (crawl_record_id, feed_id, status)
+                    VALUES (?, ?, ?)
+                """, status_rows)
 
             conn.commit()
 
@@ -1210,20 +1573,209 @@ class RemoteStorageBackend(StorageBackend):
             log_parts = [f"[远程存储] RSS 处理完成：新增 {new_count} 条"]
             if updated_count > 0:
                 log_parts.append(f"更新 {updated_count} 条")
+            if data.unchanged_ids:
+                log_parts.append(f"{len(data.unchanged_ids)} 个源未变化")
             print("，".join(log_parts))
 
-            # 上传到远程存储
-            if self._upload_sqlite(data.date, db_type="rss"):
-                print(f"[远程存储] RSS 数据已同步到远程存储")
-                return True
-            else:
-                print(f"[远程存储] RSS 上传远程存储失败")
-                return False
-
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             print(f"[远程存储] 保存 RSS 数据失败: {e}")
             return False
 
+        # --- 全文抓取（独立阶段，失败不影响已写入的数据） ---
+        if fetch_contents and scrape_targets:
+            self._save_article_contents(conn, fetch_contents, scrape_targets)
+
+        # 上传到远程存储
+        if self._upload_sqlite(data.date, db_type="rss"):
+            print(f"[远程存储] RSS 数据已同步到远程存储")
+            return True
+        else:
+            print(f"[远程存储] RSS 上传远程存储失败")
+            return False
+
+    def _upsert_rss_items(
+        self, cursor: sqlite3.Cursor, data: RSSData, now_str: str
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        写入 RSS 条目
+
+        整批条目先在一个保存点内批量写入；批量写入出错时回滚到保存点，
+        改为逐条写入（每条一个保存点），出错的条目记录日志后跳过，其余条目照常保存。
+
+        Args:
+            cursor: 处于事务中的游标
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 需要抓取全文的 (条目 ID, URL) 列表)
+        """
+        feed_ids = list(data.items.keys())
+        if not feed_ids:
+            return 0, 0, []
+
+        entries = [(feed_id, item) for feed_id, rss_list in data.items.items() for item in rss_list]
+
+        # 预加载已有记录
+        placeholders = ",".join("?" * len(feed_ids))
+        cursor.execute(f"""
+            SELECT id, url, feed_id FROM rss_items
+            WHERE feed_id IN ({placeholders})
+        """, feed_ids)
+        known: Dict[Tuple[str, str], int] = {(row[1], row[2]): row[0] for row in cursor.fetchall()}
+
+        cursor.execute("SAVEPOINT rss_batch")
+        try:
+            return self._write_rss_entries(cursor, entries, known, data.crawl_time, now_str)
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO rss_batch")
+            print(f"[远程存储] RSS 批量写入失败，改为逐条写入: {e}")
+        finally:
+            cursor.execute("RELEASE rss_batch")
+
+        new_count, updated_count = 0, 0
+        scrape_targets: List[Tuple[int, str]] = []
+        for feed_id, item in entries:
+            cursor.execute("SAVEPOINT rss_item")
+            try:
+                added, updated, targets = self._write_rss_entries(
+                    cursor, [(feed_id, item)], known, data.crawl_time, now_str
+                )
+                new_count += added
+                updated_count += updated
+                scrape_targets.extend(targets)
+            except sqlite3.Error as e:
+                cursor.execute("ROLLBACK TO rss_item")
+                print(f"[远程存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+            finally:
+                cursor.execute("RELEASE rss_item")
+
+        return new_count, updated_count, scrape_targets
+
+    def _write_rss_entries(
+        self,
+        cursor: sqlite3.Cursor,
+        entries: List[Tuple[str, RSSItem]],
+        known: Dict[Tuple[str, str], int],
+        crawl_time: str,
+        now_str: str,
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        批量写入一组 RSS 条目
+
+        按新增/更新分组后用 executemany 写入。(url, feed_id) 有唯一索引，重复条目只保留第一条。
+        全部写入成功后才更新 known，写入出错时 known 保持不变。
+
+        Args:
+            cursor: 处于事务中的游标
+            entries: (源 ID, RSS 条目) 列表
+            known: 已有记录 (url, feed_id) -> id
+            crawl_time: 抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 需要抓取全文的 (条目 ID, URL) 列表)
+        """
+        # 本批次新增的记录，写入成功后合并到 known
+        staged: Dict[Tuple[str, str], int] = {}
+
+        insert_rows = []
+        pending_updates = []
+        pending_keys = set()
+
+        for feed_id, item in entries:
+            url = item.url or ""
+            key = (url, feed_id)
+
+            if key in known or key in pending_keys:
+                # 已存在（或同一批次内已出现）的条目更新之；URL 为空的重复条目直接跳过
+                if url:
+                    pending_updates.append((key, item))
+                continue
+
+            pending_keys.add(key)
+            insert_rows.append((item.title, feed_id, url, item.published_at,
+                                item.summary, item.author, crawl_time,
+                                crawl_time, now_str, now_str))
+
+        scrape_targets: List[Tuple[int, str]] = []
+        if insert_rows:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM rss_items")
+            max_id_before = cursor.fetchone()[0]
+
+            cursor.executemany("""
+                INSERT INTO rss_items
+                (title, feed_id, url, published_at, summary, author,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, insert_rows)
+
+            cursor.execute("""
+                SELECT id, url, feed_id FROM rss_items WHERE id > ? ORDER BY id
+            """, (max_id_before,))
+            for row in cursor.fetchall():
+                staged[(row[1], row[2])] = row[0]
+                if row[1]:
+                    scrape_targets.append((row[0], row[1]))
+
+        # 更新目标可能是本批次刚插入的条目，插入后再确定 ID
+        update_rows = [(item.title, item.published_at, item.summary, item.author,
+                        crawl_time, now_str, staged[key] if key in staged else known[key])
+                       for key, item in pending_updates]
+
+        cursor.executemany("""
+            UPDATE rss_items SET
+                title = ?,
+                published_at = ?,
+                summary = ?,
+                author = ?,
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE id = ?
+        """, update_rows)
+
+        known.update(staged)
+        return len(insert_rows), len(update_rows), scrape_targets
+
+    def _save_article_contents(
+        self,
+        conn: sqlite3.Connection,
+        fetch_contents: ContentFetcher,
+        targets: List[Tuple[int, str]],
+    ) -> int:
+        """
+        并发抓取新条目全文并批量写入 article_contents
+
+        Args:
+            conn: RSS 数据库连接
+            fetch_contents: 全文抓取函数
+            targets: (条目 ID, URL) 列表
+
+        Returns:
+            成功写入的全文数量
+        """
+        contents = fetch_contents(targets)
+        if not contents:
+            return 0
+
+        try:
+            conn.executemany("""
+                INSERT OR IGNORE INTO article_contents (rss_item_id, content)
+                VALUES (?, ?)
+            """, list(contents.items()))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"[远程存储] 保存全文失败: {e}")
+            return 0
+
+        print(f"[远程存储] 抓取全文 {len(contents)}/{len(targets)} 篇")
+        return len(contents)
+
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """
         获取指定日期的所有 RSS 数据
@@ -1316,6 +1868,9 @@ class RemoteStorageBackend(StorageBackend):
         该方法比较当前抓取数据与历史数据，找出新增的 RSS 条目。
         关键逻辑：只有在历史批次中从未出现过的 URL 才算新增。
 
+        直接用当前批次的 (feed_id, url) 通过 idx_rss_url_feed 索引查询已见过的条目，
+        不再加载当天全部 RSS 数据。
+
         Args:
             current_data: 当前抓取的 RSS 数据
 
@@ -1323,39 +1878,52 @@ class RemoteStorageBackend(StorageBackend):
             新增的 RSS 条目 {feed_id: [RSSItem, ...]}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_rss_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                return current_data.items.copy()
+            conn = self._get_connection(current_data.date, db_type="rss")
+            cursor = conn.cursor()
 
             # 获取当前批次时间
             current_time = current_data.crawl_time
 
-            # 收集历史 URL（first_time < current_time 的条目）
-            historical_urls: Dict[str, set] = {}
-            for feed_id, rss_list in historical_data.items.items():
-                historical_urls[feed_id] = set()
-                for item in rss_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        if item.url:
-                            historical_urls[feed_id].add(item.url)
+            cursor.execute("""
+                SELECT EXISTS(SELECT 1 FROM rss_items),
+                       EXISTS(SELECT 1 FROM rss_items WHERE first_crawl_time < ? AND url != '')
+            """, (current_time,))
+            has_any_data, has_historical_data = cursor.fetchone()
+
+            if not has_any_data:
+                # 没有历史数据，所有都是新的
+                return current_data.items.copy()
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(urls) > 0 for urls in historical_urls.values())
             if not has_historical_data:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
+            candidates = [
+                [feed_id, item.url]
+                for feed_id, rss_list in current_data.items.items()
+                for item in rss_list
+                if item.url
+            ]
+            if not candidates:
+                return {}
+
+            # 查询当前批次中已在历史批次出现过的 URL（first_crawl_time < current_time）
+            cursor.execute("""
+                SELECT i.feed_id, i.url
+                FROM json_each(?) AS c
+                JOIN rss_items i
+                  ON i.url = json_extract(c.value, '$[1]')
+                 AND i.feed_id = json_extract(c.value, '$[0]')
+                WHERE i.first_crawl_time < ?
+            """, (json.dumps(candidates, ensure_ascii=False), current_time))
+            seen_urls = {(row[0], row[1]) for row in cursor.fetchall()}
+
             # 检测新增
             new_items: Dict[str, List[RSSItem]] = {}
             for feed_id, rss_list in current_data.items.items():
-                hist_set = historical_urls.get(feed_id, set())
                 for item in rss_list:
                     # 通过 URL 判断是否新增
-                    if item.url and item.url not in hist_set:
+                    if item.url and (feed_id, item.url) not in seen_urls:
                         if feed_id not in new_items:
                             new_items[feed_id] = []
                         new_items[feed_id].append(item)
@@ -1468,13 +2036,23 @@ class RemoteStorageBackend(StorageBackend):
             # Python 关闭时可能会出错，忽略即可
             pass
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def pull_recent_days(
+        self,
+        days: int,
+        local_data_dir: str = "output",
+        max_workers: int = PULL_MAX_WORKERS,
+    ) -> int:
         """
         从远程拉取最近 N 天的数据到本地
 
+        先各用一次 LIST 取得远程已有的日期，只下载其中最近 N 天、本地还没有的数据库；
+        下载在有界线程池中并发执行，每个文件边下载边写入临时文件，完成后再改名，
+        失败或中断时不会留下不完整的数据库。
+
         Args:
             days: 拉取天数
-            local_data_dir: 本地数据目录
+            local_data_dir: 本地数据目录（与本地存储后端相同的 {type}/{date}.db 结构）
+            max_workers: 最大并发下载数
 
         Returns:
             成功拉取的数据库文件数量
@@ -1483,70 +2061,120 @@ class RemoteStorageBackend(StorageBackend):
             return 0
 
         local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
-
-        pulled_count = 0
         now = self._get_configured_time()
+        wanted = {(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)}
 
         print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
+        tasks = []
+        for db_type in ("news", "rss"):
+            for date_str in sorted(wanted & set(self.list_remote_dates(db_type))):
+                local_db_path = local_dir / db_type / f"{date_str}.db"
+                # 如果本地已存在，跳过
+                if local_db_path.exists():
+                    print(f"[远程存储] 跳过（本地已存在）: {db_type}/{date_str}")
+                    continue
+                tasks.append((db_type, date_str, local_db_path))
 
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+        if not tasks:
+            print("[远程存储] 拉取完成，没有需要下载的数据库文件")
+            return 0
 
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
+        pulled_count = 0
+        workers = max(1, min(max_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._pull_database, db_type, date_str, local_db_path): (db_type, date_str)
+                for db_type, date_str, local_db_path in tasks
+            }
+            for future in as_completed(futures):
+                db_type, date_str = futures[future]
+                try:
+                    if future.result():
+                        pulled_count += 1
+                except Exception as e:
+                    print(f"[远程存储] 拉取失败 ({db_type}/{date_str}): {e}")
 
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
+        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
+        return pulled_count
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
+    def _pull_database(self, db_type: str, date: str, local_db_path: Path) -> bool:
+        """
+        下载单个数据库到本地（在线程池中执行）
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
-            try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+            date: 日期字符串（YYYY-MM-DD）
+            local_db_path: 本地目标路径
 
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
-        return pulled_count
+        Returns:
+            是否下载成功（远程不存在时返回 False）
+        """
+        remote_key = f"{db_type}/{date}.db"
+        partial_path = local_db_path.with_name(local_db_path.name + ".part")
+
+        try:
+            response = self._fetch_object(remote_key, partial_path)
+            if response is None:
+                print(f"[远程存储] 跳过（远程不存在）: {remote_key}")
+                return False
+            if self.sync_mode == "delta":
+                self._restore_changesets(partial_path, date, db_type, response.get("Metadata") or {})
+            partial_path.replace(local_db_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+        print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
+        return True
+
+    def _restore_changesets(
+        self, db_path: Path, date: str, db_type: str, metadata: Dict[str, str]
+    ) -> None:
+        """
+        在拉取到本地的快照上回放变更集（delta 模式）
 
-    def list_remote_dates(self) -> List[str]:
+        Args:
+            db_path: 已下载的快照路径
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+            metadata: 快照对象的用户元数据
+        """
+        conn = connect_sqlite(str(db_path), self.sqlite_profile)
+        try:
+            ensure_schema(conn, db_type)
+            base_seq = int(metadata.get("changeset-seq", 0) or 0)
+            self._replay_changesets(conn, date, db_type, base_seq)
+            checkpoint_sqlite(conn)
+        finally:
+            conn.close()
+        # 回放后已合并回主文件，WAL 附属文件不随数据库改名
+        for suffix in ("-wal", "-shm"):
+            Path(str(db_path) + suffix).unlink(missing_ok=True)
+
+    def list_remote_dates(self, db_type: str = "news") -> List[str]:
         """
         列出远程存储中所有可用的日期
 
+        使用 Delimiter 只列出 {type}/ 下一层的对象，delta 模式的变更集目录
+        折叠为一个公共前缀，不会随变更集数量增加分页请求。
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+
         Returns:
             日期字符串列表（YYYY-MM-DD 格式）
         """
         dates = []
+        pattern = re.compile(rf'{db_type}/(\d{{4}}-\d{{2}}-\d{{2}})\.db$')
 
         try:
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=f"{db_type}/", Delimiter="/")
 
             for page in pages:
-                if 'Contents' not in page:
-                    continue
-
-                for obj in page['Contents']:
-                    key = obj['Key']
+                for obj in page.get('Contents', []):
                     # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
+                    date_match = pattern.match(obj['Key'])
                     if date_match:
                         dates.append(date_match.group(1))
 
@@ -0,0 +1,197 @@
+# coding=utf-8
+"""
+远程数据库本地缓存
+
+RemoteStorageBackend 每次运行都要把当天（或查询日期）的数据库从远程存储取回临时目录。
+缓存按对象键保存最近一次已知与远程一致的数据库副本：
+- 打开数据库前只发一次 HEAD，ETag（无 ETag 时用大小 + 修改时间）一致则直接复制本地副本
+- 不一致或没有副本时才下载，下载后写入缓存
+- 本进程上传成功后用上传后的文件更新副本和验证信息，下次运行不必再下载自己刚上传的数据
+- delta 模式下额外记录副本已包含的变更集序号，只回放之后的变更集
+- 按最近使用时间淘汰，总大小不超过上限
+
+缓存目录中的副本只在确认与远程一致时写入，运行中的读写都在临时目录的工作副本上进行。
+"""
+
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class RemoteFileCache:
+    """远程数据库文件缓存（JSON 索引持久化，LRU 淘汰，线程安全）"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+            max_bytes: 缓存文件总大小上限（字节）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        self._load()
+
+    @staticmethod
+    def validator(response: Dict) -> Dict[str, str]:
+        """
+        从 HEAD / GET / PUT 响应中提取验证信息
+
+        Args:
+            response: boto3 响应
+
+        Returns:
+            {"etag", "size", "last_modified"}，缺失的字段为空字符串
+        """
+        last_modified = response.get("LastModified")
+        size = response.get("ContentLength")
+        return {
+            "etag": response.get("ETag") or "",
+            "size": "" if size is None else str(size),
+            "last_modified": last_modified.isoformat() if hasattr(last_modified, "isoformat") else str(last_modified or ""),
+        }
+
+    @staticmethod
+    def _matches(entry: Dict, validator: Dict[str, str]) -> bool:
+        """ETag 优先；任一方没有 ETag 时比较大小和修改时间"""
+        if entry.get("etag") and validator.get("etag"):
+            return entry["etag"] == validator["etag"]
+        return bool(
+            validator.get("size") and validator.get("last_modified")
+            and entry.get("size") == validator["size"]
+            and entry.get("last_modified") == validator["last_modified"]
+        )
+
+    def _file_path(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def _load(self) -> None:
+        """从磁盘加载索引，文件损坏时从空缓存开始"""
+        index_path = self.cache_dir / self.INDEX_FILE
+        if not index_path.exists():
+            return
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data.get("files", {})
+        except Exception as e:
+            print(f"[远程缓存] 索引加载失败，将重新建立: {e}")
+            self._entries = {}
+
+    def _save(self) -> None:
+        """持久化索引（调用方持有锁）"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            index_path = self.cache_dir / self.INDEX_FILE
+            tmp_path = index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"files": self._entries}, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(index_path)
+        except Exception as e:
+            print(f"[远程缓存] 索引保存失败: {e}")
+
+    def get(self, key: str, validator: Dict[str, str]) -> Optional[Dict]:
+        """
+        获取与远程一致的缓存条目
+
+        Args:
+            key: 远程对象键
+            validator: HEAD 得到的验证信息
+
+        Returns:
+            缓存条目（含 applied_seq），不一致或副本丢失时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._file_path(key).exists():
+                return None
+            if not self._matches(entry, validator):
+                return None
+            entry["used_at"] = time.time()
+            self._save()
+            return dict(entry)
+
+    def copy_to(self, key: str, dest: Path) -> None:
+        """把缓存副本复制到工作路径"""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._file_path(key), dest)
+
+    def put(self, key: str, source: Path, validator: Dict[str, str], applied_seq: int = 0) -> None:
+        """
+        写入（或替换）缓存副本
+
+        Args:
+            key: 远程对象键
+            source: 与远程一致的数据库文件（WAL 已合并）
+            validator: 远程对象的验证信息（没有 ETag 且缺少大小/修改时间时不缓存）
+            applied_seq: 副本已包含的最大变更集序号（delta 模式）
+        """
+        if not validator.get("etag") and not (validator.get("size") and validator.get("last_modified")):
+            self.invalidate(key)
+            return
+
+        path = self._file_path(key)
+        with self._lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + ".tmp")
+                shutil.copyfile(source, tmp_path)
+                tmp_path.replace(path)
+            except Exception as e:
+                print(f"[远程缓存] 写入失败 ({key}): {e}")
+                self._entries.pop(key, None)
+                self._save()
+                return
+
+            self._entries[key] = {
+                **validator,
+                "applied_seq": applied_seq,
+                "bytes": path.stat().st_size,
+                "used_at": time.time(),
+            }
+            self._evict(keep=key)
+            self._save()
+
+    def set_applied_seq(self, key: str, source: Path, applied_seq: int) -> None:
+        """
+        变更集上传成功后刷新副本（远程快照不变，只是副本包含的变更集更多）
+
+        Args:
+            key: 快照的远程对象键
+            source: 当前的工作副本（WAL 已合并）
+            applied_seq: 副本已包含的最大变更集序号
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            validator = {name: entry.get(name, "") for name in ("etag", "size", "last_modified")}
+        self.put(key, source, validator, applied_seq)
+
+    def invalidate(self, key: str) -> None:
+        """删除缓存条目和副本"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._file_path(key).unlink(missing_ok=True)
+            self._save()
+
+    def _evict(self, keep: str) -> None:
+        """按最近使用时间淘汰，直到总大小不超过上限（调用方持有锁）"""
+        total = sum(entry.get("bytes", 0) for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k].get("used_at", 0)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries.pop(key).get("bytes", 0)
+            self._file_path(key).unlink(missing_ok=True)
+            print(f"[远程缓存] 淘汰: {key}")
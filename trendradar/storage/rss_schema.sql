@@ -85,6 +85,7 @@ CREATE TABLE IF NOT EXISTS rss_crawl_status (
 
 -- ============================================
 -- 索引定义
+-- 后续新增/调整的索引见 migrations.py（查询计划由 test_query_plans.py 校验）
 -- ============================================
 
 -- RSS 源索引
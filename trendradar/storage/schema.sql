@@ -127,6 +127,7 @@ CREATE TABLE IF NOT EXISTS push_records (
 
 -- ============================================
 -- 索引定义
+-- 后续新增/调整的索引见 migrations.py（查询计划由 test_query_plans.py 校验）
 -- ============================================
 
 -- 平台索引
@@ -0,0 +1,138 @@
+# coding=utf-8
+"""
+SQLite 连接配置
+
+统一管理存储后端与 API 服务打开 SQLite 数据库时使用的 PRAGMA：
+- journal_mode=WAL：读者不阻塞写者，写者不阻塞读者（爬虫写入时 API 仍可读取）
+- synchronous：WAL 模式下 NORMAL 已能保证一致性，比 FULL 少一次 fsync
+- mmap_size / cache_size：减少读取时的系统调用和页面换入
+- temp_store：排序、临时索引放在内存中
+- busy_timeout：遇到写锁时等待而不是立即报 database is locked
+
+配置来自 config.yaml 的 storage.sqlite 段，键名与 DEFAULT_SQLITE_PROFILE 一致（大写）。
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+DEFAULT_SQLITE_PROFILE: Dict[str, Any] = {
+    "JOURNAL_MODE": "WAL",
+    "SYNCHRONOUS": "NORMAL",
+    "MMAP_SIZE": 268435456,     # 256 MB
+    "CACHE_SIZE": -16000,       # 负数表示 KiB，约 16 MB
+    "TEMP_STORE": "MEMORY",
+    "BUSY_TIMEOUT": 5000,       # 毫秒
+}
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORE_MODES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def resolve_sqlite_profile(profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    合并默认配置与用户配置，并校验取值
+
+    非法取值会回退到默认值并打印警告，避免拼接出错误的 PRAGMA 语句。
+
+    Args:
+        profile: 用户配置（可为部分键）
+
+    Returns:
+        完整的连接配置
+    """
+    resolved = dict(DEFAULT_SQLITE_PROFILE)
+    if not profile:
+        return resolved
+
+    for key, value in profile.items():
+        key = key.upper()
+        if key not in DEFAULT_SQLITE_PROFILE or value is None:
+            continue
+
+        if key in ("JOURNAL_MODE", "SYNCHRONOUS", "TEMP_STORE"):
+            allowed = {
+                "JOURNAL_MODE": _JOURNAL_MODES,
+                "SYNCHRONOUS": _SYNCHRONOUS_MODES,
+                "TEMP_STORE": _TEMP_STORE_MODES,
+            }[key]
+            value = str(value).upper()
+            if value not in allowed:
+                print(f"[警告] storage.sqlite.{key.lower()} 取值无效 ({value})，使用默认值 {resolved[key]}")
+                continue
+        else:
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                print(f"[警告] storage.sqlite.{key.lower()} 格式错误 ({value})，使用默认值 {resolved[key]}")
+                continue
+
+        resolved[key] = value
+
+    return resolved
+
+
+def apply_sqlite_profile(conn: sqlite3.Connection, profile: Optional[Dict[str, Any]] = None) -> None:
+    """
+    在已打开的连接上应用 PRAGMA
+
+    journal_mode 是持久化在数据库文件中的，其余 PRAGMA 只对当前连接生效，
+    因此每个连接打开后都需要调用一次。
+
+    Args:
+        conn: 数据库连接
+        profile: 连接配置，为空时使用默认配置
+    """
+    profile = resolve_sqlite_profile(profile)
+
+    # busy_timeout 放在最前面，切换 journal_mode 时也可能需要等锁
+    conn.execute(f"PRAGMA busy_timeout = {profile['BUSY_TIMEOUT']}")
+    try:
+        conn.execute(f"PRAGMA journal_mode = {profile['JOURNAL_MODE']}")
+    except sqlite3.OperationalError as e:
+        # 只读介质或其他连接持有锁时无法切换，保持原模式即可
+        print(f"[SQLite] 设置 journal_mode 失败，保持原模式: {e}")
+    conn.execute(f"PRAGMA synchronous = {profile['SYNCHRONOUS']}")
+    conn.execute(f"PRAGMA mmap_size = {profile['MMAP_SIZE']}")
+    conn.execute(f"PRAGMA cache_size = {profile['CACHE_SIZE']}")
+    conn.execute(f"PRAGMA temp_store = {profile['TEMP_STORE']}")
+
+
+def connect_sqlite(
+    db_path: Union[str, Path],
+    profile: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> sqlite3.Connection:
+    """
+    打开 SQLite 连接并应用连接配置
+
+    Args:
+        db_path: 数据库文件路径
+        profile: 连接配置，为空时使用默认配置
+        **kwargs: 透传给 sqlite3.connect 的参数
+
+    Returns:
+        数据库连接（row_factory 为 sqlite3.Row）
+    """
+    conn = sqlite3.connect(str(db_path), **kwargs)
+    conn.row_factory = sqlite3.Row
+    apply_sqlite_profile(conn, profile)
+    return conn
+
+
+def checkpoint_sqlite(conn: sqlite3.Connection) -> None:
+    """
+    将 WAL 文件中的内容合并回主数据库文件
+
+    需要单独复制/上传 .db 文件时（例如远程存储上传）必须先调用，
+    否则尚未合并的写入只存在于 -wal 文件中。
+
+    Args:
+        conn: 数据库连接
+    """
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as e:
+        print(f"[SQLite] WAL 检查点失败: {e}")